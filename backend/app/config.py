@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""          # anon key (프론트엔드용)
     SUPABASE_SERVICE_KEY: str = ""  # service_role key (백엔드 전용, RLS 우회)
+    DB_MAX_CONCURRENCY: int = 16    # supabase 동기 호출 offload 스레드 수 (동시 DB 요청 상한)
 
     # 쿠팡 파트너스
     COUPANG_ACCESS_KEY: str = ""
@@ -26,6 +27,37 @@ class Settings(BaseSettings):
     # Admin
     ADMIN_SECRET: str = "changeme"
 
+    # 가격 스크래퍼 브라우저 풀 (price_scrapers/browser_pool)
+    SCRAPER_BROWSERS: int = 2              # 상시 Chromium 수
+    SCRAPER_CONTEXTS_PER_BROWSER: int = 2  # 브라우저당 동시 컨텍스트(=동시 page) 수
+    SCRAPER_CONTEXT_MAX_USES: int = 20     # 컨텍스트 재생성 주기 (사용 횟수)
+    SCRAPER_BATCH_CONCURRENCY: int = 16    # get_actual_prices 전체 동시 작업 상한 (HTTP tier 포함)
+    SCRAPER_BATCH_DEADLINE: float = 60.0   # get_actual_prices 기본 전체 마감 (초)
+
+    # 스케줄러 배포 모드: all | worker | off (app/scheduler.py, app/worker.py)
+    # worker: 수집/검증 잡은 별도 워커 프로세스(python -m app.worker), API 는 로컬 캐시 잡만
+    # off   : 수집/검증 잡 없음, API 는 로컬 캐시 잡만 (이벤트 카운터 flush 유지)
+    SCHEDULER_MODE: str = "all"
+    WORKER_LEADER_TTL: int = 60          # 워커 leader 임대 만료 (초) — 갱신은 1/3 주기
+
+    # 잡 분산 락 (services/job_lock): supabase (migrations/011) | file (같은 호스트) | none
+    JOB_LOCK_BACKEND: str = "supabase"
+    JOB_LOCK_TTL: int = 120              # 잡 락 임대 만료 (초) — 실행 중 heartbeat 로 연장
+    JOB_LOCK_DIR: str = "/tmp/jungga-pagoe-locks"
+
+    # 커뮤니티 수집 잡 적응형 주기 (services/adaptive_schedule)
+    ADAPTIVE_SCHEDULING: bool = True
+
+    # 랭킹 (services/ranker)
+    RANK_HALF_LIFE_HOURS: float = 24.0   # 점수 시간 감쇠 반감기
+    WEEKLY_HALF_LIFE_HOURS: float = 168.0  # 주간 TOP 전용 반감기 (7일 창 안에서 최신 딜 쏠림 방지)
+    HOT_SCORE_THRESHOLD: float = 2.0     # 이 점수 이상이면 핫딜 (/hot)
+    HOT_DISCOUNT_THRESHOLD: float = 40.0 # 신규 딜 is_hot 초기값 기준 할인율 (%)
+
+    # 응답
+    RESPONSE_VALIDATION: bool = False   # 정규화된 딜 응답도 response_model로 재검증 (개발용)
+    COMPRESSION_MIN_SIZE: int = 1024    # 이 크기(bytes) 이상 응답만 br/gzip 압축
+
     class Config:
         env_file = ".env"
 
@@ -5,31 +5,155 @@ SQLAlchemy 직접 연결 대신 supabase-py 사용 (포트 5432 우회)
 from supabase import create_client, Client
 from app.config import settings
 import math
+import asyncio
+import contextvars
+import logging
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 _client = None
+_client_lock = threading.Lock()
+_db_executor: Optional[ThreadPoolExecutor] = None
 
 
 def get_supabase() -> Client:
     global _client
     if _client is None:
-        # service_role key 우선 사용 (RLS 우회), 없으면 anon key fallback
-        key = settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY
-        _client = create_client(settings.SUPABASE_URL, key)
+        with _client_lock:
+            if _client is None:
+                # service_role key 우선 사용 (RLS 우회), 없으면 anon key fallback
+                key = settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY
+                _client = create_client(settings.SUPABASE_URL, key)
     return _client
 
 
+# ───────────────────────────────────────────
+# 비동기 접근 — supabase-py는 동기 HTTP라 이벤트 루프를 막음
+# 전용 스레드풀(크기 제한)로 offload → 느린 쿼리 1개가 전체 요청을 세우지 않음
+# ───────────────────────────────────────────
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        with _client_lock:
+            if _db_executor is None:
+                _db_executor = ThreadPoolExecutor(
+                    max_workers=settings.DB_MAX_CONCURRENCY,
+                    thread_name_prefix="supabase",
+                )
+    return _db_executor
+
+
+async def run_db(fn: Callable[..., T], *args, **kwargs) -> T:
+    """동기 DB 함수를 스레드풀에서 실행 — async 라우터/잡에서 사용
+
+    예) deals = await db.run_db(db.get_deals, page=1, size=20)
+
+    호출 시점의 contextvars 를 복사해 워커 스레드에서 실행 (잡 계측 job_metrics.add 등이 스레드 안에서도 동작)
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_get_executor(), partial(ctx.run, fn, *args, **kwargs))
+
+
+async def aexecute(query):
+    """query builder의 .execute()를 비동기로 실행
+
+    예) res = await db.aexecute(sb.table("deals").select("id").eq("status", "active"))
+    """
+    return await run_db(query.execute)
+
+
+def shutdown_executor() -> None:
+    """앱 종료 시 스레드풀 정리"""
+    global _db_executor
+    if _db_executor is not None:
+        _db_executor.shutdown(wait=False)
+        _db_executor = None
+
+
+# ───────────────────────────────────────────
+# 딜 데이터 버전 — 딜 쓰기마다 증가, HTTP ETag·캐시 무효화 기준
+# (조회수/클릭수 카운터 증가는 버전을 올리지 않음)
+# 버전 번호는 프로세스 로컬 (캐시 무효화용). 프로세스 밖으로 나가는 ETag 는 get_data_tag() 사용
+# ───────────────────────────────────────────
+
+_data_version = 0
+_version_lock = threading.Lock()
+_BOOT_NONCE = secrets.token_hex(6)   # 재시작마다 달라짐 — 로컬 카운터 0 재시작으로 인한 ETag 충돌 방지
+_shared_tag: Optional[str] = None    # 모든 인스턴스 공통 데이터 토큰 (services/data_version_sync)
+_shared_for = -1                     # _shared_tag 를 채택한 시점의 로컬 버전
+
+
+def get_data_version() -> int:
+    return _data_version
+
+
+def bump_data_version() -> int:
+    global _data_version
+    with _version_lock:
+        _data_version += 1
+        return _data_version
+
+
+def get_data_tag() -> str:
+    """HTTP ETag 기준 데이터 태그
+
+    공유 토큰 채택 이후 로컬 쓰기가 없으면 공유 토큰 (모든 레플리카·재시작 후에도 동일),
+    아직 공유 전이거나 미공유 로컬 쓰기가 있으면 부팅 nonce + 로컬 버전 (이 프로세스에서만 유효)
+    """
+    with _version_lock:
+        if _shared_tag is not None and _shared_for == _data_version:
+            return _shared_tag
+        return f"{_BOOT_NONCE}:{_data_version}"
+
+
+def adopt_data_tag(tag: str, version: int) -> None:
+    """공유 토큰을 로컬 버전 version 의 태그로 채택 (이후 로컬 쓰기가 생기면 자동으로 nonce 태그로 전환)"""
+    global _shared_tag, _shared_for
+    with _version_lock:
+        _shared_tag, _shared_for = tag, version
+
+
 # ───────────────────────────────────────────
 # Deal CRUD
 # ───────────────────────────────────────────
 
-def _to_deal_dict(row: dict) -> dict:
-    """Supabase row → API response dict 정규화"""
+# 컬럼 프로젝션 프로필 — 화면/용도별로 필요한 컬럼만 select (select("*") 금지)
+# card   : 목록/카드 (description·admin_note·누적 카운터 제외)
+# detail : 딜 상세 모달/페이지
+# verify : 가격 검증 잡
+# admin  : 관리자 화면 (전체 컬럼)
+_CARD_COLUMNS = (
+    "id,title,original_price,sale_price,discount_rate,image_url,product_url,affiliate_url,"
+    "source,category,status,upvotes,views,today_views,total_clicks,is_hot,submitter_name,"
+    "expires_at,verified_price,last_verified_at,created_at,updated_at"
+)
+DEAL_COLUMNS: Dict[str, str] = {
+    "card": _CARD_COLUMNS,
+    "detail": _CARD_COLUMNS + ",description,total_views,today_clicks",
+    "verify": "id,title,source,status,product_url,original_price,sale_price,verified_price,verify_fail_count",
+    "admin": "*",
+}
+
+
+def deal_columns(profile: str) -> str:
+    return DEAL_COLUMNS[profile]
+
+
+def _to_deal_card(row: dict) -> dict:
+    """Supabase row → 카드 목록용 dict (card 프로필)"""
     return {
         "id": row.get("id"),
         "title": row.get("title", ""),
-        "description": row.get("description"),
         "original_price": float(row.get("original_price", 0)),
         "sale_price": float(row.get("sale_price", 0)),
         "discount_rate": float(row.get("discount_rate", 0)),
@@ -42,8 +166,6 @@ def _to_deal_dict(row: dict) -> dict:
         "upvotes": int(row.get("upvotes", 0)),
         "views": int(row.get("views", 0)),
         "today_views": int(row.get("today_views", 0) or 0),
-        "total_views": int(row.get("total_views", 0) or 0),
-        "today_clicks": int(row.get("today_clicks", 0) or 0),
         "total_clicks": int(row.get("total_clicks", 0) or 0),
         "is_hot": bool(row.get("is_hot", False)),
         "submitter_name": row.get("submitter_name"),
@@ -55,6 +177,44 @@ def _to_deal_dict(row: dict) -> dict:
     }
 
 
+def _to_deal_dict(row: dict) -> dict:
+    """Supabase row → API response dict 정규화 (detail 프로필)"""
+    deal = _to_deal_card(row)
+    deal["description"] = row.get("description")
+    deal["total_views"] = int(row.get("total_views", 0) or 0)
+    deal["today_clicks"] = int(row.get("today_clicks", 0) or 0)
+    return deal
+
+
+def _to_verify_dict(row: dict) -> dict:
+    """Supabase row → 가격 검증 잡용 dict (verify 프로필)"""
+    return {
+        "id": row.get("id"),
+        "title": row.get("title", ""),
+        "source": row.get("source", "community"),
+        "status": row.get("status", "active"),
+        "product_url": row.get("product_url", ""),
+        "original_price": float(row.get("original_price", 0) or 0),
+        "sale_price": float(row.get("sale_price", 0) or 0),
+        "verified_price": row.get("verified_price"),
+        "verify_fail_count": int(row.get("verify_fail_count", 0) or 0),
+    }
+
+
+_SERIALIZERS = {
+    "card": _to_deal_card,
+    "detail": _to_deal_dict,
+    "verify": _to_verify_dict,
+    "admin": dict,
+}
+
+
+def serialize_deals(rows: list, profile: str = "card") -> list[dict]:
+    """프로필에 맞는 serializer로 row 목록 정규화"""
+    to_dict = _SERIALIZERS[profile]
+    return [to_dict(r) for r in (rows or [])]
+
+
 def get_deals(
     page: int = 1,
     size: int = 20,
@@ -70,7 +230,7 @@ def get_deals(
     mall: str = None,  # C-026: 쇼핑몰 URL 패턴 필터
 ) -> dict:
     sb = get_supabase()
-    query = sb.table("deals").select("*", count="exact")
+    query = sb.table("deals").select(DEAL_COLUMNS["card"], count="exact")
 
     # active만 노출 — price_changed는 가격 불일치 상태라 노출 금지
     query = query.eq("status", "active")
@@ -95,8 +255,15 @@ def get_deals(
         query = query.ilike("product_url", f"%{pattern}%")
     if hot_only:
         query = query.eq("is_hot", True)
+    search_rank: Optional[dict] = None
     if search:
-        query = query.or_(f"title.ilike.%{search}%,category.ilike.%{search}%,submitter_name.ilike.%{search}%")
+        search_rank = _search_rank(search)
+        if search_rank is None:
+            query = query.or_(f"title.ilike.%{search}%,category.ilike.%{search}%,submitter_name.ilike.%{search}%")
+        elif not search_rank:
+            return {"items": [], "total": 0, "page": page, "size": size, "pages": 1}
+        else:
+            query = query.in_("id", list(search_rank))
     if brand:
         # submitter_name 또는 title의 [Brand] 태그로 필터
         query = query.or_(f"submitter_name.ilike.%{brand}%,title.ilike.%[{brand}]%")
@@ -113,17 +280,25 @@ def get_deals(
         "price_asc":  ("sale_price", True),
         "price_desc": ("sale_price", False),
     }
-    col, asc = sort_map.get(sort, ("created_at", False))
-    query = query.order(col, desc=not asc)
-
-    # 페이지네이션
     if offset is None:
         offset = (page - 1) * size
-    query = query.range(offset, offset + size - 1)
 
-    res = query.execute()
-    total = res.count or 0
-    items = [_to_deal_dict(r) for r in (res.data or [])]
+    if sort == "relevance" and search_rank:
+        # 관련도순: 검색 후보(최대 search_index.MAX_RESULTS개)를 필터 적용 후 인덱스 순위로 정렬
+        res = query.execute()
+        rows = sorted(res.data or [], key=lambda r: search_rank[r["id"]])
+        total = res.count or len(rows)
+        items = serialize_deals(rows[offset:offset + size], "card")
+    else:
+        col, asc = sort_map.get(sort, ("created_at", False))
+        query = query.order(col, desc=not asc)
+
+        # 페이지네이션
+        query = query.range(offset, offset + size - 1)
+
+        res = query.execute()
+        total = res.count or 0
+        items = serialize_deals(res.data, "card")
 
     return {
         "items": items,
@@ -134,26 +309,135 @@ def get_deals(
     }
 
 
+def _search_rank(search: str) -> Optional[dict]:
+    """검색 인덱스 결과 {deal_id: 순위}. 인덱스 사용 불가 시 None (ilike fallback)"""
+    try:
+        from app.services import search_index
+        return {deal_id: rank for rank, deal_id in enumerate(search_index.search_ids(search))}
+    except Exception as e:
+        logger.warning(f"[검색] 인덱스 사용 불가 — ilike fallback: {e}")
+        return None
+
+
+def fetch_active_deals(
+    profile: str = "card",
+    order: str = "created_at",
+    limit: Optional[int] = None,
+    batch_size: int = 1000,
+) -> list[dict]:
+    """active 딜 전체(또는 limit개)를 batch_size 단위 range 페이징으로 조회
+
+    PostgREST 기본 max-rows(1000) 제한을 넘는 전체 카탈로그용 (피드, 인덱스 빌드)
+    """
+    return fetch_deals(["active"], profile, order, limit, batch_size)
+
+
+def fetch_deals(
+    statuses: list[str],
+    profile: str = "card",
+    order: str = "created_at",
+    limit: Optional[int] = None,
+    batch_size: int = 1000,
+    since: Optional[str] = None,
+) -> list[dict]:
+    """지정 status 딜 전체(또는 limit개) range 페이징 조회 — since 지정 시 created_at >= since 만"""
+    sb = get_supabase()
+    rows: list = []
+    offset = 0
+    while limit is None or len(rows) < limit:
+        size = batch_size if limit is None else min(batch_size, limit - len(rows))
+        query = sb.table("deals").select(DEAL_COLUMNS[profile]).in_("status", statuses)
+        if since:
+            query = query.gte("created_at", since)
+        res = (
+            query
+            .order(order, desc=True)
+            .order("id", desc=True)
+            .range(offset, offset + size - 1)
+            .execute()
+        )
+        batch = res.data or []
+        rows.extend(batch)
+        if len(batch) < size:
+            break
+        offset += size
+    return serialize_deals(rows, profile)
+
+
+ENGAGEMENT_COLUMNS = "id,views,total_clicks,upvotes,is_hot"
+
+
+def fetch_engagement_counters(statuses: list[str], batch_size: int = 1000) -> dict[int, dict]:
+    """딜 참여도 카운터만 조회 (id → {views, total_clicks, upvotes, is_hot}) — 조회/클릭은 데이터 버전을 올리지 않으므로 랭킹 갱신용"""
+    sb = get_supabase()
+    counters: dict = {}
+    offset = 0
+    while True:
+        res = (
+            sb.table("deals")
+            .select(ENGAGEMENT_COLUMNS)
+            .in_("status", statuses)
+            .order("id", desc=True)
+            .range(offset, offset + batch_size - 1)
+            .execute()
+        )
+        batch = res.data or []
+        for row in batch:
+            counters[row["id"]] = {
+                "views": int(row.get("views") or 0),
+                "total_clicks": int(row.get("total_clicks") or 0),
+                "upvotes": int(row.get("upvotes") or 0),
+                "is_hot": bool(row.get("is_hot")),
+            }
+        if len(batch) < batch_size:
+            break
+        offset += batch_size
+    return counters
+
+
+def fetch_deals_by_ids(
+    ids: list[int],
+    statuses: Optional[list[str]] = None,
+    profile: str = "card",
+    batch_size: int = 200,
+) -> list[dict]:
+    """id 목록 딜 조회 (URL 길이 제한 때문에 batch_size 개씩 나눠 in_ 조회)"""
+    sb = get_supabase()
+    rows: list = []
+    for i in range(0, len(ids), batch_size):
+        query = sb.table("deals").select(DEAL_COLUMNS[profile]).in_("id", ids[i:i + batch_size])
+        if statuses:
+            query = query.in_("status", statuses)
+        rows.extend(query.execute().data or [])
+    return serialize_deals(rows, profile)
+
+
 def get_hot_deals(limit: int = 10) -> list[dict]:
+    """핫딜 TOP — 랭커 점수(HOT_SCORE_THRESHOLD 이상) 순, 랭커 실패 시 is_hot + 업보트순"""
+    try:
+        from app.services import ranker
+        return ranker.top_deals("hot", limit)
+    except Exception as e:
+        logger.warning(f"[랭킹] 핫딜 랭킹 사용 불가 — is_hot 쿼리 fallback: {e}")
     sb = get_supabase()
     res = (
         sb.table("deals")
-        .select("*")
+        .select(DEAL_COLUMNS["card"])
         .in_("status", ["active", "price_changed"])
         .eq("is_hot", True)
         .order("upvotes", desc=True)
         .limit(limit)
         .execute()
     )
-    return [_to_deal_dict(r) for r in (res.data or [])]
+    return serialize_deals(res.data, "card")
 
 
-def get_deal_by_id(deal_id: int) -> dict:
+def get_deal_by_id(deal_id: int, profile: str = "detail") -> dict:
     sb = get_supabase()
-    res = sb.table("deals").select("*").eq("id", deal_id).limit(1).execute()
+    res = sb.table("deals").select(DEAL_COLUMNS[profile]).eq("id", deal_id).limit(1).execute()
     if not res.data:
         return None
-    return _to_deal_dict(res.data[0])
+    return _SERIALIZERS[profile](res.data[0])
 
 
 def increment_views(deal_id: int) -> None:
@@ -196,6 +480,7 @@ def upvote_deal(deal_id: int) -> dict:
     cur_hot = bool((sb.table("deals").select("is_hot").eq("id", deal_id).limit(1).execute().data or [{}])[0].get("is_hot"))
     is_hot = cur_hot or new_upvotes >= 5
     sb.table("deals").update({"upvotes": new_upvotes, "is_hot": is_hot}).eq("id", deal_id).execute()
+    bump_data_version()
     return {"upvotes": new_upvotes, "is_hot": is_hot}
 
 
@@ -235,10 +520,16 @@ def create_deal(data: dict) -> dict:
     # ═══════════════════════════════════════════════
 
     data.setdefault("status", "active")
-    # is_hot: 외부에서 명시하지 않으면 할인율 기준으로 결정 (setdefault 아닌 강제 적용)
+    # is_hot: 외부에서 명시하지 않으면 할인율 기준으로 결정 (HOT_DISCOUNT_THRESHOLD, 이후 랭커 점수에 가산)
     if "is_hot" not in data:
-        data["is_hot"] = data.get("discount_rate", 0) >= 40
+        data["is_hot"] = data.get("discount_rate", 0) >= settings.HOT_DISCOUNT_THRESHOLD
     res = sb.table("deals").insert(data).execute()
+    bump_data_version()
+    try:
+        from app.services import brand_index
+        brand_index.observe(_to_deal_card(res.data[0]))
+    except Exception:
+        pass  # 브랜드 인덱스는 주기 재빌드로 보정
     return _to_deal_dict(res.data[0])
 
 
@@ -276,6 +567,7 @@ def deal_duplicate_exists(title: str, sale_price: float, tolerance: float = 0.03
         # 새 딜이 5% 이상 싸면 기존 것 만료하고 새 딜 허용
         if sale_price < existing_price * (1 - tolerance):
             sb.table("deals").update({"status": "expired"}).eq("id", existing["id"]).execute()
+            bump_data_version()
             return False  # 새 딜(더 싼 것) 저장 허용
         return True  # 기존 딜이 더 싸거나 비슷 → 중복, 저장 거부
     return False
@@ -299,20 +591,30 @@ def get_community_deals_for_expiry_check(hours_since_created: int = 1) -> list[d
     return res.data or []
 
 
-def expire_deal(deal_id: int) -> dict:
+def expire_deal(deal_id: int, admin_note: Optional[str] = None) -> dict:
+    patch = {"status": "expired"}
+    if admin_note is not None:
+        patch["admin_note"] = admin_note
     sb = get_supabase()
     res = (
         sb.table("deals")
-        .update({"status": "expired"})
+        .update(patch)
         .eq("id", deal_id)
         .execute()
     )
+    bump_data_version()
     return res.data[0] if res.data else None
 
 
-def update_deal_verify(deal_id: int, patch: dict) -> None:
+def update_deal_fields(deal_id: int, patch: dict) -> None:
+    """딜 컬럼 부분 업데이트 + 데이터 버전 증가 (ETag/캐시 무효화) — 라우터/잡의 직접 update 대신 사용"""
     sb = get_supabase()
     sb.table("deals").update(patch).eq("id", deal_id).execute()
+    bump_data_version()
+
+
+def update_deal_verify(deal_id: int, patch: dict) -> None:
+    update_deal_fields(deal_id, patch)
 
 
 def get_deals_for_verify(cutoff_iso: str) -> list[dict]:
@@ -320,12 +622,12 @@ def get_deals_for_verify(cutoff_iso: str) -> list[dict]:
     sb = get_supabase()
     res = (
         sb.table("deals")
-        .select("*")
+        .select(DEAL_COLUMNS["verify"])
         .in_("status", ["active", "price_changed"])
         .or_(f"last_verified_at.is.null,last_verified_at.lt.{cutoff_iso}")
         .execute()
     )
-    return [_to_deal_dict(r) for r in (res.data or [])]
+    return serialize_deals(res.data, "verify")
 
 
 def get_stats() -> dict:
@@ -353,15 +655,10 @@ def get_stats() -> dict:
     community_count = sb.table("deals").select("id", count="exact").eq("source", "community").eq("status", "active").execute().count or 0
     watchlist_count = sb.table("deals").select("id", count="exact").eq("source", "watchlist").eq("status", "active").execute().count or 0
 
-    # 오늘 방문자 수 (page_view 이벤트)
-    today_utc_end = (today_kst_start + timedelta(days=1)).astimezone(timezone.utc).isoformat()
+    # 오늘 방문자 수 (고유 IP, HyperLogLog 추정)
     try:
-        pv_res = sb.table("event_logs").select("id", count="exact") \
-            .eq("event_type", "page_view") \
-            .gte("created_at", today_utc_start) \
-            .lt("created_at", today_utc_end) \
-            .execute()
-        today_visitors = pv_res.count or 0
+        from app.services import hyperloglog
+        today_visitors = hyperloglog.unique_ips.merged([today_kst_start.date()]).count()
     except Exception:
         today_visitors = 0
 
@@ -399,8 +696,8 @@ def log_event(
     referrer: Optional[str] = None,
     user_agent: Optional[str] = None,
     ip_address: Optional[str] = None,
-) -> None:
-    """event_logs 테이블에 이벤트 INSERT"""
+) -> bool:
+    """event_logs 테이블에 이벤트 INSERT (성공 여부 반환)"""
     sb = get_supabase()
     try:
         sb.table("event_logs").insert({
@@ -411,16 +708,104 @@ def log_event(
             "user_agent": user_agent,
             "ip_address": ip_address,
         }).execute()
+        return True
     except Exception:
-        pass  # 이벤트 로깅 실패는 무시
+        return False  # 이벤트 로깅 실패는 무시
+
+
+def upsert_event_sketch(day: str, kind: str, instance: str, payload: dict) -> None:
+    """event_sketches: 인스턴스별 스케치 상태 저장 (day, kind, instance 단위 덮어쓰기)"""
+    sb = get_supabase()
+    sb.table("event_sketches").upsert({
+        "day": day,
+        "kind": kind,
+        "instance": instance,
+        "payload": payload,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }, on_conflict="day,kind,instance").execute()
+
+
+def get_recent_search_keywords(since: str, limit: int = 5000) -> list[str]:
+    """event_logs: since 이후 search 이벤트 키워드(referrer) 원본 — 스케치가 비었을 때 인기 검색어 시드용"""
+    sb = get_supabase()
+    res = (
+        sb.table("event_logs")
+        .select("referrer")
+        .eq("event_type", "search")
+        .gte("created_at", since)
+        .not_.is_("referrer", "null")
+        .order("created_at", desc=True)
+        .limit(limit)
+        .execute()
+    )
+    return [r["referrer"] for r in res.data or [] if r.get("referrer")]
+
+
+def get_event_sketches(kind: str, days: list[str]) -> list[dict]:
+    """event_sketches: 지정 날짜들의 모든 인스턴스 스케치 행"""
+    sb = get_supabase()
+    res = (
+        sb.table("event_sketches")
+        .select("day,instance,payload")
+        .eq("kind", kind)
+        .in_("day", days)
+        .execute()
+    )
+    return res.data or []
+
+
+def insert_job_runs(rows: list[dict]) -> None:
+    """job_runs: 스케줄러 잡 실행 이력 적재"""
+    if rows:
+        get_supabase().table("job_runs").insert(rows).execute()
+
+
+def get_job_runs(
+    job_id: Optional[str] = None,
+    hours: int = 24,
+    limit: Optional[int] = 1000,
+    batch_size: int = 1000,
+) -> list[dict]:
+    """job_runs: 최근 hours 시간 실행 이력 (최신순) — limit=None 이면 전체, range 페이징 (PostgREST 1000행 상한)"""
+    sb = get_supabase()
+    since = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
+    rows: list = []
+    offset = 0
+    while limit is None or len(rows) < limit:
+        size = batch_size if limit is None else min(batch_size, limit - len(rows))
+        q = (
+            sb.table("job_runs")
+            .select("job_id,instance,started_at,duration_ms,status,error,counters,overran")
+            .gte("started_at", since)
+        )
+        if job_id:
+            q = q.eq("job_id", job_id)
+        batch = (
+            q.order("started_at", desc=True)
+            .order("id", desc=True)
+            .range(offset, offset + size - 1)
+            .execute().data or []
+        )
+        rows.extend(batch)
+        if len(batch) < size:
+            break
+        offset += size
+    return rows
+
+
+def prune_job_runs(days: int = 14) -> None:
+    """job_runs: days 일 지난 이력 삭제"""
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    get_supabase().table("job_runs").delete().lt("started_at", cutoff).execute()
 
 
 def get_admin_metrics(date_str: Optional[str] = None) -> dict:
     """당일 집계 + 최근 7일 추이 + Top10 딜
-    최적화: count=exact 쿼리를 ThreadPoolExecutor로 병렬 실행 (8s → ~1s)
+    이벤트 카운트는 event_rollup_hourly 롤업, Top10은 클릭 스케치에서 읽음 (이벤트량과 무관한 고정 비용)
+    롤업 테이블 미생성 시 count=exact 병렬 쿼리로 fallback
     """
-    from collections import Counter
     from concurrent.futures import ThreadPoolExecutor, as_completed
+    from app.services import heavy_hitters, hyperloglog
 
     sb = get_supabase()
     KST = timezone(timedelta(hours=9))
@@ -461,33 +846,43 @@ def get_admin_metrics(date_str: Optional[str] = None) -> dict:
         except Exception:
             return 0
 
-    # ── 병렬 실행: 최대 20 스레드로 count 쿼리 동시 처리 ──
+    # ── 롤업에서 7일 카운트 (실패 시 기존 count 쿼리 fallback) ──
+    from app.services import event_rollup
+    day_buckets: Optional[dict] = None
+    try:
+        day_buckets = event_rollup.get_daily_counts(
+            [datetime.strptime(d_str, "%Y-%m-%d").date() for d_str, _, _ in day_ranges],
+            EVENT_TYPES,
+        )
+    except Exception as e:
+        logger.warning(f"[메트릭] 롤업 조회 실패 — event_logs count fallback: {e}")
+
     tasks: dict = {}
     with ThreadPoolExecutor(max_workers=20) as pool:
-        for d_str, d_start, d_end in day_ranges:
-            for etype in EVENT_TYPES:
-                f = pool.submit(_count, etype, d_start, d_end)
-                tasks[f] = (d_str, etype)
+        if day_buckets is None:
+            for d_str, d_start, d_end in day_ranges:
+                for etype in EVENT_TYPES:
+                    f = pool.submit(_count, etype, d_start, d_end)
+                    tasks[f] = (d_str, etype)
         # 딜 수도 병렬
         f_active = pool.submit(lambda: sb.table("deals").select("id", count="exact").eq("status", "active").execute().count or 0)
         f_new = pool.submit(lambda: sb.table("deals").select("id", count="exact").eq("status", "active").gte("created_at", day_start_utc).lt("created_at", day_end_utc).execute().count or 0)
-        # Top10 click IDs (오늘 클릭 목록)
-        f_clicks = pool.submit(
-            lambda: sb.table("event_logs").select("deal_id")
-                .eq("event_type", "outbound_click")
-                .gte("created_at", day_start_utc).lt("created_at", day_end_utc)
-                .limit(5000).execute().data or []
-        )
+        # Top10 클릭 딜 (Space-Saving 스케치 — 원본 로그 스캔 없음)
+        f_top = pool.submit(lambda: heavy_hitters.top_clicks.merged([day_start_kst.date()]).top(10))
+        # 고유 방문자/세션 (HyperLogLog)
+        f_uv = pool.submit(hyperloglog.count_visitors, [day_start_kst.date()])
 
         # 결과 수집
-        day_buckets: dict = {d_str: {e: 0 for e in EVENT_TYPES} for d_str, _, _ in day_ranges}
+        if day_buckets is None:
+            day_buckets = {d_str: {e: 0 for e in EVENT_TYPES} for d_str, _, _ in day_ranges}
         for f in as_completed(tasks):
             d_str, etype = tasks[f]
             day_buckets[d_str][etype] = f.result()
 
         active_count = f_active.result()
         new_deals_count = f_new.result()
-        top10_raw = f_clicks.result()
+        top10_raw = f_top.result()
+        uv = f_uv.result()
 
     today_b = day_buckets.get(today_str, {e: 0 for e in EVENT_TYPES})
     pv_count = today_b.get("page_view", 0)
@@ -507,8 +902,8 @@ def get_admin_metrics(date_str: Optional[str] = None) -> dict:
     ]
 
     # Top 10 딜
-    click_counter: Counter = Counter(e["deal_id"] for e in top10_raw if e.get("deal_id"))
-    top10_ids = [did for did, _ in click_counter.most_common(10)]
+    click_counter = {did: cnt for did, cnt, _ in top10_raw}
+    top10_ids = list(click_counter)
     top10_deals = []
     if top10_ids:
         deals_res = sb.table("deals") \
@@ -535,6 +930,8 @@ def get_admin_metrics(date_str: Optional[str] = None) -> dict:
             "impressions": impression_count,
             "clicks": click_count,
             "deal_opens": deal_open_count,
+            "visitors": uv["ips"],
+            "sessions": uv["sessions"],
             "active_deals": active_count,
             "new_deals": new_deals_count,
         },
@@ -543,6 +940,36 @@ def get_admin_metrics(date_str: Optional[str] = None) -> dict:
     }
 
 
+def get_visitor_stats(
+    since: str,
+    sort: str = "last_seen",
+    size: int = 50,
+    offset: int = 0,
+    ip_prefix: Optional[str] = None,
+    device: Optional[str] = None,
+) -> dict:
+    """IP별 방문 집계 (admin_visitor_stats RPC, DB에서 GROUP BY + 정렬 + 페이지)
+
+    → {total_ips, matched, deal_opens, clicks, rows} — 합계는 페이지와 무관 (범위 밖 페이지도 유지)
+    """
+    sb = get_supabase()
+    data = sb.rpc("admin_visitor_stats", {
+        "since": since,
+        "sort_by": sort,
+        "page_size": size,
+        "page_offset": offset,
+        "ip_prefix": ip_prefix,
+        "device_filter": device,
+    }).execute().data or {}
+    return {
+        "total_ips": int(data.get("total_ips") or 0),
+        "matched": int(data.get("matched") or 0),
+        "deal_opens": int(data.get("deal_opens") or 0),
+        "clicks": int(data.get("clicks") or 0),
+        "rows": data.get("rows") or [],
+    }
+
+
 def get_admin_deals(
     status: Optional[str] = None,
     source: Optional[str] = None,
@@ -554,7 +981,7 @@ def get_admin_deals(
 ) -> dict:
     """관리자용 딜 목록 (모든 status 포함)"""
     sb = get_supabase()
-    query = sb.table("deals").select("*", count="exact")
+    query = sb.table("deals").select(DEAL_COLUMNS["admin"], count="exact")
 
     if status:
         query = query.eq("status", status)
@@ -603,13 +1030,14 @@ def update_deal_admin(deal_id: int, data: Dict[str, Any]) -> Optional[dict]:
     if not patch:
         return None
     res = sb.table("deals").update(patch).eq("id", deal_id).execute()
+    bump_data_version()
     return res.data[0] if res.data else None
 
 
 def get_deal_admin(deal_id: int) -> Optional[dict]:
     """관리자용 딜 상세 (price_history 포함)"""
     sb = get_supabase()
-    deal_res = sb.table("deals").select("*").eq("id", deal_id).limit(1).execute()
+    deal_res = sb.table("deals").select(DEAL_COLUMNS["admin"]).eq("id", deal_id).limit(1).execute()
     if not deal_res.data:
         return None
     deal = deal_res.data[0]
@@ -621,16 +1049,15 @@ def get_deal_admin(deal_id: int) -> Optional[dict]:
     except Exception:
         deal["price_history"] = []
 
-    # 집계 (event_logs)
+    # 집계 (event_rollup_deal_daily)
     try:
+        from app.services import event_rollup
         KST = timezone(timedelta(hours=9))
-        day_start = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0).astimezone(timezone.utc).isoformat()
-        ev_res = sb.table("event_logs").select("event_type").eq("deal_id", deal_id).gte("created_at", day_start).execute()
-        events = ev_res.data or []
+        counts = event_rollup.get_deal_day_counts(deal_id, datetime.now(KST).date())
         deal["stats_today"] = {
-            "impressions": sum(1 for e in events if e["event_type"] == "page_view"),
-            "deal_opens": sum(1 for e in events if e["event_type"] == "deal_open"),
-            "clicks": sum(1 for e in events if e["event_type"] == "outbound_click"),
+            "impressions": counts.get("page_view", 0),
+            "deal_opens": counts.get("deal_open", 0),
+            "clicks": counts.get("outbound_click", 0),
         }
     except Exception:
         deal["stats_today"] = {"impressions": 0, "deal_opens": 0, "clicks": 0}
@@ -0,0 +1,115 @@
+"""
+공개 읽기 엔드포인트 HTTP 캐싱 (ETag / Cache-Control)
+
+- ETag = hash(경로 + 쿼리 + 딜 데이터 태그 [+ 시간 버킷])
+  → 딜 쓰기(db.bump_data_version) 전까지 동일 ETag 유지
+  → 데이터 태그(db.get_data_tag)는 레플리카 공통 공유 토큰 / 공유 전엔 부팅 nonce 포함
+    (재시작·다른 레플리카에서 같은 ETag 가 다른 데이터를 가리키는 거짓 304 방지)
+- If-None-Match 일치 시 핸들러(DB 조회) 실행 없이 304 반환
+- 라우트별 Cache-Control / stale-while-revalidate 정책 → Vercel/CDN 엣지 캐시
+"""
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+import app.db_supabase as db
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int           # 브라우저 캐시 (초)
+    s_maxage: int          # CDN/엣지 캐시 (초)
+    swr: int               # stale-while-revalidate (초)
+    etag_ttl: int = 0      # >0 이면 시간 버킷도 ETag에 포함 (조회수·방문자처럼 딜 쓰기 없이 변하는 값)
+
+    @property
+    def header(self) -> str:
+        return (
+            f"public, max-age={self.max_age}, s-maxage={self.s_maxage}, "
+            f"stale-while-revalidate={self.swr}"
+        )
+
+
+# 경로는 끝 "/" 제거 후 매칭 (/feed/* 는 routers/feed.py가 사전 생성 바이트로 직접 처리)
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "/api/deals":      CachePolicy(max_age=30,  s_maxage=60,   swr=300,  etag_ttl=60),
+    "/api/stats":      CachePolicy(max_age=60,  s_maxage=60,   swr=300,  etag_ttl=60),
+    "/api/categories": CachePolicy(max_age=300, s_maxage=600,  swr=1800),
+    "/api/brands":     CachePolicy(max_age=300, s_maxage=600,  swr=1800),
+    "/api/search/popular": CachePolicy(max_age=60, s_maxage=300, swr=600, etag_ttl=300),
+    "/api/deals/suggestions": CachePolicy(max_age=60, s_maxage=300, swr=600, etag_ttl=60),
+}
+
+
+def compute_etag(path: str, query: bytes, policy: CachePolicy, version: Optional[str] = None) -> str:
+    """데이터 태그 기반 weak ETag (압축 여부와 무관하게 동일 표현으로 취급)"""
+    if version is None:
+        version = db.get_data_tag()
+    bucket = int(time.time() // policy.etag_ttl) if policy.etag_ttl else 0
+    raw = f"{path}?{query.decode('latin-1')}|{version}|{bucket}".encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # weak 비교: W/ 접두사 무시
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+class HTTPCacheMiddleware:
+    """CACHE_POLICIES에 등록된 GET/HEAD 경로에 ETag·Cache-Control 부여 + 304 처리"""
+
+    def __init__(self, app, policies: Dict[str, CachePolicy] = CACHE_POLICIES):
+        self.app = app
+        self.policies = policies
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"].rstrip("/") or "/"
+        policy = self.policies.get(path)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = compute_etag(path, scope.get("query_string", b""), policy)
+        request_headers = Headers(scope=scope)
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [
+                    (b"etag", etag.encode()),
+                    (b"cache-control", policy.header.encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_validators(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                # 핸들러가 직접 검증자를 지정했으면 존중
+                if "etag" not in headers:
+                    headers["ETag"] = etag
+                if "cache-control" not in headers:
+                    headers["Cache-Control"] = policy.header
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
@@ -1,26 +1,37 @@
+import logging
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from typing import Optional
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from app.rate_limit import limiter
+from app.http_cache import HTTPCacheMiddleware
 
 from app.config import settings
 from app.routers import deals, stats, verify, feed
 from app.routers import admin as admin_router
 from app.routers import search as search_router
 from app.scheduler import start_scheduler, stop_scheduler
+from app.services import event_rollup, heavy_hitters, hyperloglog, sketch_store
 import app.db_supabase as db
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     start_scheduler()
     yield
     stop_scheduler()
+    from app.services.price_scrapers import close_pool
+    await close_pool()
+    event_rollup.flush()  # 종료 전 미반영 롤업 카운터 / 스케치 저장
+    sketch_store.persist_all()
+    db.shutdown_executor()
 
 
 app = FastAPI(
@@ -28,12 +39,19 @@ app = FastAPI(
     description="쿠팡/네이버/뽐뿌 핫딜 + 커뮤니티 제보",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Rate limiter 등록
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# 미들웨어는 나중에 등록할수록 바깥 — 요청 순서: 압축 → CORS → HTTP 캐시 → 라우터
+# (캐시가 CORS 안쪽이어야 조건부 GET 304 에도 Access-Control-Allow-Origin 이 붙음)
+
+# 공개 읽기 엔드포인트 ETag/Cache-Control + 304 (app/http_cache.CACHE_POLICIES)
+app.add_middleware(HTTPCacheMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
@@ -42,6 +60,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축: brotli 우선 (미지원 클라이언트는 gzip fallback), 패키지 없으면 gzip만
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE, gzip_fallback=True)
+except ImportError:
+    logger.warning("brotli-asgi 미설치 — gzip 압축만 사용")
+    app.add_middleware(GZipMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 app.include_router(deals.router)
 app.include_router(stats.router)
 app.include_router(verify.router)
@@ -70,7 +96,8 @@ async def track_event(payload: EventPayload, request: Request):
         or request.headers.get("x-real-ip")
         or (request.client.host if request.client else None)
     )
-    db.log_event(
+    logged = await db.run_db(
+        db.log_event,
         event_type=payload.event_type,
         deal_id=payload.deal_id,
         session_id=payload.session_id,
@@ -78,10 +105,20 @@ async def track_event(payload: EventPayload, request: Request):
         user_agent=user_agent,
         ip_address=ip,
     )
+    # 관리자 대시보드 롤업 카운터 (1분마다 DB flush)
+    if logged:
+        event_rollup.record(payload.event_type, payload.deal_id, ip_address=ip, user_agent=user_agent)
+        # Top-K 스케치 (관리자 Top10 클릭 / 인기 검색어)
+        if payload.event_type == "outbound_click" and payload.deal_id:
+            heavy_hitters.record_click(payload.deal_id)
+        elif payload.event_type == "search" and payload.referrer:
+            heavy_hitters.record_search(payload.referrer)
+        # 고유 방문자/세션 HLL
+        hyperloglog.record_visitor(ip, payload.session_id)
     # C-009: outbound_click 시 deal 클릭 카운트 증가
     if payload.event_type == "outbound_click" and payload.deal_id:
         try:
-            db.increment_clicks(payload.deal_id)
+            await db.run_db(db.increment_clicks, payload.deal_id)
         except Exception:
             pass  # 카운트 실패는 무시
     return {"ok": True}
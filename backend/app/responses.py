@@ -0,0 +1,30 @@
+"""
+읽기 엔드포인트용 응답 헬퍼
+- orjson 직렬화 (ORJSONResponse)
+- 이미 _to_deal_dict 계열로 정규화된 payload는 response_model 재검증 생략
+  (RESPONSE_VALIDATION=true 로 켜면 개발 중 스키마 검증)
+"""
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.config import settings
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def fast_json(content: Any, schema: Optional[Any] = None, **kwargs) -> ORJSONResponse:
+    """정규화된 dict/list → ORJSONResponse
+
+    Response를 직접 반환하면 FastAPI의 response_model 검증 + jsonable_encoder를 건너뜀.
+    schema는 문서화/개발 검증용 (예: DealListResponse, list[DealCardResponse]).
+    """
+    if schema is not None and settings.RESPONSE_VALIDATION:
+        adapter = _adapter(schema)
+        content = adapter.dump_python(adapter.validate_python(content), mode="json")
+    return ORJSONResponse(content, **kwargs)
@@ -2,6 +2,8 @@
 Admin API Router
 X-Admin-Key 헤더 인증 → settings.ADMIN_SECRET 비교
 """
+import asyncio
+import math
 from fastapi import APIRouter, HTTPException, Header, Query, BackgroundTasks
 from typing import Optional
 from pydantic import BaseModel
@@ -28,7 +30,7 @@ async def get_metrics(
 ):
     verify_admin(x_admin_key)
     from fastapi.responses import JSONResponse
-    data = db.get_admin_metrics(date)
+    data = await db.run_db(db.get_admin_metrics, date)
     return JSONResponse(
         content=data,
         headers={
@@ -54,7 +56,8 @@ async def get_admin_deals(
     x_admin_key: Optional[str] = Header(None),
 ):
     verify_admin(x_admin_key)
-    return db.get_admin_deals(
+    return await db.run_db(
+        db.get_admin_deals,
         status=status,
         source=source,
         search=search,
@@ -75,7 +78,7 @@ async def get_admin_deal(
     x_admin_key: Optional[str] = Header(None),
 ):
     verify_admin(x_admin_key)
-    deal = db.get_deal_admin(deal_id)
+    deal = await db.run_db(db.get_deal_admin, deal_id)
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
     return deal
@@ -106,7 +109,7 @@ async def patch_admin_deal(
     x_admin_key: Optional[str] = Header(None),
 ):
     verify_admin(x_admin_key)
-    updated = db.update_deal_admin(deal_id, body.model_dump(exclude_none=True))
+    updated = await db.run_db(db.update_deal_admin, deal_id, body.model_dump(exclude_none=True))
     if updated is None:
         raise HTTPException(status_code=404, detail="Deal not found or nothing to update")
     return updated
@@ -123,12 +126,13 @@ async def get_pending_deals(
     """제보 대기 딜 목록 (pending만 — rejected는 DB enum 없음, expired+[거부] 메모로 대체)"""
     verify_admin(x_admin_key)
     sb = db.get_supabase()
-    res = sb.table("deals") \
-        .select("*") \
-        .eq("status", "pending") \
-        .order("created_at", desc=True) \
-        .limit(100) \
-        .execute()
+    res = await db.aexecute(
+        sb.table("deals")
+        .select(db.deal_columns("admin"))
+        .eq("status", "pending")
+        .order("created_at", desc=True)
+        .limit(100)
+    )
     return {"deals": res.data or [], "total": len(res.data or [])}
 
 
@@ -144,7 +148,7 @@ async def approve_deal(
     """제보 딜 승인 → active"""
     verify_admin(x_admin_key)
     sb = db.get_supabase()
-    deal = sb.table("deals").select("*").eq("id", deal_id).limit(1).execute().data
+    deal = (await db.aexecute(sb.table("deals").select("id,original_price,sale_price,admin_note").eq("id", deal_id).limit(1))).data
     if not deal:
         raise HTTPException(status_code=404, detail="딜을 찾을 수 없습니다")
     d = deal[0]
@@ -159,12 +163,13 @@ async def approve_deal(
     if dr <= 0:
         raise HTTPException(status_code=400, detail="할인율 0% — 승인 불가")
 
-    sb.table("deals").update({
+    await db.aexecute(sb.table("deals").update({
         "status": "active",
         "discount_rate": dr,
         "is_hot": dr >= 25,
         "admin_note": f"✅ 어드민 승인 | {d.get('admin_note', '')}",
-    }).eq("id", deal_id).execute()
+    }).eq("id", deal_id))
+    db.bump_data_version()
 
     return {"id": deal_id, "status": "active", "discount_rate": dr}
 
@@ -179,10 +184,11 @@ async def reject_deal(
     verify_admin(x_admin_key)
     sb = db.get_supabase()
     reason = body.reason or "사유 미입력"
-    sb.table("deals").update({
+    await db.aexecute(sb.table("deals").update({
         "status": "expired",
         "admin_note": f"[거부] {reason}",
-    }).eq("id", deal_id).execute()
+    }).eq("id", deal_id))
+    db.bump_data_version()
     return {"id": deal_id, "status": "expired", "reason": reason}
 
 
@@ -197,7 +203,7 @@ async def rescrape_deal(
     x_admin_key: Optional[str] = Header(None),
 ):
     verify_admin(x_admin_key)
-    deal = db.get_deal_by_id(deal_id)
+    deal = await db.run_db(db.get_deal_by_id, deal_id)
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
 
@@ -352,111 +358,101 @@ async def quick_add_deal(
         deal_data["brand"] = body.brand
 
     try:
-        deal = db.create_deal(deal_data)
+        deal = await db.run_db(db.create_deal, deal_data)
         # 이미지 없으면 Naver에서 자동 주입
         if not deal_data.get("image_url") and deal:
             from app.routers.deals import _fetch_naver_image
             image = await _fetch_naver_image(deal_data["title"])
             if image:
-                db.get_supabase().table("deals").update({"image_url": image}).eq("id", deal["id"]).execute()
+                await db.aexecute(db.get_supabase().table("deals").update({"image_url": image}).eq("id", deal["id"]))
+                db.bump_data_version()
                 deal["image_url"] = image
         return deal
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+VISITOR_SORTS = ("last_seen", "visits", "clicks", "deal_opens", "sessions")
+
+
 @router.get("/visitors")
 async def get_visitors(
     x_admin_key: Optional[str] = Header(None),
     days: int = Query(7, ge=1, le=30),
+    page: int = Query(1, ge=1),
+    size: int = Query(50, ge=1, le=200),
+    sort: str = Query("last_seen", description="last_seen | visits | clicks | deal_opens | sessions"),
+    ip: Optional[str] = Query(None, description="IP prefix 필터"),
+    device: Optional[str] = Query(None, description="모바일 | PC | 봇"),
 ):
-    """IP별 방문·클릭 통계 — 최근 N일"""
+    """IP별 방문·클릭 통계 — 최근 N일 (DB 집계 + 페이지네이션)
+
+    total_ips / matched_ips / total_deal_opens / total_clicks 는 최근 N×24시간 정확한 값 (페이지 무관),
+    unique_sessions 는 HyperLogLog 추정 (KST 달력 N일 기준)
+    """
     verify_admin(x_admin_key)
-    sb = db.get_supabase()
     from datetime import datetime, timedelta, timezone
+    from app.services import event_rollup, hyperloglog
+    from app.services.sketch_store import kst_today
 
-    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-
-    res = sb.table("event_logs") \
-        .select("ip_address,event_type,deal_id,session_id,user_agent,created_at") \
-        .gte("created_at", since) \
-        .not_.is_("ip_address", "null") \
-        .order("created_at", desc=True) \
-        .limit(5000) \
-        .execute()
+    if sort not in VISITOR_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort는 {', '.join(VISITOR_SORTS)} 중 하나")
 
-    rows = res.data or []
-
-    # IP별 집계
-    from collections import defaultdict
-    ip_stats: dict = defaultdict(lambda: {
-        "ip": "",
-        "visits": 0,
-        "clicks": 0,
-        "deal_opens": 0,
-        "last_seen": "",
-        "first_seen": "",
-        "user_agent": "",
-        "sessions": set(),
-        "deals_clicked": set(),
-    })
-
-    for r in rows:
-        ip = r.get("ip_address") or "unknown"
-        et = r.get("event_type", "")
-        s = ip_stats[ip]
-        s["ip"] = ip
-        s["user_agent"] = r.get("user_agent") or s["user_agent"]
-        ts = r.get("created_at", "")
-        if not s["last_seen"] or ts > s["last_seen"]:
-            s["last_seen"] = ts
-        if not s["first_seen"] or ts < s["first_seen"]:
-            s["first_seen"] = ts
-        if r.get("session_id"):
-            s["sessions"].add(r["session_id"])
-        if et == "impression":
-            s["visits"] += 1
-        elif et == "outbound_click":
-            s["clicks"] += 1
-            if r.get("deal_id"):
-                s["deals_clicked"].add(r["deal_id"])
-        elif et == "deal_open":
-            s["deal_opens"] += 1
-
-    # 직렬화
-    result = []
-    for ip, s in ip_stats.items():
-        ua = s["user_agent"] or ""
-        device = "모바일" if "Mobile" in ua else ("봇" if "bot" in ua.lower() else "PC")
-        result.append({
-            "ip": ip,
-            "visits": s["visits"],
-            "deal_opens": s["deal_opens"],
-            "clicks": s["clicks"],
-            "sessions": len(s["sessions"]),
-            "deals_clicked": len(s["deals_clicked"]),
-            "device": device,
-            "first_seen": s["first_seen"],
-            "last_seen": s["last_seen"],
-            "user_agent": ua[:120],
-        })
-
-    # 최근 방문순 정렬
-    result.sort(key=lambda x: x["last_seen"], reverse=True)
-
-    # 최근 이벤트 로그 (상세)
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    today = kst_today()
+    try:
+        stats, uv = await asyncio.gather(
+            db.run_db(db.get_visitor_stats, since, sort, size, (page - 1) * size, ip, device),
+            db.run_db(hyperloglog.count_visitors, [today - timedelta(days=i) for i in range(days)]),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"방문자 집계 실패 (migrations/008 적용 필요): {e}")
+
+    summary = [{
+        "ip": r["ip"],
+        "visits": r["visits"],
+        "deal_opens": r["deal_opens"],
+        "clicks": r["clicks"],
+        "sessions": r["sessions"],
+        "deals_clicked": r["deals_clicked"],
+        "device": r["device"],
+        "first_seen": r["first_seen"],
+        "last_seen": r["last_seen"],
+        "user_agent": r.get("user_agent") or "",
+    } for r in stats["rows"]]
+
+    # 최근 이벤트 로그 (상세) — 인스턴스 링버퍼, 재시작 직후 비어 있으면 DB 최근 100건
+    recent = event_rollup.recent_events(100)
+    if not recent:
+        sb = db.get_supabase()
+        res = await db.aexecute(
+            sb.table("event_logs")
+            .select("ip_address,event_type,deal_id,user_agent,created_at")
+            .not_.is_("ip_address", "null")
+            .order("created_at", desc=True)
+            .limit(100)
+        )
+        recent = res.data or []
     recent_logs = [{
         "ip": r.get("ip_address"),
         "event": r.get("event_type"),
         "deal_id": r.get("deal_id"),
         "time": r.get("created_at"),
         "device": "모바일" if "Mobile" in (r.get("user_agent") or "") else "PC",
-    } for r in rows[:100]]
+    } for r in recent if r.get("ip_address")]
 
     return {
         "period_days": days,
-        "total_ips": len(result),
-        "summary": result,
+        "total_ips": stats["total_ips"],
+        "unique_sessions": uv["sessions"],
+        "estimated_fields": ["unique_sessions"],
+        "matched_ips": stats["matched"],
+        "total_deal_opens": stats["deal_opens"],
+        "total_clicks": stats["clicks"],
+        "page": page,
+        "size": size,
+        "pages": math.ceil(stats["matched"] / size) if stats["matched"] else 0,
+        "summary": summary,
         "recent_logs": recent_logs,
     }
 
@@ -530,12 +526,11 @@ async def reprocess_community_deals(
     import app.db_supabase as db
 
     sb = db.get_supabase()
-    res = (
+    res = await db.aexecute(
         sb.table("deals")
         .select("id, title, sale_price, category, source")
         .eq("source", "community")
         .eq("status", "pending")
-        .execute()
     )
     deals = res.data or []
     results = {"total": len(deals), "food_expired": 0, "activated": 0, "kept_pending": 0}
@@ -548,10 +543,10 @@ async def reprocess_community_deals(
 
         # 식품 필터
         if is_food_or_daily(title, category):
-            sb.table("deals").update({
+            await db.aexecute(sb.table("deals").update({
                 "status": "expired",
                 "admin_note": "[자동만료] 식품/일상용품 금지 카테고리",
-            }).eq("id", deal_id).execute()
+            }).eq("id", deal_id))
             results["food_expired"] += 1
             continue
 
@@ -565,7 +560,8 @@ async def reprocess_community_deals(
             }
             if not deal.get("image_url") and msrp.get("image_url"):
                 patch["image_url"] = msrp["image_url"]
-            sb.table("deals").update(patch).eq("id", deal_id).execute()
+            await db.aexecute(sb.table("deals").update(patch).eq("id", deal_id))
+            db.bump_data_version()
             results["activated"] += 1
         else:
             results["kept_pending"] += 1
@@ -596,16 +592,18 @@ async def parse_product_url_endpoint(
 async def get_pipeline_stats(x_admin_key: Optional[str] = Header(None)):
     """파이프라인별 수집 통계 — 소스별 24h 신규 딜 + 전체 active 수"""
     verify_admin(x_admin_key)
-    from app.db_supabase import get_supabase
     from datetime import datetime, timedelta, timezone
     from collections import defaultdict
 
-    sb = get_supabase()
+    sb = db.get_supabase()
     now = datetime.now(timezone.utc)
     since_24h = (now - timedelta(hours=24)).isoformat()
 
     # 24h 신규 딜 — 소스/상태별
-    res = sb.table("deals").select("source,status,created_at").gte("created_at", since_24h).execute()
+    res, active_res = await asyncio.gather(
+        db.aexecute(sb.table("deals").select("source,status,created_at").gte("created_at", since_24h)),
+        db.aexecute(sb.table("deals").select("source").eq("status", "active")),
+    )
     rows = res.data or []
 
     stats: dict = defaultdict(lambda: {"total_24h": 0, "active": 0, "expired": 0, "pending": 0})
@@ -617,7 +615,6 @@ async def get_pipeline_stats(x_admin_key: Optional[str] = Header(None)):
             stats[src][status] += 1
 
     # 전체 active 딜 — 소스별
-    active_res = sb.table("deals").select("source").eq("status", "active").execute()
     active_by_src: dict = defaultdict(int)
     for r in (active_res.data or []):
         active_by_src[r["source"]] += 1
@@ -634,6 +631,62 @@ async def get_pipeline_stats(x_admin_key: Optional[str] = Header(None)):
     }
 
 
+@router.get("/scraper-stats")
+async def get_scraper_stats(x_admin_key: Optional[str] = Header(None)):
+    """쇼핑몰별 가격 추출 tier 적중 통계 + 호스트별 요청/차단 현황 (인스턴스 로컬)"""
+    verify_admin(x_admin_key)
+    from app.services import host_guard
+    from app.services.price_scrapers import get_tier_stats
+    return {"retailers": get_tier_stats(), "hosts": host_guard.get_stats()}
+
+
+@router.get("/jobs")
+async def get_job_stats(
+    hours: Optional[int] = Query(None, ge=1, le=336, description="지정 시 job_runs 테이블(전체 인스턴스) 기준"),
+    x_admin_key: Optional[str] = Header(None),
+):
+    """스케줄러 잡별 소요시간 p50/p90/p99 · 에러 · 주기 초과 · 카운터 합계"""
+    verify_admin(x_admin_key)
+    from collections import defaultdict
+    from app.services import adaptive_schedule, job_metrics
+
+    jobs = job_metrics.summary()
+    if hours:
+        try:
+            rows = await db.run_db(db.get_job_runs, None, hours, None)
+        except Exception as e:
+            raise HTTPException(status_code=503, detail=f"job_runs 조회 실패: {e}")
+        by_job: dict = defaultdict(list)
+        for r in rows:
+            by_job[r["job_id"]].append(r)
+        for job_id, runs in by_job.items():
+            jobs.setdefault(job_id, {}).update(job_metrics.summarize_runs(runs))
+    return {
+        "source": f"job_runs {hours}h" if hours else "instance",
+        "jobs": jobs,
+        "adaptive": adaptive_schedule.snapshot(),
+    }
+
+
+@router.get("/jobs/{job_id}/runs")
+async def get_job_runs(
+    job_id: str,
+    hours: int = Query(24, ge=1, le=336),
+    limit: int = Query(100, ge=1, le=1000),
+    x_admin_key: Optional[str] = Header(None),
+):
+    """잡 실행 이력 (최신순) — job_runs 테이블, 실패 시 인스턴스 링버퍼"""
+    verify_admin(x_admin_key)
+    from app.services import job_metrics
+    try:
+        runs = await db.run_db(db.get_job_runs, job_id, hours, limit)
+        source = "job_runs"
+    except Exception:
+        runs = job_metrics.recent_runs(job_id, limit)
+        source = "instance"
+    return {"job_id": job_id, "source": source, "runs": runs}
+
+
 @router.get("/expiry-stats")
 async def get_expiry_stats():
     """최근 만료 딜 이유 태그 통계 (admin_note 기반)"""
@@ -644,13 +697,12 @@ async def get_expiry_stats():
     sb = db.get_supabase()
     since_7d = (datetime.utcnow() - timedelta(days=7)).isoformat()
 
-    res = (
+    res = await db.aexecute(
         sb.table("deals")
         .select("admin_note,source,created_at")
         .eq("status", "expired")
         .gte("updated_at", since_7d)
         .limit(500)
-        .execute()
     )
     rows = res.data or []
 
@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request
 from typing import Optional
-from app.schemas.deal import DealSubmitCommunity, DealResponse, DealListResponse
+from app.schemas.deal import DealSubmitCommunity, DealResponse, DealCardResponse, DealListResponse
 from app.rate_limit import limiter
+from app.responses import fast_json
 import app.db_supabase as db
 
 router = APIRouter(prefix="/api/deals", tags=["deals"])
@@ -14,7 +16,7 @@ async def get_deals(
     offset: Optional[int] = Query(None, ge=0),
     category: Optional[str] = None,
     source: Optional[str] = None,
-    sort: str = Query("latest", pattern="^(latest|popular|discount|price_asc|price_desc)$"),
+    sort: str = Query("latest", pattern="^(latest|popular|discount|price_asc|price_desc|relevance)$"),
     search: Optional[str] = None,
     hot_only: bool = False,
     brand: Optional[str] = None,
@@ -22,12 +24,14 @@ async def get_deals(
     price_max: Optional[int] = None,
     mall: Optional[str] = None,
 ):
-    return db.get_deals(
+    data = await db.run_db(
+        db.get_deals,
         page=page, size=size, category=category,
         source=source, sort=sort, search=search, hot_only=hot_only,
         brand=brand, offset=offset, price_min=price_min, price_max=price_max,
         mall=mall,
     )
+    return fast_json(data, DealListResponse)
 
 
 @router.get("/sources")
@@ -45,11 +49,10 @@ async def get_deal_sources():
         "ppomppu": "뽐뿌",
     }
     try:
-        res = (
+        res = await db.aexecute(
             sb.table("deals")
             .select("source")
             .eq("status", "active")
-            .execute()
         )
         counts: dict[str, int] = {}
         for row in (res.data or []):
@@ -104,14 +107,18 @@ async def get_deal_malls():
     }
     result = []
     try:
-        for mall_key, url_pattern in MALL_URL_PATTERNS.items():
-            res = (
+        # 쇼핑몰별 count 쿼리를 동시에 실행 (스레드풀 offload)
+        mall_keys = list(MALL_URL_PATTERNS.keys())
+        responses = await asyncio.gather(*[
+            db.aexecute(
                 sb.table("deals")
                 .select("id", count="exact")
                 .eq("status", "active")
-                .ilike("product_url", f"%{url_pattern}%")
-                .execute()
+                .ilike("product_url", f"%{MALL_URL_PATTERNS[mall_key]}%")
             )
+            for mall_key in mall_keys
+        ])
+        for mall_key, res in zip(mall_keys, responses):
             count = res.count or 0
             if count > 0:
                 result.append({
@@ -128,75 +135,35 @@ async def get_deal_malls():
 
 @router.get("/hot")
 async def get_hot_deals():
-    return db.get_hot_deals(limit=10)
+    deals = await db.run_db(db.get_hot_deals, limit=10)
+    return fast_json(deals, list[DealCardResponse])
 
 
 @router.get("/trending")
 async def get_trending_deals():
-    """최근 48h 내 조회수 TOP 3 딜"""
-    from datetime import datetime, timedelta, timezone
-    sb = db.get_supabase()
-    since = (datetime.now(timezone.utc) - timedelta(hours=48)).isoformat()
-    res = (
-        sb.table("deals")
-        .select("id,title,sale_price,original_price,discount_rate,image_url,source,category,is_hot,created_at,affiliate_url,product_url,status,views,upvotes,submitter_name,expires_at,verified_price,last_verified_at,updated_at")
-        .eq("status", "active")
-        .gte("created_at", since)
-        .order("views", desc=True)
-        .limit(3)
-        .execute()
-    )
-    return [db._to_deal_dict(r) for r in (res.data or [])]
+    """최근 48h 내 참여도 속도(조회·클릭·업보트, 시간 감쇠) TOP 3 딜 — services/ranker"""
+    from app.services import ranker
+    deals = await db.run_db(ranker.top_deals, "trending", 3)
+    return fast_json(deals, list[DealCardResponse])
 
 
 @router.get("/suggestions")
 async def get_suggestions(q: str = ""):
-    """검색어 자동완성 — 브랜드명 + 카테고리 + 제목에서 추출"""
+    """검색어 자동완성 — 브랜드명 + 카테고리 + 제목 (인메모리 prefix 인덱스, 초성 지원)"""
     if len(q) < 1:
         return []
-    sb = db.get_supabase()
-    res = (
-        sb.table("deals")
-        .select("title,category,submitter_name")
-        .eq("status", "active")
-        .ilike("title", f"%{q}%")
-        .limit(20)
-        .execute()
-    )
-
-    seen: set = set()
-    suggestions = []
-    for row in (res.data or []):
-        # 카테고리 매칭
-        cat_val = row.get("category")
-        if cat_val and q.lower() in cat_val.lower() and cat_val not in seen:
-            seen.add(cat_val)
-            suggestions.append({"type": "category", "value": cat_val})
-        # 제목 앞 3단어
-        title = row.get("title", "")
-        short = " ".join(title.split()[:3])[:20]
-        if short and q.lower() in short.lower() and short not in seen:
-            seen.add(short)
-            suggestions.append({"type": "title", "value": short})
-    return suggestions[:8]
+    from app.services import autocomplete, deal_catalog
+    snapshot = await deal_catalog.aget_catalog()
+    index = snapshot.peek("autocomplete") or await db.run_db(autocomplete.get_index, snapshot)
+    return index.suggest(q)
 
 
 @router.get("/weekly-top")
 async def get_weekly_top_deals():
-    """최근 7일 discount_rate 높은 순 TOP 10"""
-    from datetime import datetime, timedelta, timezone
-    sb = db.get_supabase()
-    since = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
-    res = (
-        sb.table("deals")
-        .select("id,title,sale_price,original_price,discount_rate,image_url,source,category,is_hot,created_at,affiliate_url,product_url,status,views,upvotes,submitter_name,expires_at,verified_price,last_verified_at,updated_at")
-        .eq("status", "active")
-        .gte("created_at", since)
-        .order("discount_rate", desc=True)
-        .limit(10)
-        .execute()
-    )
-    return [db._to_deal_dict(r) for r in (res.data or [])]
+    """최근 7일 랭킹 점수(할인율·참여도·최신성) TOP 10 — services/ranker"""
+    from app.services import ranker
+    deals = await db.run_db(ranker.top_deals, "weekly", 10)
+    return fast_json(deals, list[DealCardResponse])
 
 
 @router.get("/by-ids")
@@ -208,37 +175,43 @@ async def get_deals_by_ids(ids: str = ""):
     if not id_list:
         return []
     sb = db.get_supabase()
-    res = sb.table("deals").select("*").in_("id", id_list).execute()
-    return [db._to_deal_dict(r) for r in (res.data or [])]
+    res = await db.aexecute(sb.table("deals").select(db.deal_columns("card")).in_("id", id_list))
+    return fast_json(db.serialize_deals(res.data, "card"), list[DealCardResponse])
 
 
 @router.get("/{deal_id}/related")
-async def get_related_deals(deal_id: int):
-    """같은 카테고리에서 최신 3개 추천 (자기 자신 제외)"""
+async def get_related_deals(deal_id: int, limit: int = Query(3, ge=1, le=6)):
+    """연관 딜 추천 — 사전 계산 결과 (services/recommendations), 없으면 같은 카테고리 최신순"""
+    from app.services import deal_catalog, recommendations
+    snapshot = await deal_catalog.aget_catalog()
+    related = recommendations.get_related(deal_id, snapshot, limit)
+    if related is not None:
+        return fast_json(related, list[DealCardResponse])
+
     sb = db.get_supabase()
-    cur = sb.table("deals").select("category").eq("id", deal_id).limit(1).execute()
+    cur = await db.aexecute(sb.table("deals").select("category").eq("id", deal_id).limit(1))
     if not cur.data:
         return []
     category = cur.data[0].get("category", "기타")
-    res = (
+    res = await db.aexecute(
         sb.table("deals")
-        .select("id,title,sale_price,original_price,discount_rate,image_url,source,category,is_hot,created_at,affiliate_url,product_url,status,upvotes,views,submitter_name,expires_at,verified_price,last_verified_at,updated_at")
+        .select(db.deal_columns("card"))
         .eq("status", "active")
         .eq("category", category)
         .neq("id", deal_id)
         .order("created_at", desc=True)
-        .limit(3)
-        .execute()
+        .limit(limit)
     )
-    return [db._to_deal_dict(r) for r in (res.data or [])]
+    return fast_json(db.serialize_deals(res.data, "card"), list[DealCardResponse])
 
 
 @router.get("/{deal_id}/price-history")
 async def get_price_history(deal_id: int):
-    from app.db_supabase import get_supabase
-    sb = get_supabase()
+    sb = db.get_supabase()
     try:
-        res = sb.table("deal_price_log").select("price,recorded_at").eq("deal_id", deal_id).order("recorded_at").limit(60).execute()
+        res = await db.aexecute(
+            sb.table("deal_price_log").select("price,recorded_at").eq("deal_id", deal_id).order("recorded_at").limit(60)
+        )
         return res.data or []
     except Exception:
         return []
@@ -246,10 +219,10 @@ async def get_price_history(deal_id: int):
 
 @router.get("/{deal_id}")
 async def get_deal(deal_id: int):
-    deal = db.get_deal_by_id(deal_id)
+    deal = await db.run_db(db.get_deal_by_id, deal_id)
     if not deal:
         raise HTTPException(status_code=404, detail="딜을 찾을 수 없습니다")
-    db.increment_views(deal_id)
+    await db.run_db(db.increment_views, deal_id)
     deal["views"] += 1
 
     # 가격 히스토리 + 신뢰지수 (네이버 소스만)
@@ -264,7 +237,7 @@ async def get_deal(deal_id: int):
                 m = re.match(r'^\[([^\]]+)\]', deal.get("title", ""))
                 brand = m.group(1) if m else ""
             query = re.sub(r'^\[[^\]]+\]\s*', '', deal.get("title", ""))
-            stats = get_price_stats(sb, brand, query)
+            stats = await db.run_db(get_price_stats, sb, brand, query)
             trust = calc_trust_score(
                 int(deal.get("sale_price", 0)),
                 stats,
@@ -277,14 +250,12 @@ async def get_deal(deal_id: int):
             try:
                 import hashlib
                 product_key = hashlib.md5(f"{brand}|{query}".encode()).hexdigest()[:16]
-                rows = (
+                rows = (await db.aexecute(
                     sb.table("price_history")
                     .select("price,recorded_at")
                     .eq("product_key", product_key)
                     .order("recorded_at")
-                    .execute()
-                    .data
-                ) or []
+                )).data or []
                 chart_data = []
                 for r in rows:
                     dt = r["recorded_at"][:10]   # "2026-02-19"
@@ -302,7 +273,7 @@ async def get_deal(deal_id: int):
 @router.post("/{deal_id}/upvote")
 @limiter.limit("10/minute")  # IP당 1분에 10회 제한
 async def upvote_deal(request: Request, deal_id: int):
-    result = db.upvote_deal(deal_id)
+    result = await db.run_db(db.upvote_deal, deal_id)
     if not result:
         raise HTTPException(status_code=404, detail="딜을 찾을 수 없습니다")
     return result
@@ -329,7 +300,7 @@ async def submit_community_deal(
 
     # pending으로 저장 — 심사 전 노출 금지
     sb = db.get_supabase()
-    res = sb.table("deals").insert({
+    res = await db.aexecute(sb.table("deals").insert({
         "title": deal_data.title,
         "description": deal_data.description,
         "original_price": orig,
@@ -343,7 +314,7 @@ async def submit_community_deal(
         "status": "pending",
         "is_hot": False,
         "admin_note": "제보 대기 — 자동 가격 검증 중",
-    }).execute()
+    }))
     deal = res.data[0]
 
     # 백그라운드: 자동 가격 검증
@@ -354,7 +325,7 @@ async def submit_community_deal(
 
 @router.patch("/{deal_id}/expire")
 async def expire_deal(deal_id: int):
-    result = db.expire_deal(deal_id)
+    result = await db.run_db(db.expire_deal, deal_id)
     if not result:
         raise HTTPException(status_code=404, detail="딜을 찾을 수 없습니다")
     return {"id": deal_id, "status": "expired"}
@@ -366,7 +337,7 @@ async def sync_naver_deals():
     deals_data = await collect_real_deals(limit_per_keyword=8)
     created = 0
     for item in deals_data:
-        if db.deal_url_exists(item["product_url"]):
+        if await db.run_db(db.deal_url_exists, item["product_url"]):
             continue
         orig = item.get("original_price", 0)
         sale = item.get("sale_price", 0)
@@ -375,7 +346,7 @@ async def sync_naver_deals():
         discount_rate = round((1 - sale / orig) * 100, 1)
         if discount_rate < 10:
             continue
-        db.create_deal({
+        await db.run_db(db.create_deal, {
             "title": item["title"],
             "original_price": orig,
             "sale_price": sale,
@@ -385,7 +356,6 @@ async def sync_naver_deals():
             "source": "naver",
             "category": item.get("category", "기타"),
             "status": "active",
-            "is_hot": discount_rate >= 40,
         })
         created += 1
     return {"synced": created, "message": f"{created}개 네이버 딜 동기화 완료"}
@@ -411,7 +381,7 @@ async def sync_coupang_deals():
     deals_data = await get_best_deals(limit=30)
     created = 0
     for item in deals_data:
-        if db.deal_url_exists(item["product_url"]):
+        if await db.run_db(db.deal_url_exists, item["product_url"]):
             continue
         orig = item.get("original_price", 0)
         sale = item.get("sale_price", 0)
@@ -420,7 +390,7 @@ async def sync_coupang_deals():
         discount_rate = round((1 - sale / orig) * 100, 1)
         if discount_rate < 5:
             continue
-        db.create_deal({
+        await db.run_db(db.create_deal, {
             "title": item["title"],
             "original_price": orig,
             "sale_price": sale,
@@ -430,7 +400,6 @@ async def sync_coupang_deals():
             "affiliate_url": item.get("affiliate_url"),
             "source": "coupang",
             "status": "active",
-            "is_hot": discount_rate >= 40,
         })
         created += 1
     return {"synced": created, "message": f"{created}개 쿠팡 딜 동기화 완료"}
@@ -459,9 +428,11 @@ async def sync_quasarzone_deals():
     await _sync_quasarzone()
     # DB에서 최근 퀘이사존 딜 확인
     sb = db.get_supabase()
-    recent = sb.table("deals").select("id,title,created_at") \
-        .ilike("submitter_name", "%퀘이사존%") \
-        .order("created_at", desc=True).limit(5).execute()
+    recent = await db.aexecute(
+        sb.table("deals").select("id,title,created_at")
+        .ilike("submitter_name", "%퀘이사존%")
+        .order("created_at", desc=True).limit(5)
+    )
     return {
         "message": "퀘이사존 동기화 완료",
         "recent_deals": len(recent.data),
@@ -474,7 +445,8 @@ async def _convert_to_affiliate_bg(product_url: str, payload: dict):
     affiliate_url = await get_affiliate_link(product_url)
     if affiliate_url and affiliate_url != product_url:
         sb = db.get_supabase()
-        sb.table("deals").update({"affiliate_url": affiliate_url}).eq("product_url", product_url).execute()
+        await db.aexecute(sb.table("deals").update({"affiliate_url": affiliate_url}).eq("product_url", product_url))
+        db.bump_data_version()
 
 
 async def _fetch_naver_image(title: str) -> Optional[str]:
@@ -513,18 +485,20 @@ async def _verify_submitted_deal(deal_id: int, product_url: str, submitted_price
     sb = db.get_supabase()
 
     async def _set_note(note: str, status: str = "pending"):
-        sb.table("deals").update({"admin_note": note, "status": status}).eq("id", deal_id).execute()
+        await db.run_db(db.update_deal_fields, deal_id, {"admin_note": note, "status": status})
 
     try:
         # 0) 이미지 자동 주입 (없는 경우) + 이미 만료된 딜 스킵
-        deal_row = sb.table("deals").select("title, image_url, status").eq("id", deal_id).limit(1).execute().data
+        deal_row = (await db.aexecute(
+            sb.table("deals").select("title, image_url, status").eq("id", deal_id).limit(1)
+        )).data
         if deal_row and deal_row[0].get("status") in ("expired", "rejected"):
             return  # 이미 만료/거부된 딜 → 검증 스킵
         if deal_row and not (deal_row[0].get("image_url") or ""):
             title = deal_row[0].get("title", "")
             image = await _fetch_naver_image(title)
             if image:
-                sb.table("deals").update({"image_url": image}).eq("id", deal_id).execute()
+                await db.run_db(db.update_deal_fields, deal_id, {"image_url": image})
 
         # 1) 쿠팡/네이버/일반 쇼핑몰 URL — httpx로 페이지 가져와서 가격 파싱 시도
         actual_price = None
@@ -580,9 +554,9 @@ async def report_deal(request: Request, deal_id: int):
     from fastapi import HTTPException
     sb = db.get_supabase()
     try:
-        deal = sb.table("deals").select("id,report_count,status").eq("id", deal_id).limit(1).execute().data
+        deal = (await db.aexecute(sb.table("deals").select("id,report_count,status").eq("id", deal_id).limit(1))).data
     except Exception:
-        deal = sb.table("deals").select("id,status").eq("id", deal_id).limit(1).execute().data
+        deal = (await db.aexecute(sb.table("deals").select("id,status").eq("id", deal_id).limit(1))).data
 
     if not deal:
         raise HTTPException(status_code=404, detail="딜을 찾을 수 없습니다")
@@ -600,10 +574,12 @@ async def report_deal(request: Request, deal_id: int):
 
     if patch:
         try:
-            sb.table("deals").update(patch).eq("id", deal_id).execute()
+            await db.aexecute(sb.table("deals").update(patch).eq("id", deal_id))
         except Exception:
             # report_count 컬럼 없을 경우 status만 업데이트
             if "status" in patch:
-                sb.table("deals").update({"status": patch["status"]}).eq("id", deal_id).execute()
+                await db.aexecute(sb.table("deals").update({"status": patch["status"]}).eq("id", deal_id))
+        if "status" in patch:
+            db.bump_data_version()
 
     return {"reported": True, "report_count": new_count, "hidden": new_count >= 3}
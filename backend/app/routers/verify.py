@@ -9,7 +9,7 @@ router = APIRouter(prefix="/api/verify", tags=["verify"])
 @router.post("/run")
 async def run_price_verification():
     cutoff = (datetime.utcnow() - timedelta(minutes=55)).isoformat()
-    deals = db.get_deals_for_verify(cutoff)
+    deals = await db.run_db(db.get_deals_for_verify, cutoff)
 
     results = {"checked": 0, "ok": 0, "price_changed": 0, "expired": 0, "url_dead": 0}
 
@@ -46,7 +46,7 @@ async def run_price_verification():
                 patch["verify_fail_count"] = 0
                 results["ok"] += 1
 
-            db.update_deal_verify(deal["id"], patch)
+            await db.run_db(db.update_deal_verify, deal["id"], patch)
         except Exception as e:
             print(f"검증 오류 #{deal.get('id')}: {e}")
 
@@ -55,7 +55,7 @@ async def run_price_verification():
 
 @router.post("/{deal_id}")
 async def verify_single(deal_id: int):
-    deal = db.get_deal_by_id(deal_id)
+    deal = await db.run_db(db.get_deal_by_id, deal_id, "verify")
     if not deal:
         return {"error": "딜 없음"}
 
@@ -78,13 +78,13 @@ async def verify_single(deal_id: int):
         patch["status"] = "active"
         patch["verify_fail_count"] = 0
 
-    db.update_deal_verify(deal_id, patch)
+    await db.run_db(db.update_deal_verify, deal_id, patch)
     return {"id": deal_id, "action": action, **patch}
 
 
 @router.get("/status")
 async def verify_status():
-    stats = db.get_stats()
+    stats = await db.run_db(db.get_stats)
     return {
         "summary": {
             "active": stats["total_deals"] - stats.get("expired", 0) - stats.get("price_changed", 0),
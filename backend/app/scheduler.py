@@ -3,16 +3,42 @@ APScheduler 백그라운드 자동 작업
 - 매 10분  : 쿠팡 딜 sync + 가격 검증
 - 매 1시간 : 네이버 딜 sync
 - 매 1시간 : 가격 검증 (등록된 딜 현재 가격 체크 → 가격 오르면 자동 비활성)
+
+배포 모드 (settings.SCHEDULER_MODE) → 프로세스 역할(role)
+- all    : API 프로세스가 모든 잡 실행 (단일 인스턴스, 기본값)           → API role "all"
+- worker : 수집/검증 잡은 워커 프로세스(app/worker.py)가 실행             → API role "api", 워커 role "worker"
+           API 는 인스턴스 로컬 캐시 잡(LOCAL_JOBS)만 실행
+- off    : 수집/검증 잡 없음 (워커도 띄우지 않음)                          → API role "api"
+           인스턴스 로컬 잡은 계속 실행 — 이벤트 롤업/스케치 카운터가 메모리에 무한 누적되지 않도록
 """
 import asyncio
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.services import job_lock, job_metrics
+
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
+EXPIRY_CHECK_CONCURRENCY = 8  # 원글 만료체크 전체 동시 요청 수
+
+SCHEDULER_MODES = ("all", "worker", "off")
+ROLES = ("all", "api", "worker")
+
+# 인스턴스 메모리 상태를 다루는 잡 — 요청을 받는 API 프로세스마다 실행되어야 함
+LOCAL_JOBS = {
+    "flush_event_rollups",
+    "persist_event_sketches",
+    "refresh_keyword_stats",
+    "rebuild_brand_index",
+    "refresh_related_deals",
+    "refresh_rankings",
+}
+# 모든 모드 공통 (프로세스 간 데이터 버전 공유)
+SHARED_JOBS = {"sync_data_version"}
+
 
 async def _sync_coupang():
     # 쿠팡 파트너스 API 승인 전까지 비활성화
@@ -30,7 +56,7 @@ async def _sync_naver():
         deals_data = await collect_real_deals(limit_per_keyword=5)
         created = skipped = 0
         for item in deals_data:
-            if db.deal_url_exists(item["product_url"]):
+            if await db.run_db(db.deal_url_exists, item["product_url"]):
                 continue
             v = validator.validate_sync(item)
             if not v:
@@ -38,10 +64,10 @@ async def _sync_naver():
                 skipped += 1
                 continue
             # 제목+가격 중복 체크 (URL 달라도 동일 제품 방지)
-            if db.deal_duplicate_exists(item["title"], v.sale_price):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], v.sale_price):
                 skipped += 1
                 continue
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "original_price": v.original_price,
                 "sale_price": v.sale_price,
@@ -54,13 +80,14 @@ async def _sync_naver():
                 "is_hot": v.is_hot,
             })
             created += 1
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 네이버 sync: {created}개 저장 | {skipped}개 제외")
     except Exception as e:
         logger.error(f"❌ 네이버 sync: {e}")
 
 
 async def _sync_ppomppu():
-    """뽐뿌 핫딜 RSS 수집 — 10분마다 (Playwright 없이, 클리앙 패턴)"""
+    """뽐뿌 핫딜 RSS 수집 — 기본 10분, 수율 따라 적응형 (Playwright 없이, 클리앙 패턴). 신규 저장 수 반환"""
     try:
         import app.db_supabase as db
         from app.services.ppomppu import fetch_ppomppu_deals
@@ -72,7 +99,7 @@ async def _sync_ppomppu():
             source_post_url = item.get("source_post_url", "")
 
             # 이미 수집된 원글 스킵
-            if source_post_url and db.deal_url_exists(source_post_url):
+            if source_post_url and await db.run_db(db.deal_url_exists, source_post_url):
                 skipped += 1
                 continue
 
@@ -80,7 +107,7 @@ async def _sync_ppomppu():
             is_free = sale == 0
 
             if is_free and source_post_url:
-                db.create_deal({
+                await db.run_db(db.create_deal, {
                     "title": item["title"],
                     "original_price": 0,
                     "sale_price": 0,
@@ -111,11 +138,11 @@ async def _sync_ppomppu():
                 skipped += 1
                 continue
 
-            if db.deal_duplicate_exists(item["title"], sale):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], sale):
                 skipped += 1
                 continue
 
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "description": item.get("description"),
                 "original_price": orig,
@@ -133,7 +160,9 @@ async def _sync_ppomppu():
             logger.info(f"  ✅ [뽐뿌] 저장: {item['title'][:35]} | -{discount_rate}%")
             created += 1
 
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 뽐뿌 sync: {created}개 저장 | {skipped}개 제외")
+        return created
     except Exception as e:
         logger.error(f"❌ 뽐뿌 sync: {e}")
 
@@ -154,10 +183,10 @@ async def _sync_naver_cafe():
 
         async with __import__("httpx").AsyncClient(timeout=8) as client:
             for item in deals_data:
-                if db.deal_url_exists(item.get("product_url", "")):
+                if await db.run_db(db.deal_url_exists, item.get("product_url", "")):
                     skipped += 1
                     continue
-                if db.deal_duplicate_exists(item["title"], item.get("sale_price", 0)):
+                if await db.run_db(db.deal_duplicate_exists, item["title"], item.get("sale_price", 0)):
                     skipped += 1
                     continue
 
@@ -174,7 +203,7 @@ async def _sync_naver_cafe():
                     skipped += 1
                     continue
 
-                db.create_deal({
+                await db.run_db(db.create_deal, {
                     "title": item["title"],
                     "description": item.get("description"),
                     "original_price": price_check.naver_hprice or price_check.naver_lprice,
@@ -196,6 +225,19 @@ async def _sync_naver_cafe():
         logger.error(f"❌ 정가거부 카페 sync: {e}")
 
 
+async def _scrape_retailer_prices(deals: list) -> dict:
+    """검증 대상 딜의 쇼핑몰 현재가 배치 크롤링 (product_url → 가격) — 실패/미지원 쇼핑몰은 제외"""
+    from app.services.price_scrapers import get_actual_prices
+    prices = {}
+    try:
+        async for url, result in get_actual_prices(d.get("product_url") for d in deals):
+            if result is not None and result.price:
+                prices[url] = float(result.price)
+    except Exception as e:
+        logger.warning(f"  쇼핑몰 가격 배치 크롤링 실패 — 네이버 검증으로 진행: {e}")
+    return prices
+
+
 async def _verify_prices():
     logger.info("🔍 가격 검증 시작...")
     try:
@@ -203,11 +245,13 @@ async def _verify_prices():
         from app.services.price_checker import verify_deal, MAX_FAIL_COUNT
         from datetime import datetime, timedelta
         cutoff = (datetime.utcnow() - timedelta(minutes=8)).isoformat()
-        deals = db.get_deals_for_verify(cutoff)
+        deals = await db.run_db(db.get_deals_for_verify, cutoff)
         logger.info(f"  검증 대상: {len(deals)}개")
         from app.services.price_scrapers import RealtimePriceChecker
         from app.config import settings
         rt_checker = RealtimePriceChecker(settings.NAVER_CLIENT_ID, settings.NAVER_CLIENT_SECRET)
+        actual_prices = await _scrape_retailer_prices(deals)
+        logger.info(f"  쇼핑몰 현재가 확보: {len(actual_prices)}개")
 
         ok = changed = expired_count = 0
         async with __import__("httpx").AsyncClient(timeout=8) as hclient:
@@ -222,11 +266,11 @@ async def _verify_prices():
                     )
                     if rt["action"] == "expired":
                         logger.info(f"  🛑 커뮤니티 딜 소진: {deal['title'][:40]} | {rt['reason']}")
-                        db.update_deal_verify(deal["id"], {"status": "expired", "verify_fail_count": 0})
+                        await db.run_db(db.update_deal_verify, deal["id"], {"status": "expired", "verify_fail_count": 0})
                         expired_count += 1
                         continue
 
-                check = await verify_deal(deal)
+                check = await verify_deal(deal, actual_prices.get(deal.get("product_url")))
                 patch = {"last_verified_at": check["last_verified_at"].isoformat()}
                 if check["verified_price"] is not None:
                     patch["verified_price"] = check["verified_price"]
@@ -276,16 +320,17 @@ async def _verify_prices():
                 current_price = check.get("verified_price")
                 if current_price is not None:
                     try:
-                        db.get_supabase().table("deal_price_log").insert({
+                        await db.aexecute(db.get_supabase().table("deal_price_log").insert({
                             "deal_id": deal["id"],
                             "price": int(current_price),
                             "source": "verify"
-                        }).execute()
+                        }))
                     except Exception:
                         pass
-                db.update_deal_verify(deal["id"], patch)
+                await db.run_db(db.update_deal_verify, deal["id"], patch)
             except Exception as e:
                 logger.error(f"  딜 #{deal.get('id')} 검증 오류: {e}")
+        job_metrics.add(checked=len(deals), ok=ok, changed=changed, expired=expired_count)
         logger.info(f"✅ 가격 검증 완료 — 정상:{ok} 변동:{changed} 만료:{expired_count}")
     except Exception as e:
         logger.error(f"❌ 가격 검증 오류: {e}")
@@ -300,7 +345,7 @@ async def _sync_brand_deals():
         deals_data = await collect_brand_deals(min_discount=10)
         created = skipped = 0
         for item in deals_data:
-            if db.deal_url_exists(item["product_url"]):
+            if await db.run_db(db.deal_url_exists, item["product_url"]):
                 continue
             v = validator.validate_sync(item)
             if not v:
@@ -308,10 +353,10 @@ async def _sync_brand_deals():
                 skipped += 1
                 continue
             # 제목+가격 중복 체크
-            if db.deal_duplicate_exists(item["title"], v.sale_price):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], v.sale_price):
                 skipped += 1
                 continue
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "description": item.get("description"),
                 "original_price": v.original_price,
@@ -326,6 +371,7 @@ async def _sync_brand_deals():
                 "submitter_name": item.get("brand", ""),
             })
             created += 1
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 브랜드딜 sync: {created}개 저장 | {skipped}개 제외")
     except Exception as e:
         logger.error(f"❌ 브랜드딜 sync: {e}")
@@ -338,14 +384,90 @@ async def _expire_old_deals():
         from datetime import datetime, timezone, timedelta
         cutoff = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
         sb = db.get_supabase()
-        result = sb.table("deals").update({"status": "expired"}).eq("status", "active").lt("created_at", cutoff).execute()
+        result = await db.aexecute(
+            sb.table("deals").update({"status": "expired"}).eq("status", "active").lt("created_at", cutoff)
+        )
         count = len(result.data) if result.data else 0
         if count:
+            db.bump_data_version()
             logger.info(f"✅ 오래된 딜 만료: {count}개")
     except Exception as e:
         logger.error(f"❌ 딜 만료 처리 오류: {e}")
 
 
+async def _flush_event_rollups():
+    """1분마다: 메모리 이벤트 롤업 카운터 → event_rollup_* 테이블 가산"""
+    try:
+        import app.db_supabase as db
+        from app.services import event_rollup
+        await db.run_db(event_rollup.flush)
+    except Exception as e:
+        logger.error(f"❌ 이벤트 롤업 flush 오류: {e}")
+
+
+async def _persist_event_sketches():
+    """1분마다: Top-K / HLL 스트리밍 스케치 변경분 → event_sketches 저장"""
+    try:
+        import app.db_supabase as db
+        from app.services import heavy_hitters, hyperloglog  # noqa: F401 — 스케치 등록
+        from app.services import sketch_store
+        await db.run_db(sketch_store.persist_all)
+    except Exception as e:
+        logger.error(f"❌ 스케치 저장 오류: {e}")
+
+
+async def _refresh_keyword_stats():
+    """5분마다: 인기 검색어 × 카탈로그 → 키워드별 최고 할인율/최저가 테이블 재계산"""
+    try:
+        import app.db_supabase as db
+        from app.services import keyword_stats
+        count = await db.run_db(keyword_stats.refresh)
+        logger.info(f"✅ 인기 검색어 통계 갱신: {count}개")
+    except Exception as e:
+        logger.error(f"❌ 인기 검색어 통계 갱신 오류: {e}")
+
+
+async def _rebuild_brand_index():
+    """10분마다: 브랜드 인덱스 전체 재빌드 (데이터 변경 없으면 생략)"""
+    try:
+        import app.db_supabase as db
+        from app.services import brand_index
+        await db.run_db(brand_index.rebuild)
+    except Exception as e:
+        logger.error(f"❌ 브랜드 인덱스 재빌드 오류: {e}")
+
+
+async def _refresh_related_deals():
+    """10분마다: 카탈로그 변경 시 연관 딜 추천 재계산"""
+    try:
+        import app.db_supabase as db
+        from app.services import recommendations
+        await db.run_db(recommendations.refresh)
+    except Exception as e:
+        logger.error(f"❌ 연관 딜 계산 오류: {e}")
+
+
+async def _refresh_rankings():
+    """5분마다: 핫딜/트렌딩/주간 TOP 랭킹 재계산 (시간 감쇠 반영)"""
+    try:
+        import app.db_supabase as db
+        from app.services import ranker
+        await db.run_db(ranker.refresh)
+    except Exception as e:
+        logger.error(f"❌ 랭킹 계산 오류: {e}")
+
+
+async def _compact_event_rollups():
+    """1시간마다: 최근 48시간 완결 구간 롤업을 event_logs 원본 기준으로 재계산"""
+    try:
+        import app.db_supabase as db
+        from app.services import event_rollup
+        await db.run_db(event_rollup.compact)
+        logger.info("✅ 이벤트 롤업 compaction 완료")
+    except Exception as e:
+        logger.error(f"❌ 이벤트 롤업 compaction 오류: {e}")
+
+
 async def _sync_clien():
     """클리앙 핫딜 RSS 수집 — 2시간마다"""
     try:
@@ -359,12 +481,12 @@ async def _sync_clien():
             source_post_url = item.get("source_post_url", "")
 
             # 이미 수집된 원글 스킵
-            if source_post_url and db.deal_url_exists(source_post_url):
+            if source_post_url and await db.run_db(db.deal_url_exists, source_post_url):
                 skipped += 1
                 continue
 
             product_url = item.get("product_url", "")
-            if product_url and db.deal_url_exists(product_url):
+            if product_url and await db.run_db(db.deal_url_exists, product_url):
                 skipped += 1
                 continue
 
@@ -372,7 +494,7 @@ async def _sync_clien():
             is_free = sale == 0
 
             if is_free and source_post_url:
-                db.create_deal({
+                await db.run_db(db.create_deal, {
                     "title": item["title"],
                     "original_price": 0,
                     "sale_price": 0,
@@ -404,11 +526,11 @@ async def _sync_clien():
                 skipped += 1
                 continue
 
-            if db.deal_duplicate_exists(item["title"], sale):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], sale):
                 skipped += 1
                 continue
 
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "description": item.get("description"),
                 "original_price": orig,
@@ -426,7 +548,9 @@ async def _sync_clien():
             logger.info(f"  ✅ [클리앙] 저장: {item['title'][:35]} | -{discount_rate}%")
             created += 1
 
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 클리앙 sync: {created}개 저장 | {skipped}개 제외")
+        return created
     except Exception as e:
         logger.error(f"❌ 클리앙 sync: {e}")
 
@@ -444,12 +568,12 @@ async def _sync_eomisae():
             source_post_url = item.get("source_post_url", "")
 
             # 이미 수집된 원글 스킵
-            if source_post_url and db.deal_url_exists(source_post_url):
+            if source_post_url and await db.run_db(db.deal_url_exists, source_post_url):
                 skipped += 1
                 continue
 
             product_url = item.get("product_url", "")
-            if product_url and db.deal_url_exists(product_url):
+            if product_url and await db.run_db(db.deal_url_exists, product_url):
                 skipped += 1
                 continue
 
@@ -468,11 +592,11 @@ async def _sync_eomisae():
                 skipped += 1
                 continue
 
-            if db.deal_duplicate_exists(item["title"], sale):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], sale):
                 skipped += 1
                 continue
 
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "description": item.get("description"),
                 "original_price": orig,
@@ -490,7 +614,9 @@ async def _sync_eomisae():
             logger.info(f"  ✅ [어미새] 저장: {item['title'][:35]} | -{discount_rate}%")
             created += 1
 
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 어미새 sync: {created}개 저장 | {skipped}개 제외")
+        return created
     except Exception as e:
         logger.error(f"❌ 어미새 sync: {e}")
 
@@ -499,6 +625,7 @@ async def _sync_ruliweb():
     """루리웹 핫딜 RSS 수집 — 2시간마다"""
     try:
         import app.db_supabase as db
+        from app.config import settings
         from app.services.ruliweb import fetch_ruliweb_deals
 
         deals_data = await fetch_ruliweb_deals()
@@ -507,12 +634,12 @@ async def _sync_ruliweb():
         for item in deals_data:
             source_post_url = item.get("source_post_url", "")
 
-            if source_post_url and db.deal_url_exists(source_post_url):
+            if source_post_url and await db.run_db(db.deal_url_exists, source_post_url):
                 skipped += 1
                 continue
 
             product_url = item.get("product_url", "")
-            if product_url and db.deal_url_exists(product_url):
+            if product_url and await db.run_db(db.deal_url_exists, product_url):
                 skipped += 1
                 continue
 
@@ -531,11 +658,11 @@ async def _sync_ruliweb():
                 skipped += 1
                 continue
 
-            if db.deal_duplicate_exists(item["title"], sale):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], sale):
                 skipped += 1
                 continue
 
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "description": item.get("description"),
                 "original_price": orig,
@@ -547,13 +674,15 @@ async def _sync_ruliweb():
                 "source": "community",
                 "category": item.get("category", "기타"),
                 "status": "active",
-                "is_hot": discount_rate >= 40,
+                "is_hot": discount_rate >= settings.HOT_DISCOUNT_THRESHOLD,
                 "submitter_name": item.get("submitter_name", "루리웹"),
             })
             logger.info(f"  ✅ [루리웹] 저장: {item['title'][:35]} | -{discount_rate}%")
             created += 1
 
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 루리웹 sync: {created}개 저장 | {skipped}개 제외")
+        return created
     except Exception as e:
         logger.error(f"❌ 루리웹 sync: {e}")
 
@@ -562,6 +691,7 @@ async def _sync_quasarzone():
     """퀘이사존 핫딜 HTML 수집 — 2시간마다"""
     try:
         import app.db_supabase as db
+        from app.config import settings
         from app.services.quasarzone import fetch_quasarzone_deals
 
         deals_data = await fetch_quasarzone_deals()
@@ -570,12 +700,12 @@ async def _sync_quasarzone():
         for item in deals_data:
             source_post_url = item.get("source_post_url", "")
 
-            if source_post_url and db.deal_url_exists(source_post_url):
+            if source_post_url and await db.run_db(db.deal_url_exists, source_post_url):
                 skipped += 1
                 continue
 
             product_url = item.get("product_url", "")
-            if product_url and db.deal_url_exists(product_url):
+            if product_url and await db.run_db(db.deal_url_exists, product_url):
                 skipped += 1
                 continue
 
@@ -594,11 +724,11 @@ async def _sync_quasarzone():
                 skipped += 1
                 continue
 
-            if db.deal_duplicate_exists(item["title"], sale):
+            if await db.run_db(db.deal_duplicate_exists, item["title"], sale):
                 skipped += 1
                 continue
 
-            db.create_deal({
+            await db.run_db(db.create_deal, {
                 "title": item["title"],
                 "description": item.get("description"),
                 "original_price": orig,
@@ -610,19 +740,21 @@ async def _sync_quasarzone():
                 "source": "community",
                 "category": item.get("category", "기타"),
                 "status": "active",
-                "is_hot": discount_rate >= 40,
+                "is_hot": discount_rate >= settings.HOT_DISCOUNT_THRESHOLD,
                 "submitter_name": item.get("submitter_name", "퀘이사존"),
             })
             logger.info(f"  ✅ [퀘이사존] 저장: {item['title'][:35]} | -{discount_rate}%")
             created += 1
 
+        job_metrics.add(fetched=len(deals_data), created=created, skipped=skipped)
         logger.info(f"✅ 퀘이사존 sync: {created}개 저장 | {skipped}개 제외")
+        return created
     except Exception as e:
         logger.error(f"❌ 퀘이사존 sync: {e}")
 
 
 async def _sync_algumon():
-    """알구몬 API로 커뮤니티 딜 수집 (뽐뿌+루리웹+어미새+아카라이브)"""
+    """알구몬 API로 커뮤니티 딜 수집 (뽐뿌+루리웹+어미새+아카라이브). 신규 저장 수 반환"""
     try:
         import app.db_supabase as db
         from app.services.algumon import fetch_algumon_deals, fetch_ruliweb_deals, process_algumon_deals
@@ -630,7 +762,9 @@ async def _sync_algumon():
 
         # 최근 등록된 커뮤니티 딜 URL 목록 (중복 방지)
         sb = db.get_supabase()
-        recent = sb.table("deals").select("product_url").eq("source", "community").limit(300).execute()
+        recent = await db.aexecute(
+            sb.table("deals").select("product_url").eq("source", "community").limit(300)
+        )
         existing_urls = {r["product_url"] for r in (recent.data or []) if r.get("product_url")}
 
         # 알구몬 5페이지 (50개) + 루리웹 RSS 병렬 수집
@@ -644,7 +778,7 @@ async def _sync_algumon():
         if isinstance(ruliweb_raw, list): raw.extend(ruliweb_raw)
 
         if not raw:
-            return
+            return 0
 
         logger.info(f"[알구몬] 원본 {len(raw)}개 수집")
         processed = await process_algumon_deals(raw, existing_urls)
@@ -657,7 +791,7 @@ async def _sync_algumon():
                 if not deal_data.get("category") or deal_data["category"] == "기타":
                     deal_data["category"] = infer_category(deal_data["title"])
 
-                db.create_deal({
+                await db.run_db(db.create_deal, {
                     "title": deal_data["title"],
                     "sale_price": deal_data["sale_price"],
                     "original_price": deal_data["original_price"],
@@ -676,8 +810,10 @@ async def _sync_algumon():
                 if "duplicate" not in str(e).lower() and "unique" not in str(e).lower():
                     logger.warning(f"[알구몬] 등록 오류: {e}")
 
+        job_metrics.add(fetched=len(raw), filtered=len(processed), created=saved)
         if saved:
             logger.info(f"✅ 알구몬 {saved}개 등록 완료")
+        return saved
 
     except Exception as e:
         logger.error(f"❌ 알구몬 동기화 오류: {e}")
@@ -691,34 +827,36 @@ async def _check_community_deal_expiry():
         import asyncio
 
         # 등록 후 1시간 이상 된 활성 딜 전체 체크 (source_post_url 있는 것)
-        deals = db.get_community_deals_for_expiry_check(hours_since_created=1)
+        deals = await db.run_db(db.get_community_deals_for_expiry_check, hours_since_created=1)
         if not deals:
             return
 
         logger.info(f"[원글 만료체크] {len(deals)}개 딜 확인 시작")
         expired_count = 0
 
-        async def check_one(deal):
+        sem = asyncio.Semaphore(EXPIRY_CHECK_CONCURRENCY)
+
+        async def check_one(deal, client):
             nonlocal expired_count
             url = deal.get("source_post_url", "")
             if not url:
                 return
-            is_expired, reason = await check_deal_expired_from_url(url)
+            async with sem:
+                is_expired, reason = await check_deal_expired_from_url(url, client=client)
             if is_expired:
-                db.expire_deal(deal["id"])
-                # admin_note 업데이트
-                db.get_supabase().table("deals").update({
-                    "admin_note": f"[자동만료] 원글 종료 감지: {reason}"
-                }).eq("id", deal["id"]).execute()
+                await db.run_db(db.expire_deal, deal["id"], f"[자동만료] 원글 종료 감지: {reason}")
                 expired_count += 1
                 logger.info(f"  ✅ 만료처리: {deal['title'][:30]} ({reason})")
 
-        # 동시에 최대 5개씩 체크 (과도한 요청 방지)
-        for i in range(0, len(deals), 5):
-            batch = deals[i:i+5]
-            await asyncio.gather(*[check_one(d) for d in batch])
-            await asyncio.sleep(1)
+        # 전체 동시 EXPIRY_CHECK_CONCURRENCY 개 — 호스트별 간격/동시성은 host_guard 가 조율
+        async with __import__("httpx").AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; JunggaPagoe-bot/1.0)"},
+        ) as client:
+            await asyncio.gather(*[check_one(d, client) for d in deals])
 
+        job_metrics.add(checked=len(deals), expired=expired_count)
         if expired_count:
             logger.info(f"[커뮤니티 만료체크] 완료: {expired_count}/{len(deals)}개 만료")
 
@@ -754,8 +892,72 @@ async def _run_kream_sync():
         logger.error(f"❌ KREAM 동기화 오류: {e}")
 
 
-def start_scheduler():
-    """스케줄러 시작"""
+async def _sync_data_version():
+    """10초마다: 딜 데이터 버전 프로세스 간 공유 (워커 수집 → API 캐시 무효화)"""
+    try:
+        import app.db_supabase as db
+        from app.services import data_version_sync
+        await db.run_db(data_version_sync.sync)
+    except Exception as e:
+        logger.warning(f"[데이터버전] 동기화 실패: {e}")
+
+
+async def _prune_job_runs():
+    """1일마다: 14일 지난 잡 실행 이력 삭제"""
+    try:
+        import app.db_supabase as db
+        await db.run_db(db.prune_job_runs, 14)
+    except Exception as e:
+        logger.error(f"❌ 잡 실행 이력 정리 오류: {e}")
+
+
+def _adaptive(job_id: str, fn):
+    """수집 잡 래퍼 — 신규 저장 수로 다음 주기 재계산 후 reschedule (services/adaptive_schedule)"""
+    async def run():
+        from app.config import settings
+        from app.services import adaptive_schedule
+
+        new_items = await fn()
+        if new_items is None or not settings.ADAPTIVE_SCHEDULING:
+            return  # 실패(예외 로그됨) — 주기 유지
+        before = adaptive_schedule.current_interval(job_id)
+        minutes = adaptive_schedule.record_run(job_id, new_items)
+        if minutes != before:
+            scheduler.reschedule_job(job_id, trigger=IntervalTrigger(minutes=minutes))
+            logger.info(f"[적응형 주기] {job_id}: {before:g}분 → {minutes:g}분 (신규 {new_items}개)")
+
+    run.__name__ = fn.__name__
+    return run
+
+
+def _adaptive_trigger(job_id: str) -> IntervalTrigger:
+    from app.services import adaptive_schedule
+    return IntervalTrigger(minutes=adaptive_schedule.current_interval(job_id))
+
+
+def _job_enabled(job_id: str, role: str) -> bool:
+    if job_id in SHARED_JOBS or role == "all":
+        return True
+    if role == "api":
+        return job_id in LOCAL_JOBS
+    return job_id not in LOCAL_JOBS  # worker
+
+
+def api_role() -> str:
+    """API 프로세스 역할 — SCHEDULER_MODE 기준 (worker / off 모두 로컬 잡만)"""
+    from app.config import settings
+    mode = settings.SCHEDULER_MODE
+    if mode not in SCHEDULER_MODES:
+        raise ValueError(f"SCHEDULER_MODE must be one of {SCHEDULER_MODES}: {mode}")
+    return {"all": "all", "worker": "api", "off": "api"}[mode]
+
+
+def start_scheduler(role: str = None, paused: bool = False):
+    """스케줄러 시작 — role 미지정 시 API 프로세스 역할. paused=True 면 잡 실행 보류 (워커 leader 대기)"""
+    role = role or api_role()
+    if role not in ROLES:
+        raise ValueError(f"role must be one of {ROLES}: {role}")
+
     # 철칙 위반 딜 자동 만료 (5분마다)
     scheduler.add_job(
         _cleanup_invalid_deals,
@@ -779,10 +981,10 @@ def start_scheduler():
         replace_existing=True,
     )
     scheduler.add_job(
-        _sync_ppomppu,
-        trigger=IntervalTrigger(minutes=10),
+        _adaptive("sync_ppomppu", _sync_ppomppu),
+        trigger=_adaptive_trigger("sync_ppomppu"),
         id="sync_ppomppu",
-        name="뽐뿌 핫딜 자동 동기화 (10m)",
+        name="뽐뿌 핫딜 자동 동기화 (적응형, 기본 10m)",
         replace_existing=True,
     )
     scheduler.add_job(
@@ -814,38 +1016,38 @@ def start_scheduler():
         replace_existing=True,
     )
     scheduler.add_job(
-        _sync_clien,
-        trigger=IntervalTrigger(hours=2),
+        _adaptive("sync_clien", _sync_clien),
+        trigger=_adaptive_trigger("sync_clien"),
         id="sync_clien",
-        name="클리앙 핫딜 RSS 동기화 (2h)",
+        name="클리앙 핫딜 RSS 동기화 (적응형, 기본 2h)",
         replace_existing=True,
     )
     scheduler.add_job(
-        _sync_eomisae,
-        trigger=IntervalTrigger(hours=2),
+        _adaptive("sync_eomisae", _sync_eomisae),
+        trigger=_adaptive_trigger("sync_eomisae"),
         id="sync_eomisae",
-        name="어미새 인기정보 RSS 동기화 (2h)",
+        name="어미새 인기정보 RSS 동기화 (적응형, 기본 2h)",
         replace_existing=True,
     )
     scheduler.add_job(
-        _sync_ruliweb,
-        trigger=IntervalTrigger(hours=2),
+        _adaptive("sync_ruliweb", _sync_ruliweb),
+        trigger=_adaptive_trigger("sync_ruliweb"),
         id="sync_ruliweb",
-        name="루리웹 핫딜 RSS 동기화 (2h)",
+        name="루리웹 핫딜 RSS 동기화 (적응형, 기본 2h)",
         replace_existing=True,
     )
     scheduler.add_job(
-        _sync_quasarzone,
-        trigger=IntervalTrigger(hours=2),
+        _adaptive("sync_quasarzone", _sync_quasarzone),
+        trigger=_adaptive_trigger("sync_quasarzone"),
         id="sync_quasarzone",
-        name="퀘이사존 핫딜 HTML 동기화 (2h)",
+        name="퀘이사존 핫딜 HTML 동기화 (적응형, 기본 2h)",
         replace_existing=True,
     )
     scheduler.add_job(
-        _sync_algumon,
-        trigger=IntervalTrigger(minutes=20),
+        _adaptive("sync_algumon", _sync_algumon),
+        trigger=_adaptive_trigger("sync_algumon"),
         id="sync_algumon",
-        name="알구몬 커뮤니티 딜 동기화 (20m)",
+        name="알구몬 커뮤니티 딜 동기화 (적응형, 기본 20m)",
         replace_existing=True,
     )
     scheduler.add_job(
@@ -876,8 +1078,78 @@ def start_scheduler():
         name="KREAM 트렌딩 워치리스트 갱신 (주 1회)",
         replace_existing=True,
     )
-    scheduler.start()
-    msg = "🕐 스케줄러 시작: 워치리스트(30분) / 쿠팡(30분) / 네이버(1h) / 뽐뿌(30분) / 가격검증(1h) / 만료처리(6h)"
+    scheduler.add_job(
+        _flush_event_rollups,
+        trigger=IntervalTrigger(minutes=1),
+        id="flush_event_rollups",
+        name="이벤트 롤업 카운터 flush (1m)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _persist_event_sketches,
+        trigger=IntervalTrigger(minutes=1),
+        id="persist_event_sketches",
+        name="Top-K 스케치 저장 (1m)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _refresh_keyword_stats,
+        trigger=IntervalTrigger(minutes=5),
+        id="refresh_keyword_stats",
+        name="인기 검색어 통계 갱신 (5m)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _rebuild_brand_index,
+        trigger=IntervalTrigger(minutes=10),
+        id="rebuild_brand_index",
+        name="브랜드 인덱스 재빌드 (10m)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _refresh_related_deals,
+        trigger=IntervalTrigger(minutes=10),
+        id="refresh_related_deals",
+        name="연관 딜 추천 재계산 (10m)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _refresh_rankings,
+        trigger=IntervalTrigger(minutes=5),
+        id="refresh_rankings",
+        name="핫딜/트렌딩 랭킹 계산 (5m)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _compact_event_rollups,
+        trigger=IntervalTrigger(hours=1),
+        id="compact_event_rollups",
+        name="이벤트 롤업 재계산 (1h)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _prune_job_runs,
+        trigger=IntervalTrigger(hours=24),
+        id="prune_job_runs",
+        name="잡 실행 이력 정리 (1d)",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        _sync_data_version,
+        trigger=IntervalTrigger(seconds=10),
+        id="sync_data_version",
+        name="딜 데이터 버전 프로세스 간 동기화 (10s)",
+        replace_existing=True,
+    )
+    for job in scheduler.get_jobs():
+        if not _job_enabled(job.id, role):
+            job.remove()
+    # 인스턴스마다 도는 짧은 주기 잡은 job_runs 적재 제외 (링버퍼만)
+    job_metrics.instrument_all(scheduler, no_persist=LOCAL_JOBS | SHARED_JOBS)
+    # 인스턴스 로컬 잡 외에는 분산 락 — 레플리카/워커 여러 개여도 잡당 1곳에서만 실행
+    job_lock.guard_all(scheduler, exclude=LOCAL_JOBS | SHARED_JOBS)
+    scheduler.start(paused=paused)
+    msg = f"🕐 스케줄러 시작 [{role}]: 잡 {len(scheduler.get_jobs())}개" + (" (일시정지)" if paused else "")
     logger.info(msg)
     print(msg, flush=True)  # uvicorn stdout에도 출력
 
@@ -892,75 +1164,90 @@ async def _cleanup_invalid_deals():
     """5분마다: 할인율 0% or 식품/일상용품 커뮤니티 딜 자동 만료"""
     try:
         import app.db_supabase as db
+        from app.config import settings
         sb = db.get_supabase()
+        changed = 0
 
         # 1) 할인율 0% active 딜 — 커뮤니티 딜은 제외 (MSRP 없이 등록하는 방식)
-        res = sb.table("deals").select("id,title,discount_rate,category,source") \
-            .eq("status", "active") \
-            .eq("discount_rate", 0) \
-            .neq("source", "community") \
-            .execute()
+        res = await db.aexecute(
+            sb.table("deals").select("id,title,discount_rate,category,source")
+            .eq("status", "active")
+            .eq("discount_rate", 0)
+            .neq("source", "community")
+        )
         for d in (res.data or []):
             # 무료딜(sale_price=0)은 예외
-            sale_res = sb.table("deals").select("sale_price").eq("id", d["id"]).limit(1).execute()
+            sale_res = await db.aexecute(sb.table("deals").select("sale_price").eq("id", d["id"]).limit(1))
             sale = float((sale_res.data or [{}])[0].get("sale_price", 1) or 1)
             if sale > 0:  # 유료딜인데 할인율 0 → 만료
-                sb.table("deals").update({
+                await db.aexecute(sb.table("deals").update({
                     "status": "expired",
                     "admin_note": "[자동만료] 할인율 0%"
-                }).eq("id", d["id"]).execute()
+                }).eq("id", d["id"]))
+                changed += 1
                 logger.info(f"🗑 자동만료(0%): #{d['id']} {d['title'][:35]}")
 
         # 2) 식품/일상용품 커뮤니티 딜 — 카테고리 기반 + 타이틀 키워드 2중 검사
         from app.services.community_enricher import is_food_or_daily
         BLOCKED_CATS = ["식품", "유아동"]
-        res2 = sb.table("deals").select("id,title,category,source") \
-            .eq("status", "active") \
-            .eq("source", "community") \
-            .execute()
+        res2 = await db.aexecute(
+            sb.table("deals").select("id,title,category,source")
+            .eq("status", "active")
+            .eq("source", "community")
+        )
         for d in (res2.data or []):
             cat = d.get("category", "")
             title = d.get("title", "")
             if cat in BLOCKED_CATS or is_food_or_daily(title, cat):
-                sb.table("deals").update({
+                await db.aexecute(sb.table("deals").update({
                     "status": "expired",
                     "admin_note": f"[자동만료] 식품/일상용품 커뮤니티 딜 철칙위반"
-                }).eq("id", d["id"]).execute()
+                }).eq("id", d["id"]))
+                changed += 1
                 logger.info(f"🗑 자동만료(식품): #{d['id']} {d['title'][:35]}")
 
         # 3) 할인율 10% 미만 active 딜 만료 (비커뮤니티 딜만 — 커뮤니티는 MSRP 없이 등록)
-        res3 = sb.table("deals").select("id,title,discount_rate,sale_price,source") \
-            .eq("status", "active") \
-            .neq("source", "community") \
-            .gt("sale_price", 0) \
-            .lt("discount_rate", 10) \
-            .gt("discount_rate", 0) \
-            .execute()
+        res3 = await db.aexecute(
+            sb.table("deals").select("id,title,discount_rate,sale_price,source")
+            .eq("status", "active")
+            .neq("source", "community")
+            .gt("sale_price", 0)
+            .lt("discount_rate", 10)
+            .gt("discount_rate", 0)
+        )
+        changed += len(res3.data or [])
         for d in (res3.data or []):
-            sb.table("deals").update({
+            await db.aexecute(sb.table("deals").update({
                 "status": "expired",
                 "admin_note": f"[자동만료] 할인율 {d['discount_rate']}% < 10%"
-            }).eq("id", d["id"]).execute()
+            }).eq("id", d["id"]))
             logger.info(f"🗑 자동만료(할인<10%): #{d['id']} {d['title'][:35]} | {d['discount_rate']}%")
 
-        # 4) is_hot 동기화: 할인율 40% 이상 → HOT, 미만 → not HOT
-        res4 = sb.table("deals").select("id,discount_rate") \
-            .eq("status", "active") \
-            .eq("is_hot", False) \
-            .gte("discount_rate", 40) \
-            .execute()
+        # 4) is_hot 동기화: 할인율 HOT_DISCOUNT_THRESHOLD 이상 (create_deal 과 같은 기준) → HOT, 미만 → not HOT
+        res4 = await db.aexecute(
+            sb.table("deals").select("id,discount_rate")
+            .eq("status", "active")
+            .eq("is_hot", False)
+            .gte("discount_rate", settings.HOT_DISCOUNT_THRESHOLD)
+        )
+        changed += len(res4.data or [])
         for d in (res4.data or []):
-            sb.table("deals").update({"is_hot": True}).eq("id", d["id"]).execute()
+            await db.aexecute(sb.table("deals").update({"is_hot": True}).eq("id", d["id"]))
             logger.info(f"⭐ is_hot 동기화: #{d['id']} {d['discount_rate']}%")
-        # 할인율 40% 미만인데 HOT인 딜 해제
-        res4b = sb.table("deals").select("id,discount_rate") \
-            .eq("status", "active") \
-            .eq("is_hot", True) \
-            .lt("discount_rate", 40) \
-            .execute()
+        # 기준 미만인데 HOT인 딜 해제
+        res4b = await db.aexecute(
+            sb.table("deals").select("id,discount_rate")
+            .eq("status", "active")
+            .eq("is_hot", True)
+            .lt("discount_rate", settings.HOT_DISCOUNT_THRESHOLD)
+        )
+        changed += len(res4b.data or [])
         for d in (res4b.data or []):
-            sb.table("deals").update({"is_hot": False}).eq("id", d["id"]).execute()
+            await db.aexecute(sb.table("deals").update({"is_hot": False}).eq("id", d["id"]))
             logger.info(f"❄️ is_hot 해제: #{d['id']} {d['discount_rate']}%")
 
+        if changed:
+            db.bump_data_version()
+
     except Exception as e:
         logger.error(f"❌ cleanup_invalid_deals 오류: {e}")
@@ -26,10 +26,10 @@ class DealCreate(DealBase):
         return v
 
 
-class DealResponse(BaseModel):
+class DealCardResponse(BaseModel):
+    """목록/카드용 (db card 프로필)"""
     id: int
     title: str
-    description: Optional[str] = None
     original_price: float
     sale_price: float
     discount_rate: float
@@ -42,8 +42,6 @@ class DealResponse(BaseModel):
     upvotes: int
     views: int
     today_views: int = 0
-    total_views: int = 0
-    today_clicks: int = 0
     total_clicks: int = 0
     is_hot: bool
     submitter_name: Optional[str] = None
@@ -57,8 +55,15 @@ class DealResponse(BaseModel):
         from_attributes = True
 
 
+class DealResponse(DealCardResponse):
+    """딜 상세용 (db detail 프로필)"""
+    description: Optional[str] = None
+    total_views: int = 0
+    today_clicks: int = 0
+
+
 class DealListResponse(BaseModel):
-    items: list[DealResponse]
+    items: list[DealCardResponse]
     total: int
     page: int
     size: int
@@ -0,0 +1,105 @@
+"""
+수집 잡 적응형 주기 (소스별 신규 딜 수율 기반)
+
+- 잡 1회 실행마다 신규 저장 수 / 직전 주기(분) → 분당 수율을 EWMA 로 누적
+  소스 전체 + KST 시간대(0~23시)별로 따로 기록 → 새벽/저녁 피크 차이 반영
+- 다음 주기 = TARGET_ITEMS_PER_RUN / 예상 수율 (현재 시간대 기록 우선, 없으면 소스 전체)
+  → 핫한 소스는 짧게, 조용한 소스는 길게. 소스별 [min, max] 범위로 제한
+- 직전 대비 변화는 MAX_STEP 배 이내 (한 번의 이상치로 급변 방지)
+- 상태는 프로세스 로컬 — 재시작 시 기본 주기부터 다시 학습
+"""
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+KST = timezone(timedelta(hours=9))
+
+TARGET_ITEMS_PER_RUN = 3.0   # 1회 실행당 기대 신규 딜 수
+EWMA_ALPHA = 0.3
+MAX_STEP = 2.0
+
+
+@dataclass(frozen=True)
+class SourcePolicy:
+    base: float      # 기본 주기 (분) — 학습 전 / 기록 없음
+    min: float
+    max: float
+
+
+# scheduler job id → 정책
+SOURCE_POLICIES: Dict[str, SourcePolicy] = {
+    "sync_ppomppu": SourcePolicy(base=10, min=3, max=30),
+    "sync_algumon": SourcePolicy(base=20, min=5, max=60),
+    "sync_clien": SourcePolicy(base=120, min=20, max=240),
+    "sync_eomisae": SourcePolicy(base=120, min=20, max=240),
+    "sync_ruliweb": SourcePolicy(base=120, min=20, max=240),
+    "sync_quasarzone": SourcePolicy(base=120, min=30, max=240),
+}
+
+
+@dataclass
+class _SourceState:
+    interval: float
+    rate: Optional[float] = None                  # 소스 전체 분당 수율 EWMA
+    hourly: Dict[int, float] = field(default_factory=dict)  # KST 시 → 분당 수율 EWMA
+    runs: int = 0
+    last_items: int = 0
+
+
+_states: Dict[str, _SourceState] = {}
+_lock = threading.Lock()
+
+
+def _ewma(prev: Optional[float], value: float) -> float:
+    return value if prev is None else prev + EWMA_ALPHA * (value - prev)
+
+
+def _state(job_id: str) -> _SourceState:
+    state = _states.get(job_id)
+    if state is None:
+        state = _states[job_id] = _SourceState(interval=float(SOURCE_POLICIES[job_id].base))
+    return state
+
+
+def current_interval(job_id: str) -> float:
+    """현재 적용 주기 (분)"""
+    with _lock:
+        return _state(job_id).interval
+
+
+def record_run(job_id: str, new_items: int, now: Optional[datetime] = None) -> float:
+    """실행 결과 반영 후 다음 주기(분) 반환"""
+    policy = SOURCE_POLICIES[job_id]
+    now = now or datetime.now(KST)
+    hour = now.astimezone(KST).hour
+    with _lock:
+        state = _state(job_id)
+        per_minute = max(new_items, 0) / state.interval
+        state.rate = _ewma(state.rate, per_minute)
+        state.hourly[hour] = _ewma(state.hourly.get(hour), per_minute)
+        state.runs += 1
+        state.last_items = new_items
+
+        # 다음 실행 시간대 기준 예상 수율
+        next_hour = (now + timedelta(minutes=state.interval)).astimezone(KST).hour
+        expected = state.hourly.get(next_hour, state.rate)
+        target = policy.max if expected <= 0 else TARGET_ITEMS_PER_RUN / expected
+        target = min(max(target, state.interval / MAX_STEP), state.interval * MAX_STEP)
+        state.interval = round(float(min(max(target, policy.min), policy.max)), 1)
+        return state.interval
+
+
+def snapshot() -> Dict[str, dict]:
+    """소스별 현재 주기 / 수율 (관리자 조회용)"""
+    with _lock:
+        return {
+            job_id: {
+                "interval_minutes": s.interval,
+                "items_per_hour": round((s.rate or 0) * 60, 2),
+                "items_per_hour_by_kst_hour": {h: round(r * 60, 2) for h, r in sorted(s.hourly.items())},
+                "runs": s.runs,
+                "last_new_items": s.last_items,
+            }
+            for job_id, s in _states.items()
+        }
@@ -13,6 +13,8 @@ import logging
 import httpx
 from typing import Optional
 
+from app.services import host_guard
+
 logger = logging.getLogger(__name__)
 
 ALGUMON_API = "https://www.algumon.com/api/posts"
@@ -72,7 +74,7 @@ async def fetch_algumon_deals(pages: int = 5) -> list[dict]:
                 params = {}
                 if max_id:
                     params["maxId"] = max_id - 1
-                r = await client.get(ALGUMON_API, params=params)
+                r = await host_guard.request(client, "GET", ALGUMON_API, params=params)
                 data = r.json()
                 page_data = data.get("data", {})
                 posts = page_data.get("posts", [])
@@ -82,7 +84,7 @@ async def fetch_algumon_deals(pages: int = 5) -> list[dict]:
                 max_id = page_data.get("minId")
                 if not max_id or page_data.get("noMorePost"):
                     break
-                await asyncio.sleep(0.3)
+                # 페이지 간 간격은 host_guard 정책(min_interval)이 보장
             except Exception as e:
                 logger.warning(f"[알구몬] 페이지{i+1} 수집 실패: {e}")
                 break
@@ -103,7 +105,7 @@ async def fetch_ruliweb_deals() -> list[dict]:
 
     try:
         async with httpx.AsyncClient(timeout=10, headers={"User-Agent": "Mozilla/5.0"}) as client:
-            r = await client.get(RULIWEB_RSS)
+            r = await host_guard.request(client, "GET", RULIWEB_RSS)
             root = ET.fromstring(r.text)
     except Exception as e:
         logger.warning(f"[루리웹RSS] 수집 실패: {e}")
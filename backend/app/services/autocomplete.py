@@ -0,0 +1,100 @@
+"""
+검색어 자동완성 인덱스 (정렬 prefix 배열 + 초성 검색)
+
+- 후보: active 딜의 브랜드 / 카테고리 / 제목 앞 3단어
+- 후보마다 단어 시작 위치별 suffix 키 + 공백 제거 키 + 초성 키를 정렬 배열에 저장
+  → bisect 로 prefix 구간을 찾아 가중치 순 상위 N개 (조회 O(log n + 스캔 상한))
+- "ㄱㄹㅅ" 처럼 초성이 섞인 입력은 초성 키 배열에서 검색
+- 카탈로그 스냅샷당 1회 빌드 (deal_catalog.derived) — 딜 변경은 스냅샷 교체로 반영
+"""
+import bisect
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from app.services.brand_index import extract_brand
+from app.services.deal_catalog import CatalogSnapshot, get_catalog
+from app.services.search_index import has_choseong, normalize, to_choseong
+
+MAX_SUGGESTIONS = 8
+MAX_SCAN = 300  # prefix 구간 스캔 상한 (짧은 입력에서 전체 스캔 방지)
+
+# 동점 시 노출 우선순위
+TYPE_PRIORITY = {"brand": 0, "category": 1, "title": 2}
+
+
+def _word_suffixes(text: str) -> List[str]:
+    """"삼성 갤럭시 s24" → ["삼성 갤럭시 s24", "갤럭시 s24", "s24"]"""
+    words = text.split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+@dataclass
+class AutocompleteIndex:
+    entries: List[Tuple[str, str, float]]   # (type, value, weight)
+    keys: List[str]
+    key_entries: List[int]
+    cho_keys: List[str]
+    cho_entries: List[int]
+
+    @staticmethod
+    def _scan(keys: List[str], refs: List[int], prefix: str) -> set:
+        found: set = set()
+        i = bisect.bisect_left(keys, prefix)
+        end = min(len(keys), i + MAX_SCAN)
+        while i < end and keys[i].startswith(prefix):
+            found.add(refs[i])
+            i += 1
+        return found
+
+    def suggest(self, q: str, limit: int = MAX_SUGGESTIONS) -> List[dict]:
+        q = normalize(q).strip()
+        if not q:
+            return []
+        if has_choseong(q):
+            hits = self._scan(self.cho_keys, self.cho_entries, to_choseong(q).replace(" ", ""))
+        else:
+            hits = self._scan(self.keys, self.key_entries, q)
+            hits |= self._scan(self.keys, self.key_entries, q.replace(" ", ""))
+        ranked = sorted(
+            hits,
+            key=lambda e: (-self.entries[e][2], TYPE_PRIORITY[self.entries[e][0]], len(self.entries[e][1])),
+        )
+        return [{"type": self.entries[e][0], "value": self.entries[e][1]} for e in ranked[:limit]]
+
+
+def build_index(snapshot: CatalogSnapshot) -> AutocompleteIndex:
+    weights: Counter = Counter()
+    for d in snapshot.deals:
+        popularity = 1 + int(d.get("upvotes") or 0) * 0.5 + int(d.get("today_views") or 0) * 0.05
+        brand = extract_brand(d)
+        if brand:
+            weights[("brand", brand)] += popularity
+        if d.get("category"):
+            weights[("category", d["category"])] += popularity
+        short = " ".join((d.get("title") or "").split()[:3])[:20]
+        if short:
+            weights[("title", short)] += popularity
+
+    entries = [(t, v, w) for (t, v), w in weights.items()]
+    pairs, cho_pairs = [], []
+    for idx, (_, value, _) in enumerate(entries):
+        norm = normalize(value)
+        keys = set(_word_suffixes(norm))
+        keys.update(k.replace(" ", "") for k in list(keys))
+        for k in keys:
+            pairs.append((k, idx))
+        cho_pairs.extend((to_choseong(k), idx) for k in keys if " " not in k)
+    pairs.sort()
+    cho_pairs.sort()
+    return AutocompleteIndex(
+        entries=entries,
+        keys=[k for k, _ in pairs],
+        key_entries=[i for _, i in pairs],
+        cho_keys=[k for k, _ in cho_pairs],
+        cho_entries=[i for _, i in cho_pairs],
+    )
+
+
+def get_index(snapshot: CatalogSnapshot = None) -> AutocompleteIndex:
+    return (snapshot or get_catalog()).derived("autocomplete", build_index)
@@ -0,0 +1,205 @@
+"""
+브랜드 카탈로그 (브랜드 목록 / 브랜드 페이지)
+
+- 브랜드: submitter_name 우선, 없으면 제목 앞 [Brand] 태그 (리테일러 제외)
+- 브랜드별 노출 딜 수·평균 할인율 / 역대 최저가 TOP5 / 할인율 TOP10 을 미리 계산해 메모리에 보관
+- 갱신: 딜 저장 시 observe()로 즉시 반영 + 스케줄러 주기 재빌드 (만료/상태 변경 보정)
+  · 첫 빌드(프로세스당 1회, 동시 첫 요청은 single-flight)는 노출 딜 전체 + 최근 HISTORY_DAYS 일 이력만 조회
+    — 만료 딜 전체 이력을 메모리에 올리지 않음. 역대 최저가/TOP 은 이 기간 기준
+  · 이후 재빌드는 노출 딜(LISTED_STATUSES)만 다시 조회하고, 노출 목록에서 빠진 딜만 id 로 현재 상태 확인
+    (만료된 딜은 이미 스냅샷에 있으므로 이력 전체를 다시 읽지 않음), 기간을 벗어난 만료 딜은 정리
+"""
+import heapq
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import app.db_supabase as db
+
+logger = logging.getLogger(__name__)
+
+RETAILER_EXCLUDE = {
+    "쿠팡", "지마켓", "g마켓", "11번가", "옥션", "롯데온", "네이버", "두타온",
+    "에픽게임즈", "epic games", "woot", "amazon", "ebay", "costco",
+    "coupang", "gmarket", "ssg", "11st",
+}
+
+INDEX_STATUSES = ["active", "expired", "price_changed"]  # 역대 최저/TOP 딜 대상
+LISTED_STATUSES = {"active", "price_changed"}            # 브랜드 목록 count/평균 대상
+HISTORY_DAYS = 180                                       # 만료 딜 이력 보관 기간 (역대 최저가/TOP 기준)
+LOWEST_N = 5
+TOP_N = 10
+
+_BRAND_TAG_RE = re.compile(r'^\[([^\]]+)\]')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def to_slug(name: str) -> str:
+    return _SLUG_RE.sub('-', name.lower()).strip('-')
+
+
+def raw_brand(deal: dict) -> str:
+    """submitter_name 또는 [Brand] 태그 (리테일러 포함, 필터 전)"""
+    brand = deal.get("submitter_name") or ""
+    if not brand:
+        m = _BRAND_TAG_RE.match(deal.get("title") or "")
+        brand = m.group(1).strip() if m else ""
+    return brand
+
+
+def extract_brand(deal: dict) -> Optional[str]:
+    """실제 제품 브랜드 (리테일러 제외). 없으면 None"""
+    brand = raw_brand(deal)
+    if not brand or brand.lower() in RETAILER_EXCLUDE:
+        return None
+    return brand
+
+
+@dataclass
+class BrandEntry:
+    brand: str
+    slug: str
+    count: int = 0
+    discount_sum: float = 0.0
+    # heap 원소: (정렬키, deal_id, deal) — 최저가는 -sale_price 최대힙, TOP은 discount 최소힙
+    _lowest: list = field(default_factory=list)
+    _top: list = field(default_factory=list)
+
+    def add(self, deal: dict) -> None:
+        if deal.get("status") in LISTED_STATUSES:
+            self.count += 1
+            self.discount_sum += float(deal.get("discount_rate") or 0)
+        price = float(deal.get("sale_price") or 0)
+        if price > 0:
+            item = (-price, deal["id"], deal)
+            if len(self._lowest) < LOWEST_N:
+                heapq.heappush(self._lowest, item)
+            elif item > self._lowest[0]:
+                heapq.heapreplace(self._lowest, item)
+        item = (float(deal.get("discount_rate") or 0), deal["id"], deal)
+        if len(self._top) < TOP_N:
+            heapq.heappush(self._top, item)
+        elif item > self._top[0]:
+            heapq.heapreplace(self._top, item)
+
+    @property
+    def avg_discount(self) -> float:
+        return round(self.discount_sum / self.count, 1) if self.count else 0
+
+    def lowest(self) -> List[dict]:
+        return [d for _, _, d in sorted(self._lowest, reverse=True)]
+
+    def top(self) -> List[dict]:
+        return [d for _, _, d in sorted(self._top, reverse=True)]
+
+
+_entries: Dict[str, BrandEntry] = {}
+_deals: Dict[int, dict] = {}             # INDEX_STATUSES 딜 스냅샷 (id → card) — 재빌드 증분 기준
+_built_version: Optional[int] = None
+_built_at: Optional[float] = None
+_lock = threading.Lock()
+_build_lock = threading.Lock()           # 빌드 single-flight (요청 경로 첫 빌드 / 스케줄러 재빌드)
+
+
+def _add(entries: Dict[str, BrandEntry], deal: dict) -> None:
+    brand = extract_brand(deal)
+    slug = to_slug(brand) if brand else ""
+    if not slug:
+        return
+    entry = entries.get(slug)
+    if entry is None:
+        entry = entries[slug] = BrandEntry(brand=brand, slug=slug)
+    entry.add(deal)
+
+
+def _history_since() -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=HISTORY_DAYS)).isoformat()
+
+
+def _load_initial() -> Dict[int, dict]:
+    """첫 빌드: 노출 딜 전체 + 최근 HISTORY_DAYS 일 만료 딜 (range 페이징)"""
+    deals = {d["id"]: d for d in db.fetch_deals(["expired"], "card", since=_history_since())}
+    for d in db.fetch_deals(list(LISTED_STATUSES), "card"):
+        deals[d["id"]] = d
+    return deals
+
+
+def _refresh_listed(current: Dict[int, dict]) -> Dict[int, dict]:
+    """노출 딜만 다시 조회해 스냅샷 갱신 — 노출 목록에서 빠진 딜은 id 로 현재 상태 확인 (삭제/거절이면 제거)"""
+    since = _history_since()
+    current = {
+        deal_id: d for deal_id, d in current.items()
+        if d.get("status") in LISTED_STATUSES or (d.get("created_at") or "") >= since
+    }
+    listed = db.fetch_deals(list(LISTED_STATUSES), "card")
+    listed_ids = {d["id"] for d in listed}
+    dropped = [
+        deal_id for deal_id, d in current.items()
+        if d.get("status") in LISTED_STATUSES and deal_id not in listed_ids
+    ]
+    deals = dict(current)
+    for deal_id in dropped:
+        deals.pop(deal_id, None)
+    if dropped:
+        for d in db.fetch_deals_by_ids(dropped, INDEX_STATUSES, "card"):
+            deals[d["id"]] = d
+    for d in listed:
+        deals[d["id"]] = d
+    return deals
+
+
+def rebuild(force: bool = False) -> int:
+    """재빌드 (데이터 버전 변동 없으면 생략, 첫 빌드만 최근 이력 조회). 브랜드 수 반환"""
+    global _entries, _deals, _built_version, _built_at
+    with _build_lock:
+        version = db.get_data_version()
+        if not force and _built_version == version:
+            return len(_entries)
+        if _built_at is None:
+            deals = _load_initial()
+        else:
+            with _lock:
+                current = dict(_deals)
+            deals = _refresh_listed(current)
+        entries: Dict[str, BrandEntry] = {}
+        for d in deals.values():
+            _add(entries, d)
+        with _lock:
+            _entries, _deals, _built_version, _built_at = entries, deals, version, time.time()
+    logger.info(f"[브랜드] 인덱스 재빌드: {len(entries)}개 브랜드 / {len(deals)}개 딜")
+    return len(entries)
+
+
+def observe(deal: dict) -> None:
+    """신규 딜 즉시 반영 (인덱스 미빌드 상태면 무시 — 첫 조회 시 전체 빌드)"""
+    if _built_at is None:
+        return
+    with _lock:
+        _deals[deal["id"]] = deal
+        _add(_entries, deal)
+
+
+def _ensure_built() -> None:
+    if _built_at is None:
+        rebuild()  # _build_lock 대기 후 버전 비교 → 먼저 들어온 요청의 빌드 결과 재사용
+
+
+def list_brands() -> List[dict]:
+    """브랜드 목록 (노출 딜 많은 순)"""
+    _ensure_built()
+    with _lock:
+        entries = [e for e in _entries.values() if e.count > 0]
+    entries.sort(key=lambda e: -e.count)
+    return [
+        {"brand": e.brand, "slug": e.slug, "count": e.count, "avg_discount": e.avg_discount}
+        for e in entries
+    ]
+
+
+def get_brand(slug: str) -> Optional[BrandEntry]:
+    _ensure_built()
+    return _entries.get(slug)
@@ -11,6 +11,7 @@ import asyncio
 import html
 from bs4 import BeautifulSoup
 from typing import Optional
+from app.services import host_guard
 
 CLIEN_RSS_URL = "https://www.clien.net/service/rss/hotdeal"
 
@@ -219,8 +220,8 @@ async def fetch_clien_deals() -> list[dict]:
 
     try:
         async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                CLIEN_RSS_URL,
+            resp = await host_guard.request(
+                client, "GET", CLIEN_RSS_URL,
                 headers={"User-Agent": "Mozilla/5.0"},
                 timeout=15.0,
                 follow_redirects=True,
@@ -8,10 +8,15 @@
 """
 import re
 import asyncio
+import hashlib
 import logging
 import httpx
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional
 
+from app.services import host_guard
+
 logger = logging.getLogger(__name__)
 
 # ─── 식품/일상용품 금지 키워드 ───────────────────────────────────────────────
@@ -219,31 +224,42 @@ async def lookup_msrp_from_naver(title: str, sale_price: int) -> Optional[dict]:
     }
 
 
-async def check_deal_expired_from_url(url: str) -> tuple[bool, str]:
-    """
-    커뮤니티 원글 URL에서 만료 감지
+# ─── 원글 만료 체크 상태 (프로세스 로컬) ─────────────────────────────────────
+EXPIRY_MAX_BYTES = 256 * 1024      # 원글 본문은 이 안에 있음 — 이후 바이트는 받지 않고 연결 종료
+EXPIRY_TAIL_MAX_BYTES = 1024 * 1024  # 뽐뿌 댓글(페이지 하단) 검사 시 상한
+EXPIRY_STATE_MAX = 5000
 
-    Returns: (is_expired: bool, reason: str)
-    """
-    if not url:
-        return False, ""
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
 
-    try:
-        async with httpx.AsyncClient(
-            timeout=10,
-            follow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; JunggaPagoe-bot/1.0)"},
-        ) as client:
-            r = await client.get(url)
-            text = r.text.lower()
-            status = r.status_code
-    except Exception as e:
-        logger.warning(f"[CommunityEnricher] URL 접근 실패 {url}: {e}")
-        return False, ""
 
-    # 404/삭제된 페이지
-    if status == 404:
-        return True, "페이지 없음(404)"
+@dataclass
+class _PostState:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+
+# url → 마지막 확인 시 ETag/Last-Modified/본문 해시 (LRU)
+_post_states: "OrderedDict[str, _PostState]" = OrderedDict()
+
+
+def _remember(url: str, state: _PostState) -> None:
+    _post_states[url] = state
+    _post_states.move_to_end(url)
+    while len(_post_states) > EXPIRY_STATE_MAX:
+        _post_states.popitem(last=False)
+
+
+def _relevant_region(html_text: str) -> str:
+    """<head> 와 script/style 블록 제외 — 스크립트 내 'sold out' 등 오탐 및 스캔 비용 감소"""
+    body_at = html_text.lower().find("<body")
+    if body_at > 0:
+        html_text = html_text[body_at:]
+    return _SCRIPT_STYLE_RE.sub(" ", html_text)
+
+
+def _scan_expiry(url: str, raw: str) -> tuple[bool, str]:
+    text = raw.lower()
 
     # 만료 키워드 감지
     for kw in EXPIRY_KEYWORDS:
@@ -257,10 +273,10 @@ async def check_deal_expired_from_url(url: str) -> tuple[bool, str]:
 
     # 뽐뿌 "이 게시물은 삭제" 패턴
     if "ppomppu.com" in url:
-        if "삭제된 게시물" in r.text or "게시물이 없습니다" in r.text:
+        if "삭제된 게시물" in raw or "게시물이 없습니다" in raw:
             return True, "뽐뿌-삭제됨"
         # 댓글에서 품절/종료 키워드 감지 (하단부 200자 내)
-        tail = r.text[-2000:].lower()
+        tail = raw[-2000:].lower()
         for kw in ["품절", "종료", "sold out", "마감"]:
             if tail.count(kw) >= 3:  # 3번 이상 → 확실히 종료
                 return True, f"댓글종료:{kw}"
@@ -268,6 +284,86 @@ async def check_deal_expired_from_url(url: str) -> tuple[bool, str]:
     return False, ""
 
 
+async def check_deal_expired_from_url(
+    url: str, client: Optional[httpx.AsyncClient] = None
+) -> tuple[bool, str]:
+    """
+    커뮤니티 원글 URL에서 만료 감지
+
+    - 조건부 요청(If-None-Match / If-Modified-Since) → 304 면 본문 없이 "변경 없음"
+    - 스트리밍으로 앞부분 EXPIRY_MAX_BYTES 만 받고 연결 종료 (본문 영역만 검사)
+    - 직전 확인과 본문 해시가 같으면 키워드 스캔 생략
+    client: 재사용할 httpx 클라이언트 (배치 확인 시 연결 재사용)
+
+    Returns: (is_expired: bool, reason: str)
+    """
+    if not url:
+        return False, ""
+
+    state = _post_states.get(url) or _PostState()
+    headers = {}
+    if state.etag:
+        headers["If-None-Match"] = state.etag
+    if state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+    max_bytes = EXPIRY_TAIL_MAX_BYTES if "ppomppu.com" in url else EXPIRY_MAX_BYTES
+
+    async def _fetch(c: httpx.AsyncClient) -> tuple[int, bytes, Optional[str], Optional[str], str]:
+        r = await host_guard.request(c, "GET", url, headers=headers, stream=True)
+        try:
+            body = bytearray()
+            if r.status_code == 200:
+                async for chunk in r.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) >= max_bytes:
+                        break
+            return (
+                r.status_code, bytes(body[:max_bytes]),
+                r.headers.get("etag"), r.headers.get("last-modified"), r.encoding or "utf-8",
+            )
+        finally:
+            await r.aclose()
+
+    try:
+        if client is not None:
+            status, body, etag, last_modified, encoding = await _fetch(client)
+        else:
+            async with httpx.AsyncClient(
+                timeout=10,
+                follow_redirects=True,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; JunggaPagoe-bot/1.0)"},
+            ) as c:
+                status, body, etag, last_modified, encoding = await _fetch(c)
+    except host_guard.CircuitOpenError:
+        return False, ""  # 호스트 차단 중 — 다음 주기에 재확인
+    except Exception as e:
+        logger.warning(f"[CommunityEnricher] URL 접근 실패 {url}: {e}")
+        return False, ""
+
+    # 변경 없음 — 직전 확인에서 만료 아니었으므로 그대로
+    if status == 304:
+        _remember(url, state)
+        return False, ""
+
+    # 404/삭제된 페이지
+    if status == 404:
+        _post_states.pop(url, None)
+        return True, "페이지 없음(404)"
+
+    try:
+        raw = body.decode(encoding, errors="ignore")
+    except LookupError:
+        raw = body.decode("utf-8", errors="ignore")
+    region = _relevant_region(raw)
+    content_hash = hashlib.sha1(region.encode("utf-8", errors="ignore")).hexdigest()
+    if status == 200:
+        _remember(url, _PostState(etag=etag, last_modified=last_modified, content_hash=content_hash))
+    if status == 200 and content_hash == state.content_hash:
+        return False, ""  # 본문 동일 — 스캔 생략
+
+    return _scan_expiry(url, region)
+
+
 async def check_price_vs_naver(title: str, sale_price: int) -> dict:
     """
     Naver Shopping API로 현재가(lprice) 비교 → 딜 여부 판별
@@ -0,0 +1,81 @@
+"""
+프로세스 간 딜 데이터 버전 동기화
+
+db.get_data_version() 은 프로세스 로컬 카운터라, 워커 프로세스(app/worker.py)나 다른 API 레플리카가
+딜을 쓰면 이 프로세스의 카탈로그 / 피드 / HTTP ETag 캐시가 무효화되지 않는다.
+
+- publish(): 로컬 버전이 마지막 공유 이후 바뀌었으면 site_settings[deal_data_version] 에 새 토큰 기록
+- pull(): 공유 토큰이 마지막으로 본 값과 다르면 로컬 bump_data_version() (→ 다음 조회 때 캐시 재생성)
+- sync(): publish + pull — 스케줄러 sync_data_version 잡이 SYNC_SECONDS 마다 호출 (모든 모드)
+pull 로 올린 로컬 버전은 다시 publish 하지 않음 (인스턴스 간 핑퐁 방지)
+공유 토큰은 db.adopt_data_tag 로 HTTP ETag 기준(db.get_data_tag)으로 채택 → 모든 레플리카가 같은 ETag
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import app.db_supabase as db
+
+logger = logging.getLogger(__name__)
+
+SETTING_KEY = "deal_data_version"
+SYNC_SECONDS = 10
+
+_published_for = 0             # 마지막으로 공유한(또는 공유 불필요로 처리한) 로컬 버전
+_seen_token: Optional[str] = None
+_lock = threading.Lock()
+
+
+def publish() -> bool:
+    global _published_for, _seen_token
+    from app.services.sketch_store import INSTANCE_ID
+
+    with _lock:
+        version = db.get_data_version()
+        if version == _published_for:
+            return False
+        token = f"{INSTANCE_ID}:{version}:{time.time_ns()}"
+    db.get_supabase().table("site_settings").upsert({
+        "key": SETTING_KEY,
+        "value": token,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }).execute()
+    with _lock:
+        _published_for, _seen_token = version, token
+        db.adopt_data_tag(token, version)
+    return True
+
+
+def pull() -> bool:
+    global _published_for, _seen_token
+    rows = (
+        db.get_supabase().table("site_settings")
+        .select("value").eq("key", SETTING_KEY).limit(1)
+        .execute().data or []
+    )
+    token = rows[0]["value"] if rows else None
+    with _lock:
+        if not token or token == _seen_token:
+            return False
+        first = _seen_token is None
+        _seen_token = token
+        dirty = db.get_data_version() != _published_for
+        if first:
+            # 기동 직후 — 로컬 캐시는 어차피 새로 적재됨, ETag 기준만 공유 토큰으로
+            if not dirty:
+                db.adopt_data_tag(token, db.get_data_version())
+            return False
+        version = db.bump_data_version()
+        if not dirty:
+            # 미공유 로컬 쓰기가 있으면 다음 publish 가 새 토큰을 채택
+            _published_for = version
+            db.adopt_data_tag(token, version)
+    logger.debug(f"[데이터버전] 다른 프로세스 변경 감지 → 로컬 v{version}")
+    return True
+
+
+def sync() -> None:
+    publish()
+    pull()
@@ -0,0 +1,91 @@
+"""
+active 딜 카탈로그 인메모리 스냅샷
+
+- 데이터 버전(db.get_data_version)이 바뀌면 다음 조회 시 재적재 (최소 간격 CATALOG_MIN_REFRESH_SECONDS)
+- 검색 인덱스 / 자동완성 / 키워드 통계 / 연관 딜 등 파생 구조는 snapshot.derived()로
+  스냅샷당 1회만 빌드해 공유 → 카탈로그 교체 시 함께 무효화
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import app.db_supabase as db
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MIN_REFRESH_SECONDS = 30  # 업보트 등 잦은 버전 변경에 매번 재적재하지 않도록
+
+
+@dataclass
+class CatalogSnapshot:
+    version: int
+    built_at: float
+    deals: List[dict]
+    by_id: Dict[int, dict] = field(default_factory=dict)
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False)
+    _derived_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self):
+        self.by_id = {d["id"]: d for d in self.deals}
+
+    def peek(self, name: str) -> Optional[Any]:
+        """이미 빌드된 파생 구조 (없으면 None — 빌드는 하지 않음)"""
+        return self._derived.get(name)
+
+    def derived(self, name: str, builder: Callable[["CatalogSnapshot"], Any]) -> Any:
+        """스냅샷 파생 구조 (최초 1회 builder(self) 실행 후 캐시)"""
+        value = self._derived.get(name)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(name)
+                if value is None:
+                    started = time.monotonic()
+                    value = self._derived[name] = builder(self)
+                    logger.info(
+                        f"[카탈로그] {name} 빌드: {len(self.deals)}개 딜 | "
+                        f"{(time.monotonic() - started) * 1000:.0f}ms"
+                    )
+        return value
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_lock = threading.Lock()
+
+
+def _is_fresh(snap: Optional[CatalogSnapshot]) -> bool:
+    if snap is None:
+        return False
+    if snap.version == db.get_data_version():
+        return True
+    return time.time() - snap.built_at < CATALOG_MIN_REFRESH_SECONDS
+
+
+def get_catalog(force: bool = False) -> CatalogSnapshot:
+    """현재 카탈로그 스냅샷 (동기 — 라우터에서는 db.run_db로 호출)"""
+    global _snapshot
+    snap = _snapshot
+    if not force and _is_fresh(snap):
+        return snap
+    with _lock:
+        if not force and _is_fresh(_snapshot):
+            return _snapshot
+        version = db.get_data_version()
+        try:
+            deals = db.fetch_active_deals("card")
+        except Exception as e:
+            if _snapshot is not None:
+                logger.warning(f"[카탈로그] 재적재 실패 — 이전 스냅샷 유지: {e}")
+                return _snapshot
+            raise
+        _snapshot = CatalogSnapshot(version=version, built_at=time.time(), deals=deals)
+        logger.info(f"[카탈로그] 스냅샷 적재: {len(deals)}개 (v{version})")
+        return _snapshot
+
+
+async def aget_catalog() -> CatalogSnapshot:
+    snap = _snapshot
+    if _is_fresh(snap):
+        return snap
+    return await db.run_db(get_catalog)
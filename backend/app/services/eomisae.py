@@ -11,6 +11,7 @@ import asyncio
 import html
 from bs4 import BeautifulSoup
 from typing import Optional
+from app.services import host_guard
 
 EOMISAE_RSS_URL = "https://eomisae.co.kr/rss?mid=fs"
 
@@ -268,8 +269,8 @@ async def fetch_eomisae_deals() -> list[dict]:
 
     try:
         async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                EOMISAE_RSS_URL,
+            resp = await host_guard.request(
+                client, "GET", EOMISAE_RSS_URL,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
                 },
@@ -0,0 +1,163 @@
+"""
+이벤트 롤업 — 관리자 대시보드 집계를 event_logs 원본 스캔 없이 제공
+
+- record(): /api/events 수신 시 메모리 카운터에 가산 (락 1회, I/O 없음)
+- flush(): 1분마다 누적분을 increment_event_rollups RPC로 DB에 가산
+- compact(): 1시간마다 완결된 과거 구간을 event_logs 기준으로 재계산 (유실/중복 보정)
+- 읽기: 시간 버킷 (최대 7일×24h×유형) / 딜-일 카운터 → 대시보드 비용이 이벤트량과 무관
+- recent_events(): 최근 이벤트 링버퍼 (인스턴스 로컬, /admin/visitors 최근 로그용)
+
+테이블/RPC: migrations/006_event_rollups.sql (기존 이벤트 백필: migrations/012)
+"""
+import logging
+import threading
+from collections import Counter, deque
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+import app.db_supabase as db
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+COMPACT_WINDOW_HOURS = 48  # compact 대상: 최근 48시간 중 완결된 구간
+RECENT_EVENTS_SIZE = 200
+
+# (bucket_iso, event_type) → n / (kst_day_iso, deal_id, event_type) → n
+_hourly: Counter = Counter()
+_deal_daily: Counter = Counter()
+_lock = threading.Lock()
+_recent: deque = deque(maxlen=RECENT_EVENTS_SIZE)
+
+
+def _hour_bucket(ts: datetime) -> str:
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0).isoformat()
+
+
+def record(
+    event_type: str,
+    deal_id: Optional[int] = None,
+    ts: Optional[datetime] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> None:
+    """이벤트 1건을 메모리 롤업에 가산 + 최근 이벤트 링버퍼에 추가"""
+    ts = ts or datetime.now(timezone.utc)
+    with _lock:
+        _hourly[(_hour_bucket(ts), event_type)] += 1
+        if deal_id:
+            _deal_daily[(ts.astimezone(KST).date().isoformat(), deal_id, event_type)] += 1
+        _recent.append({
+            "ip_address": ip_address,
+            "event_type": event_type,
+            "deal_id": deal_id,
+            "user_agent": user_agent,
+            "created_at": ts.isoformat(),
+        })
+
+
+def recent_events(limit: int = 100) -> list[dict]:
+    """최근 이벤트 (최신순, 이 인스턴스가 받은 것만)"""
+    with _lock:
+        items = list(_recent)
+    return items[::-1][:limit]
+
+
+def _drain() -> tuple[Counter, Counter]:
+    global _hourly, _deal_daily
+    with _lock:
+        hourly, deal_daily = _hourly, _deal_daily
+        _hourly, _deal_daily = Counter(), Counter()
+    return hourly, deal_daily
+
+
+def _restore(hourly: Counter, deal_daily: Counter) -> None:
+    with _lock:
+        _hourly.update(hourly)
+        _deal_daily.update(deal_daily)
+
+
+def flush() -> int:
+    """메모리 누적분을 DB 롤업 테이블에 가산. 실패 시 다음 flush로 이월. 반영한 이벤트 수 반환"""
+    hourly, deal_daily = _drain()
+    if not hourly and not deal_daily:
+        return 0
+    try:
+        db.get_supabase().rpc("increment_event_rollups", {
+            "hourly": [
+                {"bucket": b, "event_type": et, "count": n}
+                for (b, et), n in hourly.items()
+            ],
+            "deal_daily": [
+                {"day": d, "deal_id": did, "event_type": et, "count": n}
+                for (d, did, et), n in deal_daily.items()
+            ],
+        }).execute()
+    except Exception as e:
+        _restore(hourly, deal_daily)
+        logger.warning(f"[롤업] flush 실패 (다음 주기에 재시도): {e}")
+        return 0
+    return sum(hourly.values())
+
+
+def compact(hours: int = COMPACT_WINDOW_HOURS) -> None:
+    """완결된 과거 구간(현재 시각 1시간 전 정시까지)을 event_logs 원본으로 재계산"""
+    now_hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    until = now_hour - timedelta(hours=1)
+    since = until - timedelta(hours=hours)
+    db.get_supabase().rpc("compact_event_rollups", {
+        "since": since.isoformat(),
+        "until": until.isoformat(),
+    }).execute()
+
+
+def get_daily_counts(days: Iterable[date], event_types: Iterable[str]) -> dict:
+    """KST 날짜별 event_type 카운트 {"YYYY-MM-DD": {event_type: n}} — 미반영 메모리분 포함"""
+    days = sorted(days)
+    event_types = list(event_types)
+    out = {d.isoformat(): {et: 0 for et in event_types} for d in days}
+    if not days:
+        return out
+    start = datetime.combine(days[0], datetime.min.time(), KST).astimezone(timezone.utc)
+    end = datetime.combine(days[-1] + timedelta(days=1), datetime.min.time(), KST).astimezone(timezone.utc)
+
+    rows = (
+        db.get_supabase().table("event_rollup_hourly")
+        .select("bucket,event_type,count")
+        .in_("event_type", event_types)
+        .gte("bucket", start.isoformat()).lt("bucket", end.isoformat())
+        .execute().data or []
+    )
+    with _lock:
+        pending = [
+            {"bucket": b, "event_type": et, "count": n}
+            for (b, et), n in _hourly.items()
+        ]
+    for r in rows + pending:
+        bucket = datetime.fromisoformat(str(r["bucket"]).replace("Z", "+00:00"))
+        if not (start <= bucket < end):
+            continue
+        day_key = bucket.astimezone(KST).date().isoformat()
+        if day_key in out and r["event_type"] in out[day_key]:
+            out[day_key][r["event_type"]] += int(r["count"])
+    return out
+
+
+def get_deal_day_counts(deal_id: int, day: date) -> dict:
+    """딜 1개의 KST 하루 event_type별 카운트 — 미반영 메모리분 포함"""
+    rows = (
+        db.get_supabase().table("event_rollup_deal_daily")
+        .select("event_type,count")
+        .eq("deal_id", deal_id).eq("day", day.isoformat())
+        .execute().data or []
+    )
+    counts: Counter = Counter()
+    for r in rows:
+        counts[r["event_type"]] += int(r["count"])
+    day_key = day.isoformat()
+    with _lock:
+        for (d, did, et), n in _deal_daily.items():
+            if d == day_key and did == deal_id:
+                counts[et] += n
+    return dict(counts)
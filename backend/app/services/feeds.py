@@ -0,0 +1,186 @@
+"""
+RSS / Google Shopping 피드 사전 생성 + 캐시
+
+- 딜 데이터 버전(db.get_data_version)이 바뀔 때만 재생성, 결과는 bytes로 보관
+- XMLGenerator 스트리밍 작성 (문자열 반복 연결 없음, 이스케이프 자동)
+- Google 피드는 active 전체 카탈로그 (Merchant Center 요구사항)
+"""
+import asyncio
+import hashlib
+import io
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, formatdate
+from typing import Callable, Dict, Optional
+from xml.sax.saxutils import XMLGenerator
+
+import app.db_supabase as db
+
+logger = logging.getLogger(__name__)
+
+SITE_URL = "https://jungga-pagoe.vercel.app"
+API_URL = "https://jungga-pagoe-production.up.railway.app"
+
+RSS_ITEM_LIMIT = 30          # RSS 리더용 최신 N개
+GOOGLE_ITEM_LIMIT = None     # None = active 전체
+
+
+@dataclass
+class FeedSnapshot:
+    body: bytes
+    etag: str
+    last_modified: str       # RFC 7231 HTTP-date
+    generated_at: float
+    version: int
+    item_count: int
+
+
+class _XMLWriter:
+    """XMLGenerator 얇은 래퍼 — 들여쓰기 없이 요소 단위로 스트리밍 기록"""
+
+    def __init__(self, out: io.BytesIO):
+        self.gen = XMLGenerator(out, encoding="utf-8", short_empty_elements=True)
+
+    def start(self, name: str, attrs: Optional[dict] = None) -> None:
+        self.gen.startElement(name, attrs or {})
+
+    def end(self, name: str) -> None:
+        self.gen.endElement(name)
+
+    def element(self, name: str, text: Optional[str] = None, attrs: Optional[dict] = None) -> None:
+        self.gen.startElement(name, attrs or {})
+        if text:
+            self.gen.characters(text)
+        self.gen.endElement(name)
+
+
+def _rfc822(created_at: str) -> str:
+    try:
+        dt = datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return format_datetime(dt)
+    except ValueError:
+        return formatdate(usegmt=True)
+
+
+def build_rss(deals: list[dict]) -> bytes:
+    out = io.BytesIO()
+    w = _XMLWriter(out)
+    w.gen.startDocument()
+    w.start("rss", {"version": "2.0", "xmlns:atom": "http://www.w3.org/2005/Atom"})
+    w.start("channel")
+    w.element("title", "정가파괴 — 오늘의 핫딜")
+    w.element("link", SITE_URL)
+    w.element("description", "정가 대비 할인율 높은 핫딜만 모아드립니다")
+    w.element("language", "ko")
+    w.element("atom:link", attrs={
+        "href": f"{API_URL}/feed/rss", "rel": "self", "type": "application/rss+xml",
+    })
+    for d in deals:
+        url = d.get("product_url", "")
+        desc = (
+            f"{d.get('discount_rate', 0):.0f}% 할인 | "
+            f"{d.get('sale_price', 0):,}원 → {d.get('original_price', 0):,}원"
+        )
+        w.start("item")
+        w.element("title", d.get("title", ""))
+        w.element("link", url)
+        w.element("description", desc)
+        w.element("pubDate", _rfc822(d.get("created_at", "")))
+        w.element("guid", url)
+        if d.get("image_url"):
+            w.element("enclosure", attrs={"url": d["image_url"], "type": "image/jpeg"})
+        w.end("item")
+    w.end("channel")
+    w.end("rss")
+    w.gen.endDocument()
+    return out.getvalue()
+
+
+def build_google_shopping(deals: list[dict]) -> bytes:
+    """Google Merchant Center 상품 피드 (RSS 2.0 + g: namespace)"""
+    out = io.BytesIO()
+    w = _XMLWriter(out)
+    w.gen.startDocument()
+    w.start("rss", {"version": "2.0", "xmlns:g": "http://base.google.com/ns/1.0"})
+    w.start("channel")
+    w.element("title", "정가파괴 핫딜")
+    w.element("link", SITE_URL)
+    w.element("description", "정가 대비 할인율 높은 핫딜 상품")
+    for d in deals:
+        if not d.get("sale_price") or not d.get("product_url"):
+            continue
+        deal_id = str(d.get("id", ""))
+        price = f"{int(d.get('sale_price', 0))} KRW"
+        w.start("item")
+        w.element("title", d.get("title", ""))
+        w.element("link", f"{SITE_URL}/deal/{deal_id}")
+        w.element("g:id", deal_id)
+        w.element("g:price", price)
+        w.element("g:sale_price", price)
+        w.element("g:availability", "in_stock")
+        w.element("g:condition", "new")
+        w.element("g:product_type", d.get("category", "기타"))
+        if d.get("image_url"):
+            w.element("g:image_link", d["image_url"])
+        w.end("item")
+    w.end("channel")
+    w.end("rss")
+    w.gen.endDocument()
+    return out.getvalue()
+
+
+def _generate_rss() -> tuple[bytes, int]:
+    deals = db.fetch_active_deals("card", limit=RSS_ITEM_LIMIT)
+    return build_rss(deals), len(deals)
+
+
+def _generate_google() -> tuple[bytes, int]:
+    deals = db.fetch_active_deals("card", limit=GOOGLE_ITEM_LIMIT)
+    return build_google_shopping(deals), len(deals)
+
+
+_GENERATORS: Dict[str, Callable[[], tuple[bytes, int]]] = {
+    "rss": _generate_rss,
+    "google": _generate_google,
+}
+_snapshots: Dict[str, FeedSnapshot] = {}
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def get_feed(name: str) -> FeedSnapshot:
+    """캐시된 피드 반환 — 데이터 버전이 바뀌었으면 1회만 재생성 (동시 요청은 대기 후 공유)"""
+    version = db.get_data_version()
+    snap = _snapshots.get(name)
+    if snap and snap.version == version:
+        return snap
+
+    lock = _locks.setdefault(name, asyncio.Lock())
+    async with lock:
+        snap = _snapshots.get(name)
+        if snap and snap.version == version:
+            return snap
+        started = time.monotonic()
+        body, count = await db.run_db(_GENERATORS[name])
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        snap = FeedSnapshot(
+            body=body,
+            etag=f'"{digest}"',
+            last_modified=formatdate(usegmt=True),
+            generated_at=time.time(),
+            version=version,
+            item_count=count,
+        )
+        # 내용이 그대로면 Last-Modified 유지 (크롤러 조건부 요청 적중률 ↑)
+        prev = _snapshots.get(name)
+        if prev and prev.etag == snap.etag:
+            snap.last_modified = prev.last_modified
+        _snapshots[name] = snap
+        logger.info(
+            f"[피드] {name} 재생성: {count}개 | {len(body) // 1024}KB | "
+            f"{(time.monotonic() - started) * 1000:.0f}ms"
+        )
+        return snap
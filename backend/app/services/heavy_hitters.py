@@ -0,0 +1,89 @@
+"""
+Top-K 빈도 집계 (Space-Saving)
+
+- 고정 용량 카운터로 스트림의 상위 항목을 추적 → 이벤트 수와 무관한 O(capacity) 메모리
+- 빈도가 N/capacity 를 넘는 항목은 반드시 포함, count 는 실제값 이상 (count - error 이하 보장)
+- 인스턴스/날짜 간 병합 가능 (Agarwal et al., Mergeable Summaries)
+
+사용처: 관리자 Top10 클릭 딜, 인기 검색어
+"""
+from typing import Any, Hashable, List, Optional, Tuple
+
+from app.services.sketch_store import DailySketchStore, register
+
+DEFAULT_CAPACITY = 512
+
+
+class SpaceSaving:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.counters: dict = {}  # item → [count, error]
+
+    def __len__(self) -> int:
+        return len(self.counters)
+
+    def _min_item(self) -> Tuple[Optional[Hashable], int]:
+        if not self.counters:
+            return None, 0
+        item = min(self.counters, key=lambda k: self.counters[k][0])
+        return item, self.counters[item][0]
+
+    def offer(self, item: Hashable, n: int = 1) -> None:
+        c = self.counters.get(item)
+        if c is not None:
+            c[0] += n
+        elif len(self.counters) < self.capacity:
+            self.counters[item] = [n, 0]
+        else:
+            victim, floor = self._min_item()
+            del self.counters[victim]
+            self.counters[item] = [floor + n, floor]
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """other 를 병합 — 한쪽에만 있는 항목은 반대쪽(가득 찬 경우) 최소값을 오차로 가산"""
+        floor_self = self._min_item()[1] if len(self) >= self.capacity else 0
+        floor_other = other._min_item()[1] if len(other) >= other.capacity else 0
+        merged: dict = {}
+        for item in set(self.counters) | set(other.counters):
+            a = self.counters.get(item, [floor_self, floor_self])
+            b = other.counters.get(item, [floor_other, floor_other])
+            merged[item] = [a[0] + b[0], a[1] + b[1]]
+        if len(merged) > self.capacity:
+            keep = sorted(merged, key=lambda k: merged[k][0], reverse=True)[: self.capacity]
+            merged = {k: merged[k] for k in keep}
+        self.counters = merged
+
+    def top(self, k: int) -> List[Tuple[Any, int, int]]:
+        """상위 k개 (item, count, error) — count 내림차순"""
+        ranked = sorted(self.counters.items(), key=lambda kv: kv[1][0], reverse=True)
+        return [(item, c[0], c[1]) for item, c in ranked[:k]]
+
+    def to_payload(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "items": [[item, c[0], c[1]] for item, c in self.counters.items()],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "SpaceSaving":
+        sk = cls(payload.get("capacity", DEFAULT_CAPACITY))
+        sk.counters = {item: [int(cnt), int(err)] for item, cnt, err in payload.get("items", [])}
+        return sk
+
+
+top_clicks = register(DailySketchStore("top_clicks", SpaceSaving, SpaceSaving.from_payload))
+top_searches = register(DailySketchStore("top_searches", SpaceSaving, SpaceSaving.from_payload))
+
+
+def normalize_keyword(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+def record_click(deal_id: int) -> None:
+    top_clicks.update(lambda sk: sk.offer(deal_id))
+
+
+def record_search(keyword: str) -> None:
+    kw = normalize_keyword(keyword)
+    if kw:
+        top_searches.update(lambda sk: sk.offer(kw))
@@ -0,0 +1,198 @@
+"""
+호스트별 요청 조율 (politeness + circuit breaker)
+
+커뮤니티 수집 / 원글 만료 확인 / URL 생존 확인 / 이미지 다운로드가 같은 호스트
+(ppomppu, clien, quasarzone, coupang ...)를 서로 다른 잡에서 동시에 두드리므로,
+모든 외부 GET/HEAD 를 request() 로 통과시켜 호스트 단위로 조율한다.
+
+- 호스트별 동시 요청 수(concurrency) + 요청 간 최소 간격(min_interval)
+- 타임아웃/연결 오류/429/5xx 는 지수 backoff 재시도 (429 는 Retry-After 존중, 상한 있음)
+- 연속 실패 fail_threshold 회 → cooldown 초 동안 circuit open: 요청 없이 CircuitOpenError
+  cooldown 이후 첫 요청이 다시 실패하면 즉시 재차단 (half-open)
+- 상태는 프로세스 로컬 (인스턴스별)
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services import job_metrics
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_RETRY_AFTER = 30.0
+
+
+class CircuitOpenError(Exception):
+    """호스트 circuit open — 요청을 보내지 않고 즉시 실패"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} circuit open ({retry_in:.0f}s 남음)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    concurrency: int = 4
+    min_interval: float = 0.0   # 같은 호스트 요청 시작 간 최소 간격 (초)
+    retries: int = 1
+    backoff: float = 0.5        # 재시도 대기 = backoff × 2^시도
+    fail_threshold: int = 5
+    cooldown: float = 300.0
+
+
+# 등록 도메인(접미사) → 정책. 서브도메인(cdn., m., bbs. 등)은 같은 예산을 공유
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    "ppomppu.co.kr": HostPolicy(concurrency=2, min_interval=0.5, retries=2),
+    "clien.net": HostPolicy(concurrency=2, min_interval=0.5, retries=2),
+    "quasarzone.com": HostPolicy(concurrency=1, min_interval=1.0, retries=2),
+    "eomisae.co.kr": HostPolicy(concurrency=2, min_interval=0.5, retries=2),
+    "ruliweb.com": HostPolicy(concurrency=2, min_interval=0.5, retries=2),
+    "algumon.com": HostPolicy(concurrency=1, min_interval=0.3, retries=2),
+    "coupang.com": HostPolicy(concurrency=1, min_interval=1.0, retries=1, fail_threshold=3, cooldown=600.0),
+}
+DEFAULT_POLICY = HostPolicy()
+
+
+@dataclass
+class _HostState:
+    policy: HostPolicy
+    loop: object = None
+    sem: Optional[asyncio.Semaphore] = None
+    pace_lock: Optional[asyncio.Lock] = None
+    next_start: float = 0.0
+    failures: int = 0
+    open_until: float = 0.0
+    stats: Dict[str, int] = field(default_factory=lambda: {
+        "requests": 0, "retries": 0, "failures": 0, "short_circuited": 0, "opened": 0,
+    })
+
+    def bind(self) -> None:
+        """이벤트 루프가 바뀌면 (스크립트 재실행 등) 동기화 객체 재생성"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            self.loop = loop
+            self.sem = asyncio.Semaphore(self.policy.concurrency)
+            self.pace_lock = asyncio.Lock()
+
+
+_hosts: Dict[str, _HostState] = {}
+
+
+def host_key(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    for suffix in HOST_POLICIES:
+        if host == suffix or host.endswith("." + suffix):
+            return suffix
+    return host
+
+
+def _state(key: str) -> _HostState:
+    state = _hosts.get(key)
+    if state is None:
+        state = _hosts[key] = _HostState(policy=HOST_POLICIES.get(key, DEFAULT_POLICY))
+    return state
+
+
+def is_open(url: str) -> bool:
+    """해당 호스트가 현재 차단(circuit open) 상태인지"""
+    return _state(host_key(url)).open_until > time.monotonic()
+
+
+async def _pace(state: _HostState) -> None:
+    if state.policy.min_interval <= 0:
+        return
+    async with state.pace_lock:
+        wait = state.next_start - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        state.next_start = time.monotonic() + state.policy.min_interval
+
+
+def _record_failure(key: str, state: _HostState) -> None:
+    state.failures += 1
+    state.stats["failures"] += 1
+    if state.failures >= state.policy.fail_threshold:
+        state.open_until = time.monotonic() + state.policy.cooldown
+        state.stats["opened"] += 1
+        logger.warning(
+            f"[호스트가드] {key} 연속 실패 {state.failures}회 → {state.policy.cooldown:.0f}초 차단"
+        )
+
+
+def _retry_delay(policy: HostPolicy, attempt: int, resp: Optional[httpx.Response]) -> float:
+    delay = policy.backoff * (2 ** attempt)
+    if resp is not None and resp.status_code == 429:
+        try:
+            delay = max(delay, float(resp.headers.get("retry-after", 0)))
+        except ValueError:
+            pass
+    return min(delay, MAX_RETRY_AFTER)
+
+
+async def request(
+    client: httpx.AsyncClient, method: str, url: str, *, stream: bool = False, **kwargs
+) -> httpx.Response:
+    """
+    client.request 를 호스트 정책으로 감싼 호출.
+    stream=True: 본문을 읽지 않은 응답 반환 — 호출 측에서 aiter_bytes() 후 반드시 aclose()
+    재시도 소진 시: 마지막 응답(429/5xx) 반환 또는 마지막 예외 raise
+    circuit open 시: CircuitOpenError (httpx 요청 없음)
+    """
+    key = host_key(url)
+    state = _state(key)
+    now = time.monotonic()
+    if state.open_until > now:
+        state.stats["short_circuited"] += 1
+        raise CircuitOpenError(key, state.open_until - now)
+
+    state.bind()
+    policy = state.policy
+    follow_redirects = kwargs.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+    last_exc: Optional[Exception] = None
+    resp: Optional[httpx.Response] = None
+    for attempt in range(policy.retries + 1):
+        if attempt:
+            state.stats["retries"] += 1
+            await asyncio.sleep(_retry_delay(policy, attempt - 1, resp))
+            if stream and resp is not None:
+                await resp.aclose()
+        async with state.sem:
+            await _pace(state)
+            state.stats["requests"] += 1
+            job_metrics.add(http_calls=1)
+            try:
+                req = client.build_request(method, url, **kwargs)
+                resp = await client.send(req, stream=stream, follow_redirects=follow_redirects)
+                last_exc = None
+            except httpx.TransportError as e:  # 타임아웃/연결 오류
+                resp, last_exc = None, e
+                continue
+        if resp.status_code not in RETRY_STATUS:
+            state.failures = 0
+            state.open_until = 0.0
+            return resp
+
+    _record_failure(key, state)
+    if last_exc is not None:
+        raise last_exc
+    return resp
+
+
+def get_stats() -> Dict[str, dict]:
+    """호스트별 요청/재시도/실패/차단 통계 + 현재 circuit 상태"""
+    now = time.monotonic()
+    return {
+        key: {
+            **state.stats,
+            "consecutive_failures": state.failures,
+            "open_for": round(state.open_until - now, 1) if state.open_until > now else 0,
+        }
+        for key, state in _hosts.items()
+    }
@@ -0,0 +1,74 @@
+"""
+고유 방문자/세션 수 추정 (HyperLogLog)
+
+- 2^p 개 6bit 레지스터 (p=12 → 4KB, 표준오차 약 1.6%) — 트래픽과 무관한 고정 메모리
+- 레지스터별 max 로 병합 → 인스턴스/날짜 합산 가능
+- 소량 구간은 linear counting 보정 (Flajolet et al. 2007, Heule et al. 2013)
+
+사용처: /api/stats today_visitors, 관리자 메트릭/방문자 고유 IP·세션 수
+"""
+import base64
+import hashlib
+import math
+
+from app.services.sketch_store import DailySketchStore, kst_today, register
+
+DEFAULT_PRECISION = 12
+
+
+class HyperLogLog:
+    def __init__(self, p: int = DEFAULT_PRECISION):
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+
+    def add(self, value: str) -> None:
+        x = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        idx = x >> (64 - self.p)
+        rest = x & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.p != self.p:
+            raise ValueError("precision 불일치")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_payload(self) -> dict:
+        return {"p": self.p, "registers": base64.b64encode(bytes(self.registers)).decode("ascii")}
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "HyperLogLog":
+        hll = cls(payload.get("p", DEFAULT_PRECISION))
+        hll.registers = bytearray(base64.b64decode(payload["registers"]))
+        return hll
+
+
+unique_ips = register(DailySketchStore("uv_ip", HyperLogLog, HyperLogLog.from_payload))
+unique_sessions = register(DailySketchStore("uv_session", HyperLogLog, HyperLogLog.from_payload))
+
+
+def record_visitor(ip_address: str = None, session_id: str = None) -> None:
+    if ip_address:
+        unique_ips.update(lambda h: h.add(ip_address))
+    if session_id:
+        unique_sessions.update(lambda h: h.add(session_id))
+
+
+def count_visitors(days: list) -> dict:
+    """지정 KST 날짜들의 고유 IP / 세션 수 추정"""
+    days = days or [kst_today()]
+    return {
+        "ips": unique_ips.merged(days).count(),
+        "sessions": unique_sessions.merged(days).count(),
+    }
@@ -8,6 +8,8 @@ import httpx
 from pathlib import Path
 from typing import Optional
 
+from app.services import host_guard
+
 # 저장 경로 (backend 기준 상대 경로)
 SAVE_DIR = Path(__file__).resolve().parents[3] / "frontend" / "public" / "images" / "deals"
 SAVE_DIR.mkdir(parents=True, exist_ok=True)
@@ -54,8 +56,8 @@ async def download_image(url: str, timeout: float = 8.0) -> Optional[str]:
 
     try:
         async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                url,
+            resp = await host_guard.request(
+                client, "GET", url,
                 headers=HEADERS,
                 timeout=timeout,
                 follow_redirects=True,
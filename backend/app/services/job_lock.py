@@ -0,0 +1,230 @@
+"""
+스케줄러 잡 분산 락 (lease)
+
+여러 인스턴스(API 레플리카 / 워커)가 같은 잡을 동시에·같은 주기에 중복 실행하지 않도록
+잡 실행 전 잡 이름으로 임대를 획득하고, 실행 중에는 heartbeat 로 연장, 끝나면 반납한다.
+
+- 획득: 비어 있음 / 만료 / 이미 내 것 → 성공. 실패 시 이번 실행은 건너뜀 (job_metrics 스킵 집계)
+- heartbeat: TTL/3 마다 연장 — 인스턴스가 죽으면 TTL 뒤 자동 해제
+  · 연장 거부(임대 상실 — 다른 인스턴스가 만료 후 인계)면 실행 중인 잡 태스크를 취소하고 LeaseLost 로 종료
+    → 두 인스턴스가 같은 잡을 계속 동시에 돌리지 않음 (반납도 하지 않음 — 이미 남의 임대)
+- 반납: 획득 시각 + 잡 주기×KEEP_RATIO 까지 유지 → 주기가 어긋난 다른 인스턴스가 같은 주기에 또 돌리지 않음
+
+백엔드 (settings.JOB_LOCK_BACKEND)
+- supabase : job_locks 테이블 + RPC (migrations/011) — DB 시계 기준
+- file     : JOB_LOCK_DIR 의 잡별 JSON 파일 + flock — 같은 호스트 여러 프로세스 / 로컬 개발·테스트용
+- none     : 항상 획득 (단일 인스턴스)
+락 저장소 오류 시에는 잡을 멈추지 않고 락 없이 실행 (fail-open, 경고 로그)
+"""
+import abc
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Optional
+
+import app.db_supabase as db
+from app.config import settings
+from app.services import job_metrics
+from app.services.sketch_store import INSTANCE_ID
+
+logger = logging.getLogger(__name__)
+
+KEEP_RATIO = 0.8   # 반납 후에도 주기의 80% 동안은 다른 인스턴스 실행 차단
+
+
+class LeaseLost(Exception):
+    """실행 중 임대를 잃어 잡을 중단함"""
+
+
+class LockBackend(abc.ABC):
+    @abc.abstractmethod
+    def acquire(self, name: str, owner: str, ttl: int) -> bool:
+        """비어 있음 / 만료 / 이미 내 것 → True"""
+
+    @abc.abstractmethod
+    def renew(self, name: str, owner: str, ttl: int) -> bool:
+        """내 임대면 만료 연장 후 True, 아니면 False"""
+
+    @abc.abstractmethod
+    def release(self, name: str, owner: str, keep_seconds: int = 0) -> None:
+        """내 임대면 만료를 max(지금, 획득 시각 + keep_seconds) 로"""
+
+
+class NullLockBackend(LockBackend):
+    def acquire(self, name, owner, ttl):
+        return True
+
+    def renew(self, name, owner, ttl):
+        return True
+
+    def release(self, name, owner, keep_seconds=0):
+        pass
+
+
+class SupabaseLockBackend(LockBackend):
+    def _rpc(self, fn: str, params: dict):
+        return db.get_supabase().rpc(fn, params).execute().data
+
+    def acquire(self, name, owner, ttl):
+        return bool(self._rpc("acquire_job_lock", {"p_name": name, "p_owner": owner, "p_ttl_seconds": ttl}))
+
+    def renew(self, name, owner, ttl):
+        return bool(self._rpc("renew_job_lock", {"p_name": name, "p_owner": owner, "p_ttl_seconds": ttl}))
+
+    def release(self, name, owner, keep_seconds=0):
+        self._rpc("release_job_lock", {"p_name": name, "p_owner": owner, "p_keep_seconds": keep_seconds})
+
+
+class FileLockBackend(LockBackend):
+    """잡별 파일에 {owner, acquired_at, expires_at} — 읽기/쓰기 구간만 flock 으로 직렬화 (DB 백엔드와 같은 의미)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _update(self, name: str, fn):
+        import fcntl  # POSIX 전용 — file 백엔드 선택 시에만 필요
+        path = os.path.join(self.directory, f"{name}.lock")
+        with open(path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                try:
+                    state = json.loads(raw) if raw else None
+                except ValueError:
+                    state = None
+                result, new_state = fn(state, time.time())
+                if new_state is not state:
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(new_state))
+                    f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def acquire(self, name, owner, ttl):
+        def fn(state, now):
+            if state and state["owner"] != owner and state["expires_at"] >= now:
+                return False, state
+            return True, {"owner": owner, "acquired_at": now, "expires_at": now + ttl}
+        return self._update(name, fn)
+
+    def renew(self, name, owner, ttl):
+        def fn(state, now):
+            if not state or state["owner"] != owner:
+                return False, state
+            return True, {**state, "expires_at": now + ttl}
+        return self._update(name, fn)
+
+    def release(self, name, owner, keep_seconds=0):
+        def fn(state, now):
+            if not state or state["owner"] != owner:
+                return None, state
+            return None, {**state, "expires_at": max(now, state["acquired_at"] + keep_seconds)}
+        self._update(name, fn)
+
+
+_backend: Optional[LockBackend] = None
+
+
+def get_backend() -> LockBackend:
+    global _backend
+    if _backend is None:
+        kind = settings.JOB_LOCK_BACKEND
+        if kind == "supabase":
+            _backend = SupabaseLockBackend()
+        elif kind == "file":
+            _backend = FileLockBackend(settings.JOB_LOCK_DIR)
+        elif kind == "none":
+            _backend = NullLockBackend()
+        else:
+            raise ValueError(f"JOB_LOCK_BACKEND must be supabase | file | none: {kind}")
+    return _backend
+
+
+async def _heartbeat(backend: LockBackend, name: str, ttl: int, on_lost) -> None:
+    while True:
+        await asyncio.sleep(ttl / 3)
+        try:
+            if not await db.run_db(backend.renew, name, INSTANCE_ID, ttl):
+                logger.warning(f"[잡락] {name} 임대 상실 — 다른 인스턴스가 인계, 실행 중단")
+                on_lost()
+                return
+        except Exception as e:
+            logger.warning(f"[잡락] {name} heartbeat 실패: {e}")
+
+
+@asynccontextmanager
+async def lease(name: str, ttl: Optional[int] = None, keep_seconds: float = 0) -> AsyncIterator[bool]:
+    """async with lease("sync_ppomppu") as acquired: ... — acquired=False 면 다른 인스턴스가 보유 중
+
+    블록 실행 중 임대를 잃으면 블록을 실행하던 태스크가 취소되고 LeaseLost 가 발생
+    """
+    backend = get_backend()
+    ttl = ttl or settings.JOB_LOCK_TTL
+    try:
+        acquired = await db.run_db(backend.acquire, name, INSTANCE_ID, ttl)
+    except Exception as e:
+        logger.warning(f"[잡락] {name} 획득 오류 — 락 없이 실행: {e}")
+        yield True
+        return
+    if not acquired:
+        yield False
+        return
+
+    owner_task = asyncio.current_task()
+    lost = False
+
+    def on_lost() -> None:
+        nonlocal lost
+        lost = True
+        owner_task.cancel()
+
+    heartbeat = asyncio.create_task(_heartbeat(backend, name, ttl, on_lost))
+    try:
+        yield True
+    except asyncio.CancelledError:
+        if lost:
+            raise LeaseLost(name) from None
+        raise
+    finally:
+        heartbeat.cancel()
+        if not lost:
+            try:
+                await db.run_db(backend.release, name, INSTANCE_ID, int(keep_seconds))
+            except Exception as e:
+                logger.warning(f"[잡락] {name} 반납 실패 (TTL 후 자동 해제): {e}")
+
+
+def guard(job_id: str, fn, scheduler=None):
+    """잡 함수 → 락 획득 시에만 실행하는 래퍼 (획득 실패 / 실행 중 임대 상실은 job_metrics 에 lock_busy / lease_lost 로 집계)"""
+    async def run(*args, **kwargs):
+        job = scheduler.get_job(job_id) if scheduler else None
+        interval = getattr(getattr(job, "trigger", None), "interval", None)
+        keep = interval.total_seconds() * KEEP_RATIO if interval else 0
+        try:
+            async with lease(job_id, keep_seconds=keep) as acquired:
+                if not acquired:
+                    job_metrics.record_skip(job_id, "lock_busy")
+                    logger.debug(f"[잡락] {job_id} 다른 인스턴스 실행 중/직후 → 건너뜀")
+                    return None
+                return await fn(*args, **kwargs)
+        except LeaseLost:
+            job_metrics.record_skip(job_id, "lease_lost")
+            return None
+
+    run.__name__ = getattr(fn, "__name__", job_id)
+    return run
+
+
+def guard_all(scheduler, exclude: Iterable[str] = ()) -> None:
+    """exclude(인스턴스 로컬 잡) 외 모든 잡에 분산 락 적용 — job_metrics.instrument_all 이후 호출"""
+    exclude = set(exclude)
+    for job in scheduler.get_jobs():
+        if job.id not in exclude:
+            job.modify(func=guard(job.id, job.func, scheduler))
@@ -0,0 +1,207 @@
+"""
+스케줄러 잡 실행 계측
+
+- instrument_all(scheduler): 등록된 모든 잡 func 를 계측 래퍼로 교체 (start 직전 1회)
+- 실행 1회마다 JobRun 기록: 시작 시각 / 소요시간 / 상태 / 에러 / 카운터 / 주기 초과(overran)
+  · 잡 대부분은 예외를 잡아 logger.error 로만 남기므로, 실행 중 app.* 로거의 ERROR 로그를 잡아 상태=error 로 기록
+  · 카운터: 잡 코드에서 add(created=.., skipped=..), host_guard 가 외부 HTTP 호출 수(http_calls) 자동 가산
+- 인스턴스 로컬 링버퍼(잡당 RING_SIZE 회) + job_runs 테이블(migrations/010) 적재
+  · 인스턴스마다 짧은 주기로 도는 잡(로컬 캐시 flush, 데이터 버전 동기화)은 링버퍼만 — 테이블 폭증 방지
+- APScheduler max_instances 초과(이전 실행이 아직 진행 중) / misfire / 분산 락 미획득(lock_busy) 스킵, 실행 중 임대 상실(lease_lost) 중단도 잡별로 집계
+- summary(): 잡별 소요시간 p50/p90/p99, 에러·주기 초과 횟수 (/admin/jobs)
+"""
+import logging
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RING_SIZE = 200
+
+_runs: Dict[str, Deque["JobRun"]] = defaultdict(lambda: deque(maxlen=RING_SIZE))
+_skips: Dict[str, Counter] = defaultdict(Counter)  # job_id → {max_instances, missed, lock_busy, lease_lost}
+_running: Dict[str, int] = Counter()
+_current: ContextVar[Optional["JobRun"]] = ContextVar("job_metrics_current", default=None)
+_counter_lock = threading.Lock()  # add() 는 db.run_db 워커 스레드에서도 호출됨
+_scheduler = None
+_error_handler: Optional[logging.Handler] = None
+
+
+@dataclass
+class JobRun:
+    job_id: str
+    started_at: datetime
+    duration_ms: int = 0
+    status: str = "ok"
+    error: Optional[str] = None
+    counters: Dict[str, int] = field(default_factory=dict)
+    overran: bool = False
+
+
+def add(**counts: int) -> None:
+    """현재 실행 중인 잡 카운터 가산 (잡 밖에서 호출되면 무시)"""
+    run = _current.get()
+    if run is None:
+        return
+    with _counter_lock:
+        for name, n in counts.items():
+            run.counters[name] = run.counters.get(name, 0) + int(n or 0)
+
+
+class _ErrorCapture(logging.Handler):
+    """잡 실행 컨텍스트 안에서 발생한 ERROR 로그 → 해당 JobRun 에러로 기록"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        run = _current.get()
+        if run is not None and run.status == "ok":
+            run.status = "error"
+            run.error = record.getMessage()[:500]
+
+
+def _interval_seconds(job_id: str) -> Optional[float]:
+    job = _scheduler.get_job(job_id) if _scheduler else None
+    interval = getattr(getattr(job, "trigger", None), "interval", None)
+    return interval.total_seconds() if interval else None
+
+
+async def _persist(run: JobRun) -> None:
+    try:
+        import app.db_supabase as db
+        from app.services.sketch_store import INSTANCE_ID
+        row = asdict(run)
+        row["started_at"] = run.started_at.isoformat()
+        row["instance"] = INSTANCE_ID
+        await db.run_db(db.insert_job_runs, [row])
+    except Exception as e:
+        logger.debug(f"[잡계측] job_runs 저장 실패: {e}")
+
+
+def instrument(job_id: str, fn, persist: bool = True):
+    """async 잡 함수 → 계측 래퍼 (persist=False 면 job_runs 적재 없이 링버퍼만)"""
+    async def run(*args, **kwargs):
+        record = JobRun(job_id=job_id, started_at=datetime.now(timezone.utc))
+        token = _current.set(record)
+        _running[job_id] += 1
+        started = time.monotonic()
+        try:
+            return await fn(*args, **kwargs)
+        except BaseException as e:
+            record.status = "error"
+            record.error = f"{type(e).__name__}: {e}"[:500]
+            raise
+        finally:
+            _current.reset(token)
+            _running[job_id] -= 1
+            elapsed = time.monotonic() - started
+            record.duration_ms = int(elapsed * 1000)
+            interval = _interval_seconds(job_id)
+            record.overran = bool(interval and elapsed > interval)
+            if record.overran:
+                logger.warning(f"[잡계측] {job_id} 주기 초과: {elapsed:.1f}s > {interval:.0f}s")
+            _runs[job_id].append(record)
+            if persist:
+                await _persist(record)
+
+    run.__name__ = getattr(fn, "__name__", job_id)
+    return run
+
+
+def record_skip(job_id: str, reason: str) -> None:
+    """실행되지 않은(또는 중단된) 회차 집계 (max_instances / missed / lock_busy / lease_lost)"""
+    _skips[job_id][reason] += 1
+
+
+def _on_event(event) -> None:
+    from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+    if event.code == EVENT_JOB_MAX_INSTANCES:
+        record_skip(event.job_id, "max_instances")
+        logger.warning(f"[잡계측] {event.job_id} 이전 실행 진행 중 → 이번 실행 건너뜀")
+    elif event.code == EVENT_JOB_MISSED:
+        record_skip(event.job_id, "missed")
+
+
+def instrument_all(scheduler, no_persist: Iterable[str] = ()) -> None:
+    """scheduler.start() 직전 호출 — 모든 잡 계측 + 에러 로그 캡처 + 스킵 이벤트 리스너
+
+    no_persist: job_runs 테이블에 적재하지 않을 잡 (링버퍼 / /admin/jobs 인스턴스 요약에는 포함)
+    """
+    global _scheduler, _error_handler
+    from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+
+    _scheduler = scheduler
+    no_persist = set(no_persist)
+    for job in scheduler.get_jobs():
+        job.modify(func=instrument(job.id, job.func, persist=job.id not in no_persist))
+    if _error_handler is None:
+        _error_handler = _ErrorCapture(level=logging.ERROR)
+        logging.getLogger("app").addHandler(_error_handler)
+    scheduler.add_listener(_on_event, EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED)
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """선형 보간 백분위수 (p: 0~100)"""
+    if not values:
+        return None
+    xs = sorted(values)
+    k = (len(xs) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(xs) - 1)
+    return round(xs[lo] + (xs[hi] - xs[lo]) * (k - lo), 1)
+
+
+def summarize_runs(runs: List[dict]) -> dict:
+    """실행 이력(dict 목록, 최신순) → 소요시간 백분위 / 에러·주기 초과 / 카운터 합계"""
+    durations = [r["duration_ms"] for r in runs]
+    counters: Counter = Counter()
+    for r in runs:
+        counters.update(r.get("counters") or {})
+    errors = [r for r in runs if r["status"] == "error"]
+    last = runs[0] if runs else None
+    return {
+        "runs": len(runs),
+        "p50_ms": percentile(durations, 50),
+        "p90_ms": percentile(durations, 90),
+        "p99_ms": percentile(durations, 99),
+        "max_ms": max(durations) if durations else None,
+        "errors": len(errors),
+        "overruns": sum(1 for r in runs if r.get("overran")),
+        "counters": dict(counters),
+        "last_started_at": str(last["started_at"]) if last else None,
+        "last_status": last["status"] if last else None,
+        "last_error": errors[0]["error"] if errors else None,
+    }
+
+
+def recent_runs(job_id: str, limit: int = 50) -> List[dict]:
+    """인스턴스 로컬 최근 실행 (최신순)"""
+    runs = list(_runs.get(job_id, ()))[::-1][:limit]
+    return [{**asdict(r), "started_at": r.started_at.isoformat()} for r in runs]
+
+
+def summary() -> Dict[str, dict]:
+    """잡별 요약 (인스턴스 로컬 링버퍼 기준) + 스케줄 정보"""
+    job_ids = set(_runs) | set(_skips)
+    if _scheduler is not None:
+        job_ids |= {job.id for job in _scheduler.get_jobs()}
+    out = {}
+    for job_id in sorted(job_ids):
+        runs = recent_runs(job_id, RING_SIZE)
+        job = _scheduler.get_job(job_id) if _scheduler else None
+        next_run = getattr(job, "next_run_time", None)  # start 전 pending 잡은 속성 없음
+        out[job_id] = {
+            **summarize_runs(runs),
+            "name": getattr(job, "name", None),
+            "interval_seconds": _interval_seconds(job_id),
+            "next_run_time": next_run.isoformat() if next_run else None,
+            "running": _running.get(job_id, 0),
+            "skipped_max_instances": _skips[job_id]["max_instances"],
+            "missed": _skips[job_id]["missed"],
+            "skipped_lock_busy": _skips[job_id]["lock_busy"],
+            "lease_lost": _skips[job_id]["lease_lost"],
+        }
+    return out
@@ -0,0 +1,101 @@
+"""
+인기 검색어 통계 사전 계산 (C-024)
+
+- 최근 7일 검색어 Top-K 스케치 × 딜 검색 인덱스 → keyword → (count, max_discount, min_price)
+- 스케줄러가 주기적으로 refresh(), /api/search/popular 는 결과 테이블을 그대로 반환
+  (키워드마다 deals ilike 쿼리 → 요청당 N회 풀스캔 제거)
+- 스케치가 비어 있으면(신규 배포 직후 등) 최근 7일 event_logs 검색 이벤트로 시드
+- TOP_KEYWORDS 초과 limit 은 캐시 없이 그때그때 계산
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import app.db_supabase as db
+from app.services import heavy_hitters, search_index
+from app.services.deal_catalog import get_catalog
+from app.services.sketch_store import kst_today
+
+logger = logging.getLogger(__name__)
+
+TOP_KEYWORDS = 50
+WINDOW_DAYS = 7
+STALE_SECONDS = 600  # 스케줄러 누락 시 요청 경로에서 재계산하는 기준
+
+_table: list[dict] = []
+_built_at: Optional[float] = None
+_lock = threading.Lock()
+
+
+def _keyword_entry(keyword: str, count: int, deals: list[dict]) -> dict:
+    max_discount = 0.0
+    min_price: Optional[float] = None
+    for d in deals:
+        rate = float(d.get("discount_rate") or 0)
+        if rate <= 0:
+            continue
+        max_discount = max(max_discount, rate)
+        price = float(d.get("sale_price") or 0)
+        if price > 0 and (min_price is None or price < min_price):
+            min_price = price
+    return {
+        "keyword": keyword,
+        "count": count,
+        "discount_rate": round(max_discount) if max_discount > 0 else None,
+        "min_price": round(min_price) if min_price is not None else None,
+    }
+
+
+def _event_log_top(limit: int) -> list[tuple[str, int]]:
+    """스케치 공백 시 fallback — 최근 WINDOW_DAYS 일 event_logs 검색어 빈도"""
+    since = (datetime.now(timezone.utc) - timedelta(days=WINDOW_DAYS)).isoformat()
+    counter = Counter(
+        kw for kw in map(heavy_hitters.normalize_keyword, db.get_recent_search_keywords(since)) if kw
+    )
+    return counter.most_common(limit)
+
+
+def _top_keywords(limit: int) -> list[tuple[str, int]]:
+    today = kst_today()
+    top = heavy_hitters.top_searches.merged(
+        [today - timedelta(days=i) for i in range(WINDOW_DAYS)]
+    ).top(limit)
+    if top:
+        return [(kw, cnt) for kw, cnt, _ in top]
+    try:
+        return _event_log_top(limit)
+    except Exception as e:
+        logger.warning(f"[인기검색어] event_logs 시드 실패: {e}")
+        return []
+
+
+def _compute(limit: int) -> list[dict]:
+    catalog = get_catalog()
+    index = search_index.get_index(catalog)
+    return [
+        _keyword_entry(kw, cnt, [catalog.by_id[did] for did, _ in index.search(kw)])
+        for kw, cnt in _top_keywords(limit)
+    ]
+
+
+def refresh() -> int:
+    """키워드 통계 테이블 재계산. 키워드 수 반환"""
+    global _table, _built_at
+    table = _compute(TOP_KEYWORDS)
+    with _lock:
+        _table, _built_at = table, time.time()
+    return len(table)
+
+
+def get_popular(limit: int = 10) -> list[dict]:
+    """사전 계산 테이블 상위 limit개 (없거나 오래됐으면 1회 재계산, TOP_KEYWORDS 초과는 직접 계산)"""
+    if limit <= 0:
+        return []
+    if limit > TOP_KEYWORDS:
+        return _compute(limit)
+    if _built_at is None or time.time() - _built_at > STALE_SECONDS:
+        refresh()
+    return _table[:limit]
@@ -11,6 +11,7 @@ import asyncio
 import html
 from bs4 import BeautifulSoup
 from typing import Optional
+from app.services import host_guard
 
 RSS_URLS = {
     "ppomppu": "https://www.ppomppu.co.kr/rss.php?id=ppomppu",
@@ -212,7 +213,9 @@ async def fetch_ppomppu_deals() -> list[dict]:
         for name, url in RSS_URLS.items():
             is_foreign = "foreign" in name
             try:
-                resp = await client.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15.0, follow_redirects=True)
+                resp = await host_guard.request(
+                    client, "GET", url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15.0, follow_redirects=True
+                )
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.text, "xml")
                 batch_before = len(raw)
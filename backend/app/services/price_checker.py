@@ -12,6 +12,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from app.config import settings
+from app.services import host_guard
 
 
 PRICE_CHANGE_THRESHOLD = 0.10    # 10% 이상 오르면 "가격변동" 표시
@@ -93,16 +94,19 @@ async def check_naver_price(title: str, registered_price: float) -> Optional[flo
 
 
 async def check_url_alive(url: str) -> bool:
-    """URL이 살아있는지 HTTP HEAD 요청으로 확인"""
+    """URL이 살아있는지 HTTP HEAD 요청으로 확인 (호스트 차단 중이면 판단 보류 → True)"""
     async with httpx.AsyncClient() as client:
         try:
-            resp = await client.head(
-                url,
+            resp = await host_guard.request(
+                client, "HEAD", url,
                 timeout=5.0,
                 follow_redirects=True,
                 headers={"User-Agent": "Mozilla/5.0 (compatible; PriceBot/1.0)"},
             )
             return resp.status_code < 400
+        except host_guard.CircuitOpenError:
+            # 호스트 장애 중 — 딜 URL 사망으로 집계하지 않음
+            return True
         except Exception:
             return False
 
@@ -131,9 +135,11 @@ def evaluate_price_change(
         return {"action": "ok", "change_pct": round(change_pct * 100, 1)}
 
 
-async def verify_deal(deal) -> dict:
+async def verify_deal(deal, actual_price: Optional[float] = None) -> dict:
     """
     단일 딜 가격 검증
+    actual_price: 쇼핑몰 페이지에서 직접 읽은 현재가 (get_actual_prices 배치 결과)
+                  — 있으면 URL 생존 확인 / 네이버 검색 없이 이 가격으로 평가
     Returns: {verified_price, action, change_pct, url_alive}
     """
     deal_id = deal.get("id") if isinstance(deal, dict) else deal.id
@@ -154,20 +160,20 @@ async def verify_deal(deal) -> dict:
         "url_alive": True,
     }
 
-    # 1. URL 생존 확인
-    url_alive = await check_url_alive(deal_url)
+    # 1. URL 생존 확인 (쇼핑몰 현재가를 이미 읽었으면 생존 확인됨)
+    url_alive = actual_price is not None or await check_url_alive(deal_url)
     result["url_alive"] = url_alive
 
     if not url_alive:
         result["action"] = "url_dead"
         return result
 
-    # 2. 가격 확인 — productId 있으면 정확히, 없으면 키워드 검색
-    current_price = None
+    # 2. 가격 확인 — 쇼핑몰 현재가 > productId 조회 > 키워드 검색
+    current_price = actual_price
     naver_product_id = deal.get("naver_product_id") if isinstance(deal, dict) else getattr(deal, "naver_product_id", None)
 
     # admin 딜 포함 모든 소스 가격 체크 (coupang은 Naver 검색으로 보완)
-    if deal_source in ("naver", "community", "admin", "coupang"):
+    if current_price is None and deal_source in ("naver", "community", "admin", "coupang"):
         if naver_product_id:
             # productId로 직접 조회 → 정확한 현재 최저가
             current_price = await check_naver_price_by_id(str(naver_product_id))
@@ -144,7 +144,7 @@ async def collect_daily_snapshots() -> int:
     브랜드딜 전체 현재가 스냅샷 수집 (스케줄러에서 1일 1회 호출)
     """
     import httpx
-    from app.db_supabase import get_supabase
+    from app.db_supabase import get_supabase, run_db
     from app.services.brand_deals import PRODUCT_MSRP, NAVER_API_BASE, _get_naver_lprice
 
     sb = get_supabase()
@@ -166,7 +166,7 @@ async def collect_daily_snapshots() -> int:
                 result = await _get_naver_lprice(product["query"], headers, client)
                 if result:
                     lp, _, _, _ = result
-                    save_price_snapshot(sb, product["brand"], product["query"], lp)
+                    await run_db(save_price_snapshot, sb, product["brand"], product["query"], lp)
                     saved += 1
                     logger.debug(f"  스냅샷: {product['brand']} {product['query'][:30]} → {lp:,}원")
             except Exception as e:
@@ -2,18 +2,26 @@
 from .realtime_checker import RealtimePriceChecker, check_community_deal_price
 from .playwright_scraper import (
     get_actual_price,
+    get_actual_prices,
+    get_tier_stats,
     fetch_retailer_url_from_ppomppu,
     extract_retailer_links_from_page,
     normalize_retailer_url,
     PriceResult,
 )
+from .browser_pool import BrowserPool, get_pool, close_pool
 
 __all__ = [
     "RealtimePriceChecker",
     "check_community_deal_price",
     "get_actual_price",
+    "get_actual_prices",
+    "get_tier_stats",
     "fetch_retailer_url_from_ppomppu",
     "extract_retailer_links_from_page",
     "normalize_retailer_url",
     "PriceResult",
+    "BrowserPool",
+    "get_pool",
+    "close_pool",
 ]
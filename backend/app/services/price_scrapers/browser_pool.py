@@ -0,0 +1,187 @@
+"""
+Playwright 브라우저 풀
+
+- 최초 lease 시 Chromium N개를 띄우고 브라우저당 컨텍스트 M개를 슬롯으로 유지 (lazy start)
+  — asyncio Lock/Queue 는 실행 중 루프 안에서 생성 (모듈 import·풀 생성 시점의 루프에 묶이지 않도록)
+- lease(): 유휴 슬롯을 빌려 새 page 를 열어주고, 반납 시 page 만 닫음 (컨텍스트 재사용)
+- 컨텍스트는 max_uses 회 사용 후 / 오류 발생 시 폐기 후 재생성 (쿠키·메모리 누적 방지)
+- 브라우저 연결 끊김(크래시)은 lease 시점 헬스체크로 감지해 재기동
+- 호출 간 브라우저 기동 비용(수 초)을 없애 배치 가격 크롤링을 가능하게 함
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+LAUNCH_ARGS = [
+    "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+    "--disable-blink-features=AutomationControlled",
+]
+CONTEXT_OPTIONS = {
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+    ),
+    "locale": "ko-KR",
+    "viewport": {"width": 1280, "height": 800},
+}
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+@dataclass
+class _Slot:
+    browser_idx: int
+    context: object = None
+    uses: int = 0
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        browsers: int = settings.SCRAPER_BROWSERS,
+        contexts_per_browser: int = settings.SCRAPER_CONTEXTS_PER_BROWSER,
+        max_uses: int = settings.SCRAPER_CONTEXT_MAX_USES,
+    ):
+        self.size = browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.max_uses = max_uses
+        self._pw = None
+        self._browsers: List[object] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+        self._relaunch_locks: List[asyncio.Lock] = []
+
+    @property
+    def capacity(self) -> int:
+        return self.size * self.contexts_per_browser
+
+    @property
+    def started(self) -> bool:
+        return self._pw is not None
+
+    def _get_start_lock(self) -> asyncio.Lock:
+        """실행 중 루프에 묶인 시작 락 (await 없이 생성 — 같은 루프의 동시 호출도 하나만 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._start_lock is None or self._lock_loop is not loop:
+            self._start_lock, self._lock_loop = asyncio.Lock(), loop
+        return self._start_lock
+
+    async def _start(self) -> None:
+        async with self._get_start_lock():
+            if self._pw is not None:
+                return
+            from playwright.async_api import async_playwright
+            # 모든 브라우저 기동 성공 후에만 상태 반영 — 실패 시 정리하고 다음 lease 에서 재시도
+            pw = await async_playwright().start()
+            browsers: List[object] = []
+            try:
+                for _ in range(self.size):
+                    browsers.append(await self._launch(pw))
+            except Exception:
+                for browser in browsers:
+                    try:
+                        await browser.close()
+                    except Exception:
+                        pass
+                await pw.stop()
+                raise
+            idle: asyncio.Queue = asyncio.Queue()
+            for i in range(self.size):
+                for _ in range(self.contexts_per_browser):
+                    idle.put_nowait(_Slot(browser_idx=i))
+            self._browsers, self._idle = browsers, idle
+            self._relaunch_locks = [asyncio.Lock() for _ in range(self.size)]
+            self._pw = pw
+            logger.info(f"[브라우저풀] 시작: 브라우저 {self.size}개 × 컨텍스트 {self.contexts_per_browser}개")
+
+    async def _launch(self, pw=None):
+        return await (pw or self._pw).chromium.launch(headless=True, args=LAUNCH_ARGS)
+
+    async def _ensure_browser(self, idx: int):
+        """헬스체크: 연결 끊긴 브라우저는 재기동"""
+        browser = self._browsers[idx]
+        if browser.is_connected():
+            return browser
+        async with self._relaunch_locks[idx]:
+            if not self._browsers[idx].is_connected():
+                logger.warning(f"[브라우저풀] 브라우저 #{idx} 연결 끊김 → 재기동")
+                self._browsers[idx] = await self._launch()
+        return self._browsers[idx]
+
+    async def _discard_context(self, slot: _Slot) -> None:
+        if slot.context is not None:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        slot.context, slot.uses = None, 0
+
+    async def _prepare(self, slot: _Slot):
+        browser = await self._ensure_browser(slot.browser_idx)
+        if slot.context is not None and (slot.uses >= self.max_uses or slot.context.browser is not browser):
+            await self._discard_context(slot)
+        if slot.context is None:
+            slot.context = await browser.new_context(**CONTEXT_OPTIONS)
+            await slot.context.add_init_script(STEALTH_SCRIPT)
+        slot.uses += 1
+        return slot.context
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[object]:
+        """page 대여 (async with pool.lease() as page: ...)"""
+        if self._pw is None:
+            await self._start()
+        slot: _Slot = await self._idle.get()
+        page = None
+        healthy = True
+        try:
+            context = await self._prepare(slot)
+            page = await context.new_page()
+            yield page
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    healthy = False
+            if not healthy:
+                await self._discard_context(slot)
+            self._idle.put_nowait(slot)
+
+    async def close(self) -> None:
+        if self._pw is None:
+            return
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        try:
+            await self._pw.stop()
+        finally:
+            self._pw, self._browsers, self._idle = None, [], None
+        logger.info("[브라우저풀] 종료")
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_pool() -> BrowserPool:
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
+
+
+async def close_pool() -> None:
+    if _pool is not None:
+        await _pool.close()
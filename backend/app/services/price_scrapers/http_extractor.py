@@ -0,0 +1,115 @@
+"""
+HTTP 1차 가격 추출 (브라우저 없이 GET 1회)
+
+- JSON-LD Product offers → og/product:price 메타 → 페이지 내장 상태(JSON) 정규식 순으로 가격 탐색
+- 11번가/롯데온/SSG/지마켓/옥션은 대부분 SSR HTML 에 가격이 포함되어 있어 여기서 끝남
+- 못 찾으면 None → playwright_scraper 가 브라우저로 fallback
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import httpx
+
+from app.services.url_parser import HEADERS, _extract_json_ld
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = 8
+MIN_PRICE, MAX_PRICE = 100, 50_000_000
+
+_META_PRICE_RE = re.compile(
+    r'<meta[^>]+(?:property|name)=["\'](?:product:price:amount|og:price:amount)["\'][^>]+content=["\']([0-9.,]+)["\']',
+    re.IGNORECASE,
+)
+_OUT_OF_STOCK_LD = ("outofstock", "soldout", "discontinued")
+
+
+@dataclass
+class HttpPrice:
+    price: int
+    original_price: Optional[int]
+    in_stock: Optional[bool]   # None: HTML 에서 판단 불가 (품절 문구로 판단)
+    url: str
+    method: str                # json_ld / meta / state
+
+
+def _to_price(value) -> Optional[int]:
+    if value is None:
+        return None
+    text = str(value).replace(",", "")
+    m = re.match(r"\s*(\d+)(?:\.\d+)?", text)
+    if not m:
+        return None
+    price = int(m.group(1))
+    return price if MIN_PRICE <= price <= MAX_PRICE else None
+
+
+def _from_json_ld(html: str) -> Tuple[Optional[int], Optional[bool]]:
+    ld = _extract_json_ld(html)
+    offers = ld.get("offers") if ld else None
+    if isinstance(offers, list):
+        offers = offers[0] if offers else None
+    if not isinstance(offers, dict):
+        return None, None
+    price = _to_price(offers.get("price") or offers.get("lowPrice"))
+    availability = str(offers.get("availability") or "").lower()
+    in_stock = None
+    if availability:
+        in_stock = not any(k in availability for k in _OUT_OF_STOCK_LD)
+    return price, in_stock
+
+
+def _from_state(html: str, patterns: Tuple[str, ...]) -> Optional[int]:
+    """내장 상태 JSON (예: "finalPrice":12900) — 프로필 패턴 순서대로 첫 유효값"""
+    for pattern in patterns:
+        m = re.search(pattern, html)
+        if m:
+            price = _to_price(m.group(1))
+            if price:
+                return price
+    return None
+
+
+def parse_price_html(
+    html: str,
+    url: str,
+    state_patterns: Tuple[str, ...] = (),
+    original_patterns: Tuple[str, ...] = (),
+) -> Optional[HttpPrice]:
+    """HTML → HttpPrice (가격 미발견 시 None)"""
+    price, in_stock = _from_json_ld(html)
+    method = "json_ld"
+    if price is None:
+        m = _META_PRICE_RE.search(html)
+        price = _to_price(m.group(1)) if m else None
+        method = "meta"
+    if price is None:
+        price = _from_state(html, state_patterns)
+        method = "state"
+    if price is None:
+        return None
+    original = _from_state(html, original_patterns)
+    if original is not None and original < price:
+        original = None
+    return HttpPrice(price=price, original_price=original, in_stock=in_stock, url=url, method=method)
+
+
+async def fetch_price_http(
+    url: str,
+    state_patterns: Tuple[str, ...] = (),
+    original_patterns: Tuple[str, ...] = (),
+) -> Tuple[Optional[HttpPrice], str]:
+    """GET 1회 후 가격 파싱. (결과, html) 반환 — 품절 문구 판단용으로 html 도 넘김"""
+    try:
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, headers=HEADERS, follow_redirects=True) as client:
+            r = await client.get(url)
+    except Exception as e:
+        logger.debug(f"[HTTP추출] 요청 실패: {url[:50]} ({e})")
+        return None, ""
+    if r.status_code != 200:
+        logger.debug(f"[HTTP추출] HTTP {r.status_code}: {url[:50]}")
+        return None, ""
+    html = r.text
+    return parse_price_html(html, str(r.url), state_patterns, original_patterns), html
@@ -6,11 +6,24 @@
 핵심 용도:
 - 커뮤니티 딜 수집 시 실제 쇼핑몰 현재가 검증
 - 핫딜 소진(가격 정상화) 즉시 감지
+
+1차 HTTP GET + JSON-LD/메타/내장 상태 파싱(http_extractor), 미발견 시에만 브라우저 렌더링
+쇼핑몰별 ScrapeProfile(RETAILER_PROFILES)로 셀렉터를 관리하고,
+이미지/미디어/폰트/3rd-party 스크립트는 route 로 차단, 고정 sleep 대신 가격 셀렉터 대기
 """
 import re
+import time
+import asyncio
 import logging
-from typing import Optional
+from collections import Counter, defaultdict
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
 from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from app.config import settings
+
+from .browser_pool import get_pool
+from .http_extractor import fetch_price_http
 
 logger = logging.getLogger(__name__)
 
@@ -126,104 +139,207 @@ def detect_retailer(url: str) -> str:
     return "unknown"
 
 
+@dataclass(frozen=True)
+class ScrapeProfile:
+    """쇼핑몰별 크롤링 설정 — 가격 셀렉터 / 대기 셀렉터 / 허용 스크립트 도메인"""
+    price_selectors: Tuple[str, ...]
+    original_selectors: Tuple[str, ...] = ()
+    pick_min: bool = False            # True: 매칭 요소 전체 중 최솟값 (지마켓/옥션 .price_real)
+    first_party: Tuple[str, ...] = () # 스크립트 허용 도메인 (그 외 3rd-party 스크립트 차단)
+    wait_timeout: int = 4000          # 가격 셀렉터 대기 상한 (ms)
+    http_first: bool = True           # HTTP GET + JSON-LD/메타/내장 상태 파싱 먼저 시도
+    max_concurrency: int = 4          # get_actual_prices 배치 시 쇼핑몰별 동시 요청 상한
+    state_patterns: Tuple[str, ...] = ()     # 내장 상태 JSON 판매가 정규식 (group 1)
+    original_patterns: Tuple[str, ...] = ()  # 내장 상태 JSON 정가 정규식
+
+    @property
+    def wait_selector(self) -> str:
+        return ", ".join(self.price_selectors)
+
+
+RETAILER_PROFILES: Dict[str, ScrapeProfile] = {
+    "gmarket": ScrapeProfile(
+        price_selectors=(".price_real",),
+        original_selectors=(".price_original", ".text__price-original"),
+        pick_min=True,
+        first_party=("gmarket.co.kr", "gmkt.kr", "gmarket.com"),
+        state_patterns=(r'"(?:sellPrice|discountPrice|salePrice)"\s*:\s*"?([0-9,]+)',),
+        original_patterns=(r'"(?:originalPrice|itemPrice)"\s*:\s*"?([0-9,]+)',),
+    ),
+    "auction": ScrapeProfile(
+        price_selectors=(".price_real",),
+        original_selectors=(".price_original", ".text__price-original"),
+        pick_min=True,
+        first_party=("auction.co.kr", "auction.kr"),
+        state_patterns=(r'"(?:sellPrice|discountPrice|salePrice)"\s*:\s*"?([0-9,]+)',),
+        original_patterns=(r'"(?:originalPrice|itemPrice)"\s*:\s*"?([0-9,]+)',),
+    ),
+    "11번가": ScrapeProfile(
+        price_selectors=(".price_block .price", ".price_info .price", ".sel_price .price", "em.text_num"),
+        first_party=("11st.co.kr", "011st.com"),
+        state_patterns=(r'"(?:finalDscPrice|finalPrc|selPrc)"\s*:\s*"?([0-9,]+)',),
+        original_patterns=(r'"selPrc"\s*:\s*"?([0-9,]+)',),
+    ),
+    "롯데온": ScrapeProfile(
+        price_selectors=("strong.price", ".price_wrap strong", "[class*='salePrice'] strong"),
+        original_selectors=(".price_origin", "[class*='originPrice']"),
+        first_party=("lotteon.com", "lotte.net"),
+        state_patterns=(r'"(?:finalPrice|slPrc|salePrice)"\s*:\s*"?([0-9,]+)',),
+        original_patterns=(r'"(?:originalPrice|slPrcOrg)"\s*:\s*"?([0-9,]+)',),
+    ),
+    "쿠팡": ScrapeProfile(
+        price_selectors=("strong.total-price", ".prod-price strong", "[class*='totalPrice']"),
+        first_party=("coupang.com", "coupangcdn.com"),
+        http_first=False,  # Akamai — 일반 HTTP 요청은 차단됨
+        max_concurrency=2,
+    ),
+    "스마트스토어": ScrapeProfile(
+        price_selectors=("strong._2-I30U5RAP", "strong.price_num", "[class*='price_num']", "strong._1LY7DqCnwR"),
+        first_party=("naver.com", "naver.net", "pstatic.net"),
+        wait_timeout=6000,  # SPA — 가격 렌더링까지 더 오래 걸림
+        max_concurrency=2,
+        state_patterns=(r'"discountedSalePrice"\s*:\s*([0-9]+)', r'"salePrice"\s*:\s*([0-9]+)'),
+        original_patterns=(r'"salePrice"\s*:\s*([0-9]+)',),
+    ),
+    "SSG": ScrapeProfile(
+        price_selectors=("strong.ssg_price", ".cunit_price strong", "em.ssg_price"),
+        first_party=("ssg.com", "ssgcdn.com"),
+        state_patterns=(r'"(?:sellprc|finalPrice|bestAmt)"\s*:\s*"?([0-9,]+)',),
+        original_patterns=(r'"(?:orgSellprc|norPrc)"\s*:\s*"?([0-9,]+)',),
+    ),
+}
+PPOMPPU_PROFILE = ScrapeProfile(price_selectors=("a[href]",), first_party=("ppomppu.co.kr",))
+
+# 렌더링/가격 추출에 불필요한 리소스
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# 쇼핑몰별 tier 적중 통계 {retailer: Counter(http_hit/http_miss/browser_hit/browser_miss)}
+_tier_stats: Dict[str, Counter] = defaultdict(Counter)
+
+
+def get_tier_stats() -> Dict[str, dict]:
+    """쇼핑몰별 HTTP/브라우저 tier 적중 수 + HTTP 적중률 (프로세스 시작 이후 누적)"""
+    out = {}
+    for retailer, c in _tier_stats.items():
+        http_total = c["http_hit"] + c["http_miss"]
+        out[retailer] = {
+            **dict(c),
+            "http_hit_rate": round(c["http_hit"] / http_total, 3) if http_total else None,
+        }
+    return out
+
+
+def _host_allowed(url: str, domains: Tuple[str, ...]) -> bool:
+    host = urlparse(url).hostname or ""
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+async def _block_resources(page, profile: ScrapeProfile):
+    """이미지/미디어/폰트 + 1st-party 외 스크립트 차단 route 등록. 해제용 handler 반환"""
+    async def handler(route):
+        req = route.request
+        if req.resource_type in BLOCKED_RESOURCE_TYPES or (
+            req.resource_type == "script" and profile.first_party
+            and not _host_allowed(req.url, profile.first_party)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", handler)
+    return handler
+
+
+async def _goto_and_wait(page, url: str, profile: ScrapeProfile) -> None:
+    """domcontentloaded 후 고정 sleep 대신 가격 셀렉터 등장까지만 대기"""
+    await page.goto(url, timeout=12000, wait_until="domcontentloaded")
+    try:
+        await page.wait_for_selector(profile.wait_selector, timeout=profile.wait_timeout, state="attached")
+    except Exception:
+        pass  # 셀렉터 미등장 — 아래 추출 단계에서 가격 미발견 처리
+
+
+async def _extract_price(page, profile: ScrapeProfile) -> Tuple[Optional[int], Optional[int]]:
+    price = original = None
+    if profile.pick_min:
+        # 매칭 요소 여러 개 → 가장 작은 값이 실제 판매가
+        for sel in profile.price_selectors:
+            els = await page.query_selector_all(sel)
+            prices = [_parse_price(await el.inner_text()) for el in els]
+            prices = [p for p in prices if p]
+            if prices:
+                price = min(prices)
+                break
+    else:
+        for sel in profile.price_selectors:
+            el = await page.query_selector(sel)
+            if el:
+                p = _parse_price(await el.inner_text())
+                if p:
+                    price = p
+                    break
+    if profile.original_selectors:
+        orig_el = await page.query_selector(", ".join(profile.original_selectors))
+        if orig_el:
+            original = _parse_price(await orig_el.inner_text())
+    return price, original
+
+
+async def _get_price_http(url: str, retailer: str, profile: ScrapeProfile) -> Optional[PriceResult]:
+    """1차: HTTP GET + JSON-LD/메타/내장 상태 파싱"""
+    result, html = await fetch_price_http(url, profile.state_patterns, profile.original_patterns)
+    if result is None:
+        return None
+    in_stock = result.in_stock
+    if in_stock is None:
+        in_stock = not any(t in html for t in SOLD_OUT_TEXTS)
+    logger.debug(f"[스크래퍼] HTTP 추출({result.method}): {retailer} {result.price}원")
+    return PriceResult(
+        price=result.price,
+        original_price=result.original_price or result.price,
+        in_stock=in_stock,
+        retailer=retailer,
+        url=result.url,
+    )
+
+
 async def get_actual_price(url: str, playwright_page=None) -> Optional[PriceResult]:
     """
     실제 쇼핑몰 현재 가격 크롤링.
-    playwright_page: 재사용 page 객체 (없으면 내부에서 브라우저 생성)
+    1차 HTTP 파싱(프로필 http_first) → 미발견 시 2차 브라우저 렌더링
+    playwright_page: 재사용 page 객체 (없으면 공용 브라우저 풀에서 대여)
     """
+    retailer = detect_retailer(url)
+    profile = RETAILER_PROFILES.get(retailer)
+    if profile is None:
+        logger.debug(f"[스크래퍼] 미지원 쇼핑몰: {url[:50]}")
+        return None
+
+    stats = _tier_stats[retailer]
+    if profile.http_first:
+        result = await _get_price_http(url, retailer, profile)
+        stats["http_hit" if result else "http_miss"] += 1
+        if result is not None:
+            return result
+
     try:
-        from playwright.async_api import async_playwright as _playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         logger.warning("[스크래퍼] playwright 미설치 — pip install playwright && playwright install chromium")
         return None
 
-    retailer = detect_retailer(url)
-
     async def _scrape(page) -> Optional[PriceResult]:
+        handler = None
         try:
             await page.add_init_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
-            await page.goto(url, timeout=12000, wait_until="domcontentloaded")
-            await page.wait_for_timeout(2500)
+            handler = await _block_resources(page, profile)
+            await _goto_and_wait(page, url, profile)
 
             content = await page.content()
             is_sold_out = any(t in content for t in SOLD_OUT_TEXTS)
-            price = original = None
-
-            # ── 지마켓 / 옥션 ──────────────────────────────
-            if retailer in ("gmarket", "auction"):
-                # .price_real 여러 개 → 가장 작은 값이 실제 판매가
-                els = await page.query_selector_all(".price_real")
-                prices = [_parse_price(await el.inner_text()) for el in els]
-                prices = [p for p in prices if p]
-                if prices:
-                    price = min(prices)
-                orig_el = await page.query_selector(".price_original, .text__price-original")
-                if orig_el:
-                    original = _parse_price(await orig_el.inner_text())
-
-            # ── 11번가 ─────────────────────────────────────
-            elif retailer == "11번가":
-                for sel in [
-                    ".price_block .price",   # 메인 판매가
-                    ".price_info .price",
-                    ".sel_price .price",
-                    "em.text_num",
-                ]:
-                    el = await page.query_selector(sel)
-                    if el:
-                        p = _parse_price(await el.inner_text())
-                        if p:
-                            price = p
-                            break
-
-            # ── 롯데온 ─────────────────────────────────────
-            elif retailer == "롯데온":
-                for sel in ["strong.price", ".price_wrap strong", "[class*='salePrice'] strong"]:
-                    el = await page.query_selector(sel)
-                    if el:
-                        p = _parse_price(await el.inner_text())
-                        if p:
-                            price = p
-                            break
-                orig_el = await page.query_selector(".price_origin, [class*='originPrice']")
-                if orig_el:
-                    original = _parse_price(await orig_el.inner_text())
-
-            # ── 쿠팡 ───────────────────────────────────────
-            elif retailer == "쿠팡":
-                for sel in ["strong.total-price", ".prod-price strong", "[class*='totalPrice']"]:
-                    el = await page.query_selector(sel)
-                    if el:
-                        p = _parse_price(await el.inner_text())
-                        if p:
-                            price = p
-                            break
-
-            # ── 네이버 스마트스토어 ─────────────────────────
-            elif retailer == "스마트스토어":
-                await page.wait_for_timeout(1500)  # SPA 로딩 대기
-                for sel in [
-                    "strong._2-I30U5RAP", "strong.price_num",
-                    "[class*='price_num']", "strong._1LY7DqCnwR"
-                ]:
-                    el = await page.query_selector(sel)
-                    if el:
-                        p = _parse_price(await el.inner_text())
-                        if p:
-                            price = p
-                            break
-
-            # ── SSG ────────────────────────────────────────
-            elif retailer == "SSG":
-                for sel in ["strong.ssg_price", ".cunit_price strong", "em.ssg_price"]:
-                    el = await page.query_selector(sel)
-                    if el:
-                        p = _parse_price(await el.inner_text())
-                        if p:
-                            price = p
-                            break
+            price, original = await _extract_price(page, profile)
 
             if price is None:
                 logger.debug(f"[스크래퍼] 가격 미발견: {retailer} {url[:50]}")
@@ -239,32 +355,83 @@ async def get_actual_price(url: str, playwright_page=None) -> Optional[PriceResu
         except Exception as e:
             logger.debug(f"[스크래퍼] {retailer} 오류: {e}")
             return None
-
+        finally:
+            if handler is not None:
+                try:
+                    await page.unroute("**/*", handler)
+                except Exception:
+                    pass
+
+    result = None
     if playwright_page:
-        return await _scrape(playwright_page)
+        result = await _scrape(playwright_page)
+    else:
+        try:
+            async with get_pool().lease() as page:
+                result = await _scrape(page)
+        except Exception as e:
+            logger.debug(f"[스크래퍼] 브라우저 오류: {e}")
+    stats["browser_hit" if result is not None else "browser_miss"] += 1
+    return result
+
+
+async def get_actual_prices(
+    urls: Iterable[str],
+    deadline: Optional[float] = None,
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[Tuple[str, Optional[PriceResult]]]:
+    """
+    여러 URL 가격 동시 크롤링 — 완료 순서대로 (url, PriceResult | None) yield.
+
+    - 전체 동시 작업 수: concurrency (기본 SCRAPER_BATCH_CONCURRENCY)
+    - 쇼핑몰별 동시 요청 수: ScrapeProfile.max_concurrency
+    - 브라우저 tier 는 풀 용량(lease 대기열)으로 자연히 제한됨
+    - deadline 초(기본 SCRAPER_BATCH_DEADLINE) 경과 시 남은 작업은 취소되고 yield 되지 않음
+    - 소비자가 중간에 멈춰도(break / aclose) 남은 작업을 취소하고 종료까지 기다림 (브라우저 lease 반납 보장)
 
+        async for url, result in get_actual_prices(urls, deadline=30):
+            ...
+    """
+    urls = list(dict.fromkeys(u for u in urls if u))  # 중복 제거 (순서 유지)
+    if not urls:
+        return
+    deadline = settings.SCRAPER_BATCH_DEADLINE if deadline is None else deadline
+    total_sem = asyncio.Semaphore(concurrency or settings.SCRAPER_BATCH_CONCURRENCY)
+    retailer_sems: Dict[str, asyncio.Semaphore] = {}
+
+    async def _one(url: str) -> Tuple[str, Optional[PriceResult]]:
+        retailer = detect_retailer(url)
+        profile = RETAILER_PROFILES.get(retailer)
+        if profile is None:
+            return url, None
+        sem = retailer_sems.setdefault(retailer, asyncio.Semaphore(profile.max_concurrency))
+        # 쇼핑몰 슬롯 먼저 — 한 쇼핑몰에 몰린 배치가 전체 슬롯을 쥔 채 대기해 다른 쇼핑몰을 굶기지 않도록
+        async with sem, total_sem:
+            return url, await get_actual_price(url)
+
+    tasks = {asyncio.create_task(_one(u)) for u in urls}
+    ends_at = time.monotonic() + deadline
+    done_count = 0
     try:
-        async with _playwright() as pw:
-            browser = await pw.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
-                      "--disable-blink-features=AutomationControlled"],
-            )
-            ctx = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-                ),
-                locale="ko-KR",
-                viewport={"width": 1280, "height": 800},
-            )
-            page = await ctx.new_page()
-            result = await _scrape(page)
-            await browser.close()
-            return result
-    except Exception as e:
-        logger.debug(f"[스크래퍼] 브라우저 오류: {e}")
-        return None
+        while tasks:
+            remaining = ends_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, tasks = await asyncio.wait(tasks, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    url, result = task.result()
+                except Exception as e:
+                    logger.debug(f"[스크래퍼] 배치 작업 오류: {e}")
+                    continue
+                done_count += 1
+                yield url, result
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"[스크래퍼] 배치 중단(마감 초과/소비 종료): {done_count}/{len(urls)} 완료, {len(tasks)}개 취소")
 
 
 async def fetch_retailer_url_from_ppomppu(ppomppu_post_url: str, playwright_page=None) -> Optional[str]:
@@ -273,17 +440,19 @@ async def fetch_retailer_url_from_ppomppu(ppomppu_post_url: str, playwright_page
     Playwright로 페이지 렌더링 후 모든 링크 추출 → 쇼핑몰 URL 파싱
     """
     try:
-        from playwright.async_api import async_playwright as _playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         return None
 
     async def _extract(page) -> Optional[str]:
+        handler = None
         try:
             await page.add_init_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
+            # 서버 렌더링 페이지 — 리소스 차단 후 domcontentloaded 로 충분 (고정 대기 제거)
+            handler = await _block_resources(page, PPOMPPU_PROFILE)
             await page.goto(ppomppu_post_url, timeout=12000, wait_until="domcontentloaded")
-            await page.wait_for_timeout(1000)
 
             # 품절/종결/취소 감지
             body_text = await page.evaluate("() => document.body?.innerText || ''")
@@ -299,24 +468,19 @@ async def fetch_retailer_url_from_ppomppu(ppomppu_post_url: str, playwright_page
         except Exception as e:
             logger.debug(f"[ppomppu URL 추출] 오류: {e}")
             return None
+        finally:
+            if handler is not None:
+                try:
+                    await page.unroute("**/*", handler)
+                except Exception:
+                    pass
 
     if playwright_page:
         return await _extract(playwright_page)
 
     try:
-        async with _playwright() as pw:
-            browser = await pw.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-            )
-            ctx = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/121.0.0.0 Safari/537.36",
-                locale="ko-KR",
-            )
-            page = await ctx.new_page()
-            result = await _extract(page)
-            await browser.close()
-            return result
+        async with get_pool().lease() as page:
+            return await _extract(page)
     except Exception as e:
         logger.debug(f"[ppomppu URL 추출] 브라우저 오류: {e}")
         return None
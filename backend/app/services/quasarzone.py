@@ -12,6 +12,7 @@ import re
 import asyncio
 from bs4 import BeautifulSoup
 from typing import Optional
+from app.services import host_guard
 
 QUASARZONE_BOARD_URL = "https://quasarzone.com/bbs/qb_saleinfo"
 BASE_URL = "https://quasarzone.com"
@@ -189,8 +190,8 @@ async def fetch_quasarzone_deals() -> list[dict]:
 
     try:
         async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                QUASARZONE_BOARD_URL,
+            resp = await host_guard.request(
+                client, "GET", QUASARZONE_BOARD_URL,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                                   "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -0,0 +1,147 @@
+"""
+딜 랭킹 (핫딜 / 트렌딩 / 주간 TOP) 백그라운드 계산
+
+- 점수 = (참여도 + 품질) × 시간 감쇠
+    참여도 = log1p(조회) + 2·log1p(클릭) + 3·log1p(업보트)
+    품질   = 4·할인율 + 수동/수집 핫 플래그 보너스
+    감쇠   = 0.5 ^ (경과시간 / 반감기)
+- hot      : 반감기 RANK_HALF_LIFE_HOURS 점수 ≥ HOT_SCORE_THRESHOLD (기존 discount_rate >= 40 고정 규칙 대체)
+- trending : 최근 48시간 딜, 참여도 속도 (참여도 / (경과시간+2)^1.5)
+- weekly   : 최근 7일 딜, 반감기 WEEKLY_HALF_LIFE_HOURS(기본 7일) 점수순
+  — 24h 반감기를 쓰면 7일 창 안에서도 6일 전 딜이 1/64 로 눌려 사실상 "최근 2일 TOP" 이 됨
+- 스케줄러가 5분마다 refresh(), 엔드포인트는 메모리 랭킹 + 카탈로그 스냅샷만 읽음
+- 조회/클릭은 데이터 버전을 올리지 않아 카탈로그 스냅샷의 카운터가 오래될 수 있으므로
+  refresh() 때마다 참여도 카운터만 따로 조회해 덮어씀 → 랭킹 참여도 지연은 최대 RANKING_TTL
+  (카운터 조회 실패 시 스냅샷 값으로 계산)
+"""
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import app.db_supabase as db
+from app.config import settings
+from app.services.deal_catalog import CatalogSnapshot, get_catalog
+
+logger = logging.getLogger(__name__)
+
+W_VIEWS = 1.0
+W_CLICKS = 2.0
+W_UPVOTES = 3.0
+W_DISCOUNT = 4.0
+FLAG_BONUS = 1.0
+TRENDING_HOURS = 48
+WEEKLY_HOURS = 24 * 7
+TRENDING_GRAVITY = 1.5
+RANKING_SIZE = 50
+RANKING_TTL = 300  # 이보다 오래된 랭킹은 요청 경로에서 재계산 (감쇠 반영)
+
+
+@dataclass
+class Ranking:
+    version: int
+    built_at: float
+    scores: Dict[int, float] = field(default_factory=dict)
+    hot: List[int] = field(default_factory=list)
+    trending: List[int] = field(default_factory=list)
+    weekly: List[int] = field(default_factory=list)
+
+
+def _age_hours(created_at: str, now: datetime) -> float:
+    try:
+        dt = datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return max((now - dt).total_seconds() / 3600, 0.0)
+    except ValueError:
+        return float(WEEKLY_HOURS)
+
+
+def engagement(deal: dict) -> float:
+    return (
+        W_VIEWS * math.log1p(int(deal.get("views") or 0))
+        + W_CLICKS * math.log1p(int(deal.get("total_clicks") or 0))
+        + W_UPVOTES * math.log1p(int(deal.get("upvotes") or 0))
+    )
+
+
+def score(deal: dict, age_hours: float, half_life: Optional[float] = None) -> float:
+    quality = W_DISCOUNT * float(deal.get("discount_rate") or 0) / 100
+    if deal.get("is_hot"):
+        quality += FLAG_BONUS
+    decay = 0.5 ** (age_hours / (half_life or settings.RANK_HALF_LIFE_HOURS))
+    return (engagement(deal) + quality) * decay
+
+
+def compute_ranking(snapshot: CatalogSnapshot, counters: Optional[Dict[int, dict]] = None) -> Ranking:
+    """counters: fetch_engagement_counters 결과 (있으면 스냅샷 카운터 대신 사용)"""
+    now = datetime.now(timezone.utc)
+    scores: Dict[int, float] = {}
+    trending: Dict[int, float] = {}
+    weekly: Dict[int, float] = {}
+    for d in snapshot.deals:
+        if counters and d["id"] in counters:
+            d = {**d, **counters[d["id"]]}
+        age = _age_hours(d.get("created_at", ""), now)
+        scores[d["id"]] = score(d, age)
+        if age <= TRENDING_HOURS:
+            trending[d["id"]] = engagement(d) / (age + 2) ** TRENDING_GRAVITY
+        if age <= WEEKLY_HOURS:
+            weekly[d["id"]] = score(d, age, settings.WEEKLY_HALF_LIFE_HOURS)
+
+    by_score = sorted(scores, key=scores.get, reverse=True)
+    return Ranking(
+        version=snapshot.version,
+        built_at=time.time(),
+        scores=scores,
+        hot=[i for i in by_score if scores[i] >= settings.HOT_SCORE_THRESHOLD][:RANKING_SIZE],
+        trending=sorted(trending, key=trending.get, reverse=True)[:RANKING_SIZE],
+        weekly=sorted(weekly, key=weekly.get, reverse=True)[:RANKING_SIZE],
+    )
+
+
+_ranking: Optional[Ranking] = None
+_lock = threading.Lock()
+
+
+def _fetch_counters() -> Optional[Dict[int, dict]]:
+    try:
+        return db.fetch_engagement_counters(["active"])
+    except Exception as e:
+        logger.warning(f"[랭킹] 참여도 카운터 조회 실패 — 스냅샷 값 사용: {e}")
+        return None
+
+
+def refresh() -> Ranking:
+    global _ranking
+    snapshot = get_catalog()
+    ranking = compute_ranking(snapshot, _fetch_counters())
+    with _lock:
+        _ranking = ranking
+    logger.info(
+        f"[랭킹] 갱신: {len(ranking.scores)}개 딜 | 핫 {len(ranking.hot)} / "
+        f"트렌딩 {len(ranking.trending)} / 주간 {len(ranking.weekly)}"
+    )
+    return ranking
+
+
+def get_ranking() -> Ranking:
+    """현재 랭킹 (없거나 TTL 초과 / 카탈로그 교체 시 재계산 — 동기, db.run_db로 호출)"""
+    ranking = _ranking
+    if ranking is None or time.time() - ranking.built_at > RANKING_TTL:
+        return refresh()
+    snapshot = get_catalog()
+    if ranking.version != snapshot.version:
+        return refresh()
+    return ranking
+
+
+def top_deals(kind: str, limit: int) -> List[dict]:
+    """hot | trending | weekly 상위 limit개 딜 (카탈로그 카드 dict)"""
+    ranking = get_ranking()
+    snapshot = get_catalog()
+    ids = getattr(ranking, kind)
+    return [snapshot.by_id[i] for i in ids if i in snapshot.by_id][:limit]
@@ -0,0 +1,134 @@
+"""
+연관 딜 추천 사전 계산 (딜 상세 "비슷한 딜")
+
+- active 카탈로그 전체에 대해 백그라운드로 딜별 상위 RELATED_N 개 연관 딜 id 를 계산
+- 점수 = 제목 TF-IDF 코사인 유사도 (단어 + 글자 bigram, feature hashing)
+        + 같은 카테고리 / 같은 브랜드 / 가격대 근접도 가중 합
+- 요청 시에는 dict 조회 1회 + 현재 카탈로그 스냅샷에서 딜 조회 (DB 쿼리 없음)
+- NumPy 미설치 시 빌드하지 않음 → 라우터가 기존 카테고리 최신순 쿼리로 fallback
+"""
+import logging
+import math
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.services.brand_index import extract_brand
+from app.services.deal_catalog import CatalogSnapshot, get_catalog
+from app.services.search_index import tokenize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logging.getLogger(__name__).warning("numpy 미설치 — 연관 딜 사전 계산 비활성화")
+
+logger = logging.getLogger(__name__)
+
+RELATED_N = 6
+HASH_DIM = 1024
+CHUNK = 512
+
+W_TEXT = 0.60
+W_CATEGORY = 0.15
+W_BRAND = 0.10
+W_PRICE = 0.15
+PRICE_BAND = math.log(4)  # 가격 4배 차이 → 가격 점수 0
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+_related: Dict[int, List[int]] = {}
+_built_version: Optional[int] = None
+_built_at: Optional[float] = None
+_lock = threading.Lock()
+
+
+def _features(title: str) -> List[str]:
+    """단어 토큰 + 한글 토큰의 글자 bigram (영문/숫자 bigram은 잡음이 커서 제외)"""
+    feats = []
+    for token in tokenize(title):
+        feats.append(token)
+        if len(token) > 2 and _HANGUL_RE.search(token):
+            feats.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return feats
+
+
+def _tfidf_matrix(titles: List[str]) -> "np.ndarray":
+    n = len(titles)
+    tf = np.zeros((n, HASH_DIM), dtype=np.float32)
+    for row, title in enumerate(titles):
+        for f in _features(title):
+            tf[row, hash(f) % HASH_DIM] += 1.0
+    df = (tf > 0).sum(axis=0)
+    idf = np.log((n + 1) / (df + 1)).astype(np.float32) + 1.0
+    x = tf * idf
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return x / norms
+
+
+def _codes(values: List[Optional[str]]) -> "np.ndarray":
+    """문자열 → 정수 코드 (None/빈값은 -1)"""
+    table: Dict[str, int] = {}
+    return np.array(
+        [table.setdefault(v, len(table)) if v else -1 for v in values],
+        dtype=np.int32,
+    )
+
+
+def compute_related(deals: List[dict], top_n: int = RELATED_N) -> Dict[int, List[int]]:
+    n = len(deals)
+    if n < 2:
+        return {}
+    x = _tfidf_matrix([d.get("title") or "" for d in deals])
+    cats = _codes([d.get("category") for d in deals])
+    brands = _codes([extract_brand(d) for d in deals])
+    prices = np.array([float(d.get("sale_price") or 0) for d in deals], dtype=np.float64)
+    has_price = prices > 0
+    log_price = np.where(has_price, np.log(np.where(has_price, prices, 1.0)), 0.0)
+    ids = [d["id"] for d in deals]
+    k = min(top_n, n - 1)
+
+    related: Dict[int, List[int]] = {}
+    for start in range(0, n, CHUNK):
+        end = min(n, start + CHUNK)
+        score = W_TEXT * (x[start:end] @ x.T)
+        score += W_CATEGORY * (cats[start:end, None] == cats[None, :]) * (cats[None, :] >= 0)
+        score += W_BRAND * (brands[start:end, None] == brands[None, :]) * (brands[None, :] >= 0)
+        price_sim = 1.0 - np.minimum(np.abs(log_price[start:end, None] - log_price[None, :]) / PRICE_BAND, 1.0)
+        score += W_PRICE * price_sim * (has_price[start:end, None] & has_price[None, :])
+        score[np.arange(end - start), np.arange(start, end)] = -np.inf  # 자기 자신 제외
+
+        top = np.argpartition(-score, k - 1, axis=1)[:, :k]
+        for row in range(end - start):
+            cand = top[row]
+            order = cand[np.argsort(-score[row, cand])]
+            related[ids[start + row]] = [int(ids[j]) for j in order if score[row, j] > 0]
+    return related
+
+
+def refresh(force: bool = False) -> int:
+    """현재 카탈로그 기준 연관 딜 재계산 (카탈로그 버전 동일하면 생략). 딜 수 반환"""
+    global _related, _built_version, _built_at
+    if np is None:
+        return 0
+    snapshot = get_catalog()
+    if not force and _built_version == snapshot.version and _related:
+        return len(_related)
+    started = time.monotonic()
+    related = compute_related(snapshot.deals)
+    with _lock:
+        _related, _built_version, _built_at = related, snapshot.version, time.time()
+    logger.info(
+        f"[연관딜] {len(related)}개 딜 계산 | {(time.monotonic() - started) * 1000:.0f}ms"
+    )
+    return len(related)
+
+
+def get_related(deal_id: int, snapshot: CatalogSnapshot, limit: int = 3) -> Optional[List[dict]]:
+    """사전 계산 연관 딜 (현재 active 인 것만). 계산 결과에 없는 딜이면 None"""
+    ids = _related.get(deal_id)
+    if ids is None:
+        return None
+    return [snapshot.by_id[i] for i in ids if i in snapshot.by_id][:limit]
@@ -12,6 +12,7 @@ import asyncio
 import html
 from bs4 import BeautifulSoup
 from typing import Optional
+from app.services import host_guard
 
 RULIWEB_RSS_URL = "https://bbs.ruliweb.com/market/board/1020/rss"
 
@@ -176,8 +177,8 @@ async def fetch_ruliweb_deals() -> list[dict]:
 
     try:
         async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                RULIWEB_RSS_URL,
+            resp = await host_guard.request(
+                client, "GET", RULIWEB_RSS_URL,
                 headers={"User-Agent": "Mozilla/5.0"},
                 timeout=15.0,
                 follow_redirects=True,
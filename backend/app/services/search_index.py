@@ -0,0 +1,173 @@
+"""
+딜 검색 인덱스 (한글 n-gram 역색인)
+
+- title / category / submitter_name 을 NFKC·소문자 정규화 후 토큰 단위 1·2-gram 으로 색인
+  → "에어팟프로" ↔ "에어팟 프로", "갤럭시" ↔ "갤럭시S24" 같은 부분 한글 단어 매칭
+- 토큰의 초성("ㄴㅇㅋ")도 같은 방식으로 색인 — 초성이 섞인 쿼리는 초성 gram 으로 검색
+- 점수: gram IDF × 필드 가중치 합 + 제목 부분일치 보너스
+- 커버리지: 색인에 없는 gram 은 띄어쓰기 경계("팟프", 두 글자는 색인됨)이고 소수일 때만 허용하며
+  그 경우 색인에 있는 gram 을 전부 포함해야 함 ("나이키 구두" 가 구두 없는 나이키 딜에 걸리지 않도록)
+  미등록 gram 이 없으면 IDF 커버리지 MIN_COVERAGE 이상
+- 카탈로그 스냅샷당 1회 빌드 (deal_catalog.derived) — 조회 비용은 쿼리 gram posting 길이에만 비례
+
+DB 측 pg_trgm 인덱스(migrations/009)는 관리자 검색 등 ilike 경로용
+"""
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from app.services.deal_catalog import CatalogSnapshot, get_catalog
+
+MAX_RESULTS = 500
+MIN_COVERAGE = 0.75
+TITLE_MATCH_BONUS = 2.0
+
+# (필드, 가중치)
+FIELDS = (("title", 3.0), ("category", 1.0), ("submitter_name", 1.5))
+
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣ㄱ-ㅎ]+")
+
+
+def _is_compat_jamo(ch: str) -> bool:
+    return "\u3131" <= ch <= "\u318e"
+
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절 → 초성 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        out.append(_CHOSEONG[code // 588] if 0 <= code < 11172 else ch)
+    return "".join(out)
+
+
+def has_choseong(text: str) -> bool:
+    return any("ㄱ" <= ch <= "ㅎ" for ch in text)
+
+
+def normalize(text: str) -> str:
+    """NFKC + 소문자 — 단, 호환 자모(ㄱ~ㅣ, 초성 입력)는 NFKC가 조합형 자모로 바꾸므로 보존"""
+    text = text or ""
+    if any(_is_compat_jamo(ch) for ch in text):
+        return "".join(
+            ch if _is_compat_jamo(ch) else unicodedata.normalize("NFKC", ch) for ch in text
+        ).lower()
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def _grams(token: str) -> set:
+    grams = set(token)
+    grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+def index_grams(token: str) -> set:
+    """색인용: 글자 unigram + bigram (한글이 있으면 초성 토큰의 gram 도 함께)"""
+    grams = _grams(token)
+    cho = to_choseong(token)
+    if cho != token:
+        grams |= _grams(cho)
+    return grams
+
+
+def query_grams(text: str) -> set:
+    """쿼리용: 1글자 토큰은 unigram, 그 외는 bigram — 초성이 섞이면 쿼리 전체를 초성으로"""
+    grams: set = set()
+    if has_choseong(normalize(text)):
+        text = to_choseong(normalize(text))
+    for token in tokenize(text):
+        if len(token) == 1:
+            grams.add(token)
+        else:
+            grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+@dataclass
+class SearchIndex:
+    deal_ids: List[int]
+    titles: List[str]             # 정규화 제목 (부분일치 보너스용)
+    cho_titles: List[str]         # 제목 초성 (초성 쿼리 부분일치 보너스용)
+    postings: Dict[str, Dict[int, float]]  # gram → {doc 번호: 필드 가중치 최대값}
+
+    def idf(self, gram: str) -> float:
+        df = len(self.postings.get(gram, ()))
+        return math.log(1 + (len(self.deal_ids) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> List[Tuple[int, float]]:
+        """(deal_id, score) 점수 내림차순 — 동점은 카탈로그 순서(최신순)"""
+        grams = query_grams(query)
+        # 색인에 없는 gram 은 띄어쓰기 경계("에어팟프로" 의 "팟프")처럼 두 글자가 각각 색인돼 있고
+        # 소수일 때만 허용 — 대신 그 두 글자를 커버리지 대상에 넣음
+        # 그 외에는 색인에 없는 단어가 쿼리에 있는 것이므로 결과 없음 ("나이키 구두")
+        known = {g for g in grams if g in self.postings}
+        unknown = grams - known
+        if not known or len(unknown) * 2 >= len(grams):
+            return []
+        for g in unknown:
+            if len(g) != 2 or not all(ch in self.postings for ch in g):
+                return []
+            known.update(g)
+        weights = {g: self.idf(g) for g in sorted(known)}
+        total = sum(weights.values()) or 1.0
+        min_cover = total if unknown or len(known) <= 2 else total * MIN_COVERAGE
+
+        score: Dict[int, float] = defaultdict(float)
+        cover: Dict[int, float] = defaultdict(float)
+        for g, w in weights.items():
+            for doc, field_weight in self.postings.get(g, {}).items():
+                score[doc] += w * field_weight
+                cover[doc] += w
+
+        q = normalize(query).strip()
+        titles = self.titles
+        if has_choseong(q):
+            q, titles = to_choseong(q), self.cho_titles
+        hits = []
+        for doc, c in cover.items():
+            if c + 1e-9 < min_cover:
+                continue
+            s = score[doc]
+            if q and q in titles[doc]:
+                s += TITLE_MATCH_BONUS * total
+            hits.append((doc, s))
+        hits.sort(key=lambda h: (-h[1], h[0]))
+        return [(self.deal_ids[doc], round(s, 4)) for doc, s in hits[:limit]]
+
+
+def build_index(snapshot: CatalogSnapshot) -> SearchIndex:
+    postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+    deal_ids, titles, cho_titles = [], [], []
+    for doc, d in enumerate(snapshot.deals):
+        deal_ids.append(d["id"])
+        titles.append(normalize(d.get("title") or ""))
+        cho_titles.append(to_choseong(titles[-1]))
+        for field, weight in FIELDS:
+            for token in tokenize(d.get(field) or ""):
+                for g in index_grams(token):
+                    if postings[g].get(doc, 0) < weight:
+                        postings[g][doc] = weight
+    return SearchIndex(deal_ids=deal_ids, titles=titles, cho_titles=cho_titles, postings=dict(postings))
+
+
+def get_index(snapshot: CatalogSnapshot = None) -> SearchIndex:
+    return (snapshot or get_catalog()).derived("search_index", build_index)
+
+
+def search(query: str, limit: int = MAX_RESULTS) -> List[Tuple[int, float]]:
+    """현재 카탈로그 기준 검색 (동기 — 라우터에서는 db.run_db로 호출)"""
+    return get_index().search(query, limit)
+
+
+def search_ids(query: str, limit: int = MAX_RESULTS) -> List[int]:
+    return [deal_id for deal_id, _ in search(query, limit)]
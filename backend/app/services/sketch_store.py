@@ -0,0 +1,108 @@
+"""
+일자별 스트리밍 스케치 저장소 (Top-K, 고유 방문자 등 공용)
+
+- 각 인스턴스는 KST 날짜별 스케치를 메모리에 유지하고 변경분이 있으면 주기적으로
+  event_sketches 테이블에 자기 행(day, kind, instance)을 통째로 upsert (멱등)
+- 조회 시 다른 인스턴스의 저장 행 + 자기 메모리 스케치를 병합
+- INSTANCE_ID 에 부팅 nonce 포함 — 컨테이너(PID 1, 고정 hostname) 재시작 후에도 이전 프로세스 행을
+  빈 스케치로 덮어쓰지 않고 "다른 인스턴스" 행으로 병합 (재시작 전 집계 유지)
+- 스케치 타입은 to_payload() / from_payload() / merge() 를 구현
+
+테이블: migrations/007_event_sketches.sql
+"""
+import logging
+import os
+import secrets
+import socket
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Set
+
+import app.db_supabase as db
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+
+def _instance_id() -> str:
+    """hostname-pid-부팅nonce — 같은 hostname/PID 로 재시작해도 프로세스마다 다름"""
+    return f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(3)}"
+
+
+INSTANCE_ID = _instance_id()
+RETAIN_DAYS = 8  # 메모리 보관 일수 (7일 조회 + 당일)
+
+
+def kst_today() -> date:
+    return datetime.now(KST).date()
+
+
+class DailySketchStore:
+    def __init__(self, kind: str, factory: Callable[[], Any], loader: Callable[[dict], Any]):
+        self.kind = kind
+        self._factory = factory
+        self._loader = loader
+        self._sketches: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def update(self, fn: Callable[[Any], None], day: date = None) -> None:
+        """당일(또는 지정일) 스케치에 fn(sketch) 적용"""
+        key = (day or kst_today()).isoformat()
+        with self._lock:
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = self._factory()
+            fn(sketch)
+            self._dirty.add(key)
+
+    def persist(self) -> int:
+        """변경된 날짜 스케치를 저장하고 보관 기간 지난 날짜는 메모리에서 제거. 저장 건수 반환"""
+        cutoff = (kst_today() - timedelta(days=RETAIN_DAYS)).isoformat()
+        with self._lock:
+            for key in [k for k in self._sketches if k < cutoff]:
+                self._sketches.pop(key, None)
+                self._dirty.discard(key)
+            pending = {k: self._sketches[k].to_payload() for k in self._dirty}
+            self._dirty.clear()
+        saved = 0
+        for key, payload in pending.items():
+            try:
+                db.upsert_event_sketch(key, self.kind, INSTANCE_ID, payload)
+                saved += 1
+            except Exception as e:
+                with self._lock:
+                    self._dirty.add(key)
+                logger.warning(f"[스케치] {self.kind} {key} 저장 실패 (다음 주기 재시도): {e}")
+        return saved
+
+    def merged(self, days: Iterable[date]) -> Any:
+        """지정 날짜들의 전체 인스턴스 스케치 병합본 (DB 조회 실패 시 로컬만)"""
+        keys = sorted({d.isoformat() for d in days})
+        result = self._factory()
+        try:
+            for row in db.get_event_sketches(self.kind, keys):
+                if row.get("instance") == INSTANCE_ID:
+                    continue  # 자기 것은 메모리 최신본 사용
+                result.merge(self._loader(row["payload"]))
+        except Exception as e:
+            logger.warning(f"[스케치] {self.kind} 조회 실패 — 로컬 스케치만 사용: {e}")
+        with self._lock:
+            for key in keys:
+                if key in self._sketches:
+                    result.merge(self._sketches[key])
+        return result
+
+
+_stores: Dict[str, DailySketchStore] = {}
+
+
+def register(store: DailySketchStore) -> DailySketchStore:
+    _stores[store.kind] = store
+    return store
+
+
+def persist_all() -> int:
+    """등록된 모든 스케치 저장 (스케줄러 주기 작업)"""
+    return sum(store.persist() for store in _stores.values())
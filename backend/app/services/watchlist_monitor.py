@@ -293,10 +293,10 @@ async def run_watchlist_monitor():
     import app.db_supabase as db
 
     # 초기 시드 (최초 1회)
-    _seed_watchlist_if_empty()
+    await db.run_db(_seed_watchlist_if_empty)
 
     sb = _get_sb()
-    items_res = sb.table("product_watchlist").select("*").eq("is_active", True).execute()
+    items_res = await db.aexecute(sb.table("product_watchlist").select("*").eq("is_active", True))
     items = items_res.data or []
     if not items:
         logger.info("[워치리스트] 활성 제품 없음")
@@ -314,17 +314,17 @@ async def run_watchlist_monitor():
                 checked += 1
 
                 # 가격 로그 저장
-                _log_price(item["id"], lprice, hprice)
+                await db.run_db(_log_price, item["id"], lprice, hprice)
 
                 # 30일 평균 계산
-                avg = _get_avg_30d(item["id"])
+                avg = await db.run_db(_get_avg_30d, item["id"])
 
                 # 평균 업데이트
-                sb.table("product_watchlist").update({
+                await db.aexecute(sb.table("product_watchlist").update({
                     "current_lprice": lprice,
                     "avg_30d_lprice": avg if avg > 0 else lprice,
                     "last_checked_at": datetime.now(timezone.utc).isoformat(),
-                }).eq("id", item["id"]).execute()
+                }).eq("id", item["id"]))
 
                 # ── 딜 조건 판단 ───────────────────────────
                 # 기준가: msrp → avg_30d(실시간) → avg_30d_lprice(DB저장값) 순서로 fallback
@@ -345,18 +345,20 @@ async def run_watchlist_monitor():
                     continue
 
                 # ── 이미 같은 제품 active 딜 있으면 스킵 ──
-                existing = sb.table("deals") \
-                    .select("id, sale_price") \
-                    .ilike("title", f"%{item['name'][:15]}%") \
-                    .eq("status", "active") \
-                    .execute()
+                existing = await db.aexecute(
+                    sb.table("deals")
+                    .select("id, sale_price")
+                    .ilike("title", f"%{item['name'][:15]}%")
+                    .eq("status", "active")
+                )
                 if existing.data:
                     ex_price = existing.data[0]["sale_price"]
                     if abs(ex_price - lprice) / lprice < 0.05:  # 5% 이내면 중복
                         continue
                     # 더 싸면 기존 만료하고 새 딜 등록
                     if lprice < ex_price:
-                        sb.table("deals").update({"status": "expired"}).eq("id", existing.data[0]["id"]).execute()
+                        await db.aexecute(sb.table("deals").update({"status": "expired"}).eq("id", existing.data[0]["id"]))
+                        db.bump_data_version()
                     else:
                         continue
 
@@ -365,7 +367,7 @@ async def run_watchlist_monitor():
                 title = f"{brand_tag}{item['name']}"
 
                 # ── 딜 등록 ───────────────────────────────
-                db.create_deal({
+                await db.run_db(db.create_deal, {
                     "title": title,
                     "original_price": base_price,
                     "sale_price": lprice,
@@ -392,7 +394,7 @@ async def run_watchlist_monitor():
                 logger.error(f"[워치리스트 오류] {item.get('name','')}: {e}")
 
     logger.info(f"✅ 워치리스트 완료: {checked}개 확인 | {created}개 딜 등록")
-    _cleanup_old_logs()
+    await db.run_db(_cleanup_old_logs)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -400,6 +402,8 @@ async def run_watchlist_monitor():
 # ─────────────────────────────────────────────────────────────
 async def run_kream_sync():
     """주 1회: KREAM 트렌딩 제품을 워치리스트에 추가"""
+    import app.db_supabase as db
+
     async with httpx.AsyncClient(timeout=15) as client:
         products = await scrape_kream_trending(client)
         if not products:
@@ -415,21 +419,22 @@ async def run_kream_sync():
                 continue
 
             # 이미 존재하는지 확인
-            existing = sb.table("product_watchlist") \
-                .select("id") \
-                .ilike("name", f"%{name[:10]}%") \
-                .execute()
+            existing = await db.aexecute(
+                sb.table("product_watchlist")
+                .select("id")
+                .ilike("name", f"%{name[:10]}%")
+            )
             if existing.data:
                 continue
 
-            sb.table("product_watchlist").insert({
+            await db.aexecute(sb.table("product_watchlist").insert({
                 "name": name,
                 "search_query": f"{brand} {name}".strip() if brand else name,
                 "brand": brand,
                 "category": "기타",
                 "source": "kream",
                 "alert_threshold": 15,
-            }).execute()
+            }))
             added += 1
 
         logger.info(f"✅ [KREAM] 워치리스트 갱신: {added}개 신규 추가")
@@ -0,0 +1,103 @@
+"""
+스케줄러 전용 워커 프로세스
+
+    python -m app.worker          (Procfile: worker)
+
+- 수집/검증/만료 등 무거운 잡(_verify_prices, _sync_algumon, Playwright 크롤링 ...)을 API 이벤트 루프와 분리
+- API 는 SCHEDULER_MODE=worker 로 띄우면 인스턴스 로컬 캐시 잡만 실행 (app/scheduler.py LOCAL_JOBS)
+- 워커 여러 개를 띄워도 leader 1개만 잡 실행: job_lock 백엔드의 worker_leader 임대(lease)
+  · WORKER_LEADER_TTL/3 마다 갱신, TTL 동안 갱신 못 하면 다른 워커가 인계
+  · leader 가 아니면 스케줄러 일시정지 상태로 대기
+  · 잡 단위 분산 락(services/job_lock)도 그대로 적용 — leader 교대 직후나 API(SCHEDULER_MODE=all)와 섞여도 중복 실행 없음
+- 딜 쓰기로 바뀐 데이터 버전은 sync_data_version 잡이 공유 → API 캐시 무효화
+"""
+import asyncio
+import logging
+import signal
+import time
+
+import app.db_supabase as db
+from app.config import settings
+from app.scheduler import scheduler, start_scheduler, stop_scheduler
+from app.services import job_lock
+from app.services.sketch_store import INSTANCE_ID
+
+logger = logging.getLogger("app.worker")
+
+LEADER_KEY = "worker_leader"
+
+
+def _try_acquire_leadership(ttl: int) -> bool:
+    """임대 획득/갱신 — 비어 있거나, 내 것이거나, TTL 지난 경우에만 내 것으로 (잡 락과 같은 저장소)"""
+    return job_lock.get_backend().acquire(LEADER_KEY, INSTANCE_ID, ttl)
+
+
+def _release_leadership() -> None:
+    job_lock.get_backend().release(LEADER_KEY, INSTANCE_ID)
+
+
+async def run() -> None:
+    ttl = settings.WORKER_LEADER_TTL
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass
+
+    start_scheduler("worker", paused=True)
+    leader = False
+    renewed_at = 0.0
+    logger.info(f"[워커] 시작: {INSTANCE_ID} (leader 임대 TTL {ttl}s)")
+    try:
+        while not stop.is_set():
+            try:
+                acquired = await db.run_db(_try_acquire_leadership, ttl)
+                if acquired:
+                    renewed_at = time.monotonic()
+            except Exception as e:
+                logger.warning(f"[워커] leader 임대 갱신 실패: {e}")
+                # 갱신 실패가 TTL 을 넘기 전까지는 유지 (그 이후엔 다른 워커가 인계 가능)
+                acquired = leader and time.monotonic() - renewed_at < ttl
+
+            if acquired and not leader:
+                scheduler.resume()
+                logger.info("[워커] leader 획득 → 잡 실행 시작")
+            elif not acquired and leader:
+                scheduler.pause()
+                logger.warning("[워커] leader 상실 → 잡 일시정지")
+            leader = acquired
+
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=ttl / 3)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        stop_scheduler()
+        if leader:
+            try:
+                await db.run_db(_release_leadership)
+            except Exception as e:
+                logger.warning(f"[워커] leader 반납 실패: {e}")
+        try:
+            from app.services import data_version_sync
+            await db.run_db(data_version_sync.publish)
+        except Exception as e:
+            logger.warning(f"[워커] 데이터 버전 공유 실패: {e}")
+        from app.services.price_scrapers import close_pool
+        await close_pool()
+        db.shutdown_executor()
+        logger.info("[워커] 종료")
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
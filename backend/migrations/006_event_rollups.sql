@@ -0,0 +1,66 @@
+-- 006: 이벤트 롤업 테이블 (관리자 대시보드 집계용)
+-- event_logs 원본 스캔 대신 시간/일 단위 카운터를 읽는다.
+-- - 앱 인스턴스가 메모리에 모은 증분을 1분마다 increment_event_rollups()로 가산
+-- - compact_event_rollups()가 최근 구간을 event_logs 기준으로 재계산 (유실/중복 보정)
+-- Supabase SQL Editor에서 실행하세요.
+
+-- 시간 단위 (UTC 정시 버킷) × event_type
+CREATE TABLE IF NOT EXISTS event_rollup_hourly (
+  bucket TIMESTAMPTZ NOT NULL,
+  event_type TEXT NOT NULL,
+  count BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (bucket, event_type)
+);
+
+-- 일 단위 (KST 날짜) × 딜 × event_type
+CREATE TABLE IF NOT EXISTS event_rollup_deal_daily (
+  day DATE NOT NULL,
+  deal_id BIGINT NOT NULL,
+  event_type TEXT NOT NULL,
+  count BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (day, deal_id, event_type)
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_rollup_deal_daily_deal ON event_rollup_deal_daily(deal_id, day DESC);
+CREATE INDEX IF NOT EXISTS idx_event_logs_created_at ON event_logs(created_at);
+
+ALTER TABLE event_rollup_hourly DISABLE ROW LEVEL SECURITY;
+ALTER TABLE event_rollup_deal_daily DISABLE ROW LEVEL SECURITY;
+
+-- 증분 가산: hourly = [{bucket, event_type, count}], deal_daily = [{day, deal_id, event_type, count}]
+CREATE OR REPLACE FUNCTION increment_event_rollups(hourly JSONB, deal_daily JSONB)
+RETURNS VOID LANGUAGE SQL AS $$
+  INSERT INTO event_rollup_hourly (bucket, event_type, count)
+  SELECT (h->>'bucket')::timestamptz, h->>'event_type', (h->>'count')::bigint
+  FROM jsonb_array_elements(COALESCE(hourly, '[]'::jsonb)) AS h
+  ON CONFLICT (bucket, event_type)
+  DO UPDATE SET count = event_rollup_hourly.count + EXCLUDED.count;
+
+  INSERT INTO event_rollup_deal_daily (day, deal_id, event_type, count)
+  SELECT (d->>'day')::date, (d->>'deal_id')::bigint, d->>'event_type', (d->>'count')::bigint
+  FROM jsonb_array_elements(COALESCE(deal_daily, '[]'::jsonb)) AS d
+  ON CONFLICT (day, deal_id, event_type)
+  DO UPDATE SET count = event_rollup_deal_daily.count + EXCLUDED.count;
+$$;
+
+-- since 이후 구간을 event_logs 원본으로 재계산해 덮어쓴다 (완결된 과거 구간만 호출할 것)
+CREATE OR REPLACE FUNCTION compact_event_rollups(since TIMESTAMPTZ, until TIMESTAMPTZ)
+RETURNS VOID LANGUAGE SQL AS $$
+  DELETE FROM event_rollup_hourly WHERE bucket >= since AND bucket < until;
+  INSERT INTO event_rollup_hourly (bucket, event_type, count)
+  SELECT date_trunc('hour', created_at), event_type, COUNT(*)
+  FROM event_logs
+  WHERE created_at >= since AND created_at < until
+  GROUP BY 1, 2;
+
+  DELETE FROM event_rollup_deal_daily
+  WHERE day >= (since AT TIME ZONE 'Asia/Seoul')::date
+    AND day < (until AT TIME ZONE 'Asia/Seoul')::date;
+  INSERT INTO event_rollup_deal_daily (day, deal_id, event_type, count)
+  SELECT (created_at AT TIME ZONE 'Asia/Seoul')::date, deal_id, event_type, COUNT(*)
+  FROM event_logs
+  WHERE deal_id IS NOT NULL
+    AND created_at >= date_trunc('day', since AT TIME ZONE 'Asia/Seoul') AT TIME ZONE 'Asia/Seoul'
+    AND created_at < date_trunc('day', until AT TIME ZONE 'Asia/Seoul') AT TIME ZONE 'Asia/Seoul'
+  GROUP BY 1, 2, 3;
+$$;
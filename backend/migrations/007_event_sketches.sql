@@ -0,0 +1,16 @@
+-- 007: 스트리밍 집계 스케치 저장소 (Top-K 클릭/검색어 등)
+-- 인스턴스별로 자기 스케치 전체를 upsert (멱등), 읽을 때 인스턴스 행들을 병합한다.
+-- Supabase SQL Editor에서 실행하세요.
+
+CREATE TABLE IF NOT EXISTS event_sketches (
+  day DATE NOT NULL,            -- KST 날짜
+  kind TEXT NOT NULL,           -- 'top_clicks' | 'top_searches' | ...
+  instance TEXT NOT NULL,       -- 기록한 앱 인스턴스 (hostname-pid-부팅nonce, 재시작마다 새 행)
+  payload JSONB NOT NULL,
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (day, kind, instance)
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_sketches_kind_day ON event_sketches(kind, day DESC);
+
+ALTER TABLE event_sketches DISABLE ROW LEVEL SECURITY;
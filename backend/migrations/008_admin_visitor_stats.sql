@@ -0,0 +1,78 @@
+-- 008: /admin/visitors IP별 집계를 DB에서 수행 (정렬/필터/페이지네이션 포함)
+-- 기존: 최근 5000행을 내려받아 Python set으로 집계 → 트래픽 늘수록 느리고 부정확
+-- 반환: JSONB {total_ips, matched, deal_opens, clicks, rows}
+--   total_ips  : 기간 내 전체 고유 IP (필터 무관, 정확한 값)
+--   matched    : 필터 일치 IP 수 / deal_opens, clicks: 필터 일치 IP 합계
+--   rows       : 정렬된 페이지 (페이지가 범위를 벗어나 비어도 합계는 그대로)
+-- Supabase SQL Editor에서 실행하세요.
+
+-- created_at 인덱스는 006에서 생성
+
+-- 반환 타입 변경(TABLE → JSONB) 시 CREATE OR REPLACE 불가
+DROP FUNCTION IF EXISTS admin_visitor_stats(TIMESTAMPTZ, TEXT, INT, INT, TEXT, TEXT);
+
+CREATE FUNCTION admin_visitor_stats(
+  since TIMESTAMPTZ,
+  sort_by TEXT DEFAULT 'last_seen',     -- last_seen | visits | clicks | deal_opens | sessions
+  page_size INT DEFAULT 50,
+  page_offset INT DEFAULT 0,
+  ip_prefix TEXT DEFAULT NULL,          -- 리터럴 접두사 비교 (LIKE 와일드카드 %, _ 해석 안 함)
+  device_filter TEXT DEFAULT NULL       -- 모바일 | PC | 봇
+)
+RETURNS JSONB
+LANGUAGE SQL STABLE AS $$
+  WITH agg AS (
+    SELECT
+      ip_address AS ip,
+      COUNT(*) FILTER (WHERE event_type = 'impression') AS visits,
+      COUNT(*) FILTER (WHERE event_type = 'deal_open') AS deal_opens,
+      COUNT(*) FILTER (WHERE event_type = 'outbound_click') AS clicks,
+      COUNT(DISTINCT session_id) AS sessions,
+      COUNT(DISTINCT deal_id) FILTER (WHERE event_type = 'outbound_click') AS deals_clicked,
+      MIN(created_at) AS first_seen,
+      MAX(created_at) AS last_seen,
+      (ARRAY_AGG(user_agent ORDER BY created_at DESC) FILTER (WHERE user_agent IS NOT NULL))[1] AS user_agent
+    FROM event_logs
+    WHERE created_at >= since
+      AND ip_address IS NOT NULL
+    GROUP BY ip_address
+  ),
+  matched AS (
+    SELECT c.*,
+      CASE sort_by
+        WHEN 'visits' THEN c.visits
+        WHEN 'clicks' THEN c.clicks
+        WHEN 'deal_opens' THEN c.deal_opens
+        WHEN 'sessions' THEN c.sessions
+      END AS sort_key
+    FROM (
+      SELECT agg.*,
+        CASE
+          WHEN agg.user_agent LIKE '%Mobile%' THEN '모바일'
+          WHEN lower(agg.user_agent) LIKE '%bot%' THEN '봇'
+          ELSE 'PC'
+        END AS device
+      FROM agg
+    ) c
+    WHERE (ip_prefix IS NULL OR left(c.ip, length(ip_prefix)) = ip_prefix)
+      AND (device_filter IS NULL OR c.device = device_filter)
+  ),
+  page AS (
+    SELECT
+      m.ip, m.visits, m.deal_opens, m.clicks, m.sessions, m.deals_clicked, m.device,
+      m.first_seen, m.last_seen, LEFT(m.user_agent, 120) AS user_agent, m.sort_key
+    FROM matched m
+    ORDER BY m.sort_key DESC NULLS LAST, m.last_seen DESC
+    LIMIT page_size OFFSET page_offset
+  )
+  SELECT jsonb_build_object(
+    'total_ips', (SELECT COUNT(*) FROM agg),
+    'matched', (SELECT COUNT(*) FROM matched),
+    'deal_opens', (SELECT COALESCE(SUM(deal_opens), 0) FROM matched),
+    'clicks', (SELECT COALESCE(SUM(clicks), 0) FROM matched),
+    'rows', COALESCE(
+      (SELECT jsonb_agg(to_jsonb(p) - 'sort_key' ORDER BY p.sort_key DESC NULLS LAST, p.last_seen DESC) FROM page p),
+      '[]'::jsonb
+    )
+  );
+$$;
@@ -0,0 +1,10 @@
+-- 009: 딜 텍스트 검색 trigram 인덱스
+-- ilike('%term%') 는 btree 인덱스를 못 타므로 pg_trgm GIN 인덱스 추가
+-- (공개 검색은 앱 인메모리 n-gram 인덱스 사용, 이 인덱스는 관리자 검색 / fallback 경로용)
+-- Supabase SQL Editor에서 실행하세요.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_deals_title_trgm ON deals USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_deals_category_trgm ON deals USING GIN (category gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_deals_submitter_trgm ON deals USING GIN (submitter_name gin_trgm_ops);
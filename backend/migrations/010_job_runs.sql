@@ -0,0 +1,21 @@
+-- 010: 스케줄러 잡 실행 이력 (services/job_metrics)
+-- 잡 1회 실행마다 1행: 소요시간 / 상태 / 카운터(created, skipped, http_calls ...) / 주기 초과 여부
+-- 14일 지난 행은 스케줄러 prune_job_runs 잡이 삭제
+-- Supabase SQL Editor에서 실행하세요.
+
+CREATE TABLE IF NOT EXISTS job_runs (
+  id BIGSERIAL PRIMARY KEY,
+  job_id TEXT NOT NULL,
+  instance TEXT NOT NULL,           -- 실행한 앱 인스턴스 (hostname-pid-부팅nonce)
+  started_at TIMESTAMPTZ NOT NULL,
+  duration_ms INTEGER NOT NULL,
+  status TEXT NOT NULL,             -- 'ok' | 'error'
+  error TEXT,
+  counters JSONB NOT NULL DEFAULT '{}'::jsonb,
+  overran BOOLEAN NOT NULL DEFAULT FALSE  -- 소요시간 > 잡 주기
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_started ON job_runs(job_id, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_job_runs_started ON job_runs(started_at);
+
+ALTER TABLE job_runs DISABLE ROW LEVEL SECURITY;
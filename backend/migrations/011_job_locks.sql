@@ -0,0 +1,61 @@
+-- 011: 스케줄러 잡 분산 락 (services/job_lock)
+-- 여러 인스턴스/워커가 같은 잡을 중복 실행하지 않도록 잡 이름별 임대(lease) 1행.
+-- 시각 비교는 모두 DB 시계(NOW()) 기준 — 인스턴스 간 시계 오차 영향 없음.
+-- Supabase SQL Editor에서 실행하세요.
+
+CREATE TABLE IF NOT EXISTS job_locks (
+  name TEXT PRIMARY KEY,              -- 잡 id (또는 'worker_leader')
+  owner TEXT NOT NULL,                -- 보유 인스턴스 (hostname-pid-부팅nonce)
+  acquired_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  expires_at TIMESTAMPTZ NOT NULL,    -- 이 시각이 지나면 다른 인스턴스가 가져갈 수 있음
+  heartbeat_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE job_locks DISABLE ROW LEVEL SECURITY;
+
+-- 획득: 행 없음 / 만료됨 / 이미 내 것 → 내 것으로 (TTL 부여). 성공 여부 반환
+CREATE OR REPLACE FUNCTION acquire_job_lock(p_name TEXT, p_owner TEXT, p_ttl_seconds INTEGER)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  ok BOOLEAN;
+BEGIN
+  INSERT INTO job_locks (name, owner, acquired_at, expires_at, heartbeat_at)
+  VALUES (p_name, p_owner, NOW(), NOW() + make_interval(secs => p_ttl_seconds), NOW())
+  ON CONFLICT (name) DO UPDATE
+    SET owner = EXCLUDED.owner,
+        acquired_at = EXCLUDED.acquired_at,
+        expires_at = EXCLUDED.expires_at,
+        heartbeat_at = EXCLUDED.heartbeat_at
+    WHERE job_locks.expires_at < NOW() OR job_locks.owner = p_owner
+  RETURNING TRUE INTO ok;
+  RETURN COALESCE(ok, FALSE);
+END;
+$$;
+
+-- heartbeat: 내 것일 때만 만료 연장
+CREATE OR REPLACE FUNCTION renew_job_lock(p_name TEXT, p_owner TEXT, p_ttl_seconds INTEGER)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE job_locks
+     SET expires_at = NOW() + make_interval(secs => p_ttl_seconds),
+         heartbeat_at = NOW()
+   WHERE name = p_name AND owner = p_owner;
+  RETURN FOUND;
+END;
+$$;
+
+-- 반납: 획득 시각 + p_keep_seconds 까지는 유지 (주기가 어긋난 다른 인스턴스의 같은 주기 재실행 방지)
+CREATE OR REPLACE FUNCTION release_job_lock(p_name TEXT, p_owner TEXT, p_keep_seconds INTEGER DEFAULT 0)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE job_locks
+     SET expires_at = GREATEST(NOW(), acquired_at + make_interval(secs => p_keep_seconds))
+   WHERE name = p_name AND owner = p_owner;
+END;
+$$;
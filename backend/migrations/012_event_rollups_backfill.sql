@@ -0,0 +1,11 @@
+-- 012: 이벤트 롤업 1회 백필 (006 적용 후 실행)
+-- 롤업 테이블은 빈 상태로 시작하고 정기 compact 는 최근 48시간만 재계산하므로,
+-- 그대로 두면 관리자 7일 차트의 3~7일 전 구간이 일주일 동안 0으로 보인다.
+-- 최근 8일의 완결 구간(현재 정시 1시간 전까지)을 event_logs 원본으로 한 번 재계산한다.
+-- 같은 구간을 덮어쓰는 재계산이라 여러 번 실행해도 안전하다.
+-- Supabase SQL Editor에서 실행하세요.
+
+SELECT compact_event_rollups(
+  date_trunc('hour', NOW()) - INTERVAL '1 hour' - INTERVAL '8 days',
+  date_trunc('hour', NOW()) - INTERVAL '1 hour'
+);
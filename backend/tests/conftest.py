@@ -0,0 +1,189 @@
+"""
+테스트 공용 픽스처
+
+fake_sb: supabase-py 쿼리 빌더 흉내 (테이블별 in-memory 행 목록)
+— 서비스 모듈이 db.get_supabase() 로 만드는 쿼리를 그대로 실행해 저장/조회 흐름을 검증
+"""
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+import app.db_supabase as db
+
+
+class FakeQuery:
+    def __init__(self, store: "FakeSupabase", table: str):
+        self.store = store
+        self.table = table
+        self.op = "select"
+        self.payload = None
+        self.on_conflict = None
+        self.ignore_duplicates = False
+        self.filters = []
+        self.orders = []
+        self.offset = 0
+        self.limit_n = None
+        self.columns = "*"
+
+    # ── 작업 ──
+    def select(self, columns="*", count=None):
+        self.op, self.columns = "select", columns
+        return self
+
+    def insert(self, rows):
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict=None, ignore_duplicates=False):
+        self.op, self.payload = "upsert", rows
+        self.on_conflict, self.ignore_duplicates = on_conflict, ignore_duplicates
+        return self
+
+    def update(self, patch):
+        self.op, self.payload = "update", patch
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    # ── 필터 ──
+    def _f(self, fn):
+        self.filters.append(fn)
+        return self
+
+    def eq(self, col, val):
+        return self._f(lambda r: r.get(col) == val)
+
+    def neq(self, col, val):
+        return self._f(lambda r: r.get(col) != val)
+
+    def gte(self, col, val):
+        return self._f(lambda r: r.get(col) is not None and r.get(col) >= val)
+
+    def lt(self, col, val):
+        return self._f(lambda r: r.get(col) is not None and r.get(col) < val)
+
+    def is_(self, col, val):
+        return self._f(lambda r: (r.get(col) is None) if val == "null" else r.get(col) == val)
+
+    @property
+    def not_(self):
+        query = self
+
+        class _Not:
+            def is_(self, col, val):
+                return query._f(lambda r: (r.get(col) is not None) if val == "null" else r.get(col) != val)
+        return _Not()
+
+    def in_(self, col, vals):
+        vals = list(vals)
+        return self._f(lambda r: r.get(col) in vals)
+
+    def order(self, col, desc=False):
+        self.orders.append((col, desc))
+        return self
+
+    def limit(self, n):
+        self.limit_n = n
+        return self
+
+    def range(self, start, end):
+        self.offset, self.limit_n = start, end - start + 1
+        return self
+
+    # ── 실행 ──
+    def _match(self, row):
+        return all(f(row) for f in self.filters)
+
+    def execute(self):
+        rows = self.store.tables.setdefault(self.table, [])
+        if self.op == "select":
+            out = [r for r in rows if self._match(r)]
+            for col, desc in reversed(self.orders):
+                out.sort(key=lambda r: (r.get(col) is None, r.get(col)), reverse=desc)
+            end = None if self.limit_n is None else self.offset + self.limit_n
+            out = [dict(r) for r in out[self.offset:end]]
+            if self.columns != "*":
+                cols = [c.strip() for c in self.columns.split(",")]
+                out = [{c: r.get(c) for c in cols} for r in out]
+            return SimpleNamespace(data=out, count=len(out))
+        if self.op in ("insert", "upsert"):
+            payload = self.payload if isinstance(self.payload, list) else [self.payload]
+            conflict = self.on_conflict or self.store.primary_keys.get(self.table, "id")
+            keys = [k.strip() for k in conflict.split(",")]
+            written = []
+            for row in payload:
+                row = dict(row)
+                existing = None
+                if self.op == "upsert":
+                    existing = next((r for r in rows if all(r.get(k) == row.get(k) for k in keys)), None)
+                if existing is not None:
+                    if not self.ignore_duplicates:
+                        existing.update(row)
+                        written.append(dict(existing))
+                    continue
+                row.setdefault("id", next(self.store.ids))
+                rows.append(row)
+                written.append(dict(row))
+            return SimpleNamespace(data=written, count=len(written))
+        if self.op == "update":
+            hit = [r for r in rows if self._match(r)]
+            for r in hit:
+                r.update(self.payload)
+            return SimpleNamespace(data=[dict(r) for r in hit], count=len(hit))
+        if self.op == "delete":
+            keep = [r for r in rows if not self._match(r)]
+            gone = len(rows) - len(keep)
+            rows[:] = keep
+            return SimpleNamespace(data=[], count=gone)
+        raise AssertionError(self.op)
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.tables = {}
+        self.ids = itertools.count(1)
+        self.rpcs = {}
+        self.primary_keys = {"site_settings": "key", "job_locks": "name"}  # upsert 기본 충돌 키 (PK)
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, fn, params):
+        handler = self.rpcs[fn]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=handler(**params)))
+
+
+@pytest.fixture
+def fake_sb(monkeypatch):
+    sb = FakeSupabase()
+    monkeypatch.setattr(db, "get_supabase", lambda: sb)
+    return sb
+
+
+@pytest.fixture
+def sketch_db(fake_sb, monkeypatch):
+    """event_sketches 저장을 fake_sb 로 (upsert_event_sketch 의 on_conflict 키 그대로)"""
+    def upsert(day, kind, instance, payload):
+        fake_sb.table("event_sketches").upsert(
+            {"day": day, "kind": kind, "instance": instance, "payload": payload},
+            on_conflict="day,kind,instance",
+        ).execute()
+    monkeypatch.setattr(db, "upsert_event_sketch", upsert)
+    return fake_sb
+
+
+@pytest.fixture
+def restartable(monkeypatch):
+    """컨테이너 재시작 흉내 — hostname / PID 고정, 호출마다 새 부팅의 INSTANCE_ID 적용"""
+    from app.services import sketch_store
+    monkeypatch.setattr(sketch_store.socket, "gethostname", lambda: "web")
+    monkeypatch.setattr(sketch_store.os, "getpid", lambda: 1)
+
+    def boot() -> str:
+        instance = sketch_store._instance_id()
+        monkeypatch.setattr(sketch_store, "INSTANCE_ID", instance)
+        return instance
+    return boot
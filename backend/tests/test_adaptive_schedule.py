@@ -0,0 +1,60 @@
+from datetime import datetime
+
+import pytest
+
+from app.services import adaptive_schedule
+from app.services.adaptive_schedule import KST, MAX_STEP, SOURCE_POLICIES
+
+JOB = "sync_ppomppu"
+NOON = datetime(2026, 10, 1, 12, 0, tzinfo=KST)
+
+
+@pytest.fixture(autouse=True)
+def fresh_states(monkeypatch):
+    monkeypatch.setattr(adaptive_schedule, "_states", {})
+
+
+def test_starts_at_base_interval():
+    assert adaptive_schedule.current_interval(JOB) == SOURCE_POLICIES[JOB].base
+
+
+def test_busy_source_shortens_within_step_and_min():
+    policy = SOURCE_POLICIES[JOB]
+    first = adaptive_schedule.record_run(JOB, 30, now=NOON)  # 분당 3개 → 목표 1분
+    assert first == policy.base / MAX_STEP
+    for _ in range(10):
+        interval = adaptive_schedule.record_run(JOB, 30, now=NOON)
+    assert interval == policy.min
+
+
+def test_quiet_source_lengthens_up_to_max():
+    policy = SOURCE_POLICIES[JOB]
+    assert adaptive_schedule.record_run(JOB, 0, now=NOON) == policy.base * MAX_STEP
+    for _ in range(5):
+        interval = adaptive_schedule.record_run(JOB, 0, now=NOON)
+    assert interval == policy.max
+
+
+def test_next_hour_rate_preferred_over_overall():
+    state = adaptive_schedule._state(JOB)
+    state.rate, state.hourly[12] = 1.0, 0.0  # 전체로는 활발하지만 12시대는 조용
+    # 11:55 실행 → 다음 실행(12:05)은 12시대 수율 기준 → 주기 늘어남
+    interval = adaptive_schedule.record_run(JOB, 10, now=datetime(2026, 10, 1, 11, 55, tzinfo=KST))
+    assert interval == SOURCE_POLICIES[JOB].base * MAX_STEP
+    assert state.hourly[11] == 1.0
+
+
+def test_ewma_smooths_outliers():
+    adaptive_schedule.record_run(JOB, 3, now=NOON)
+    rate = adaptive_schedule._states[JOB].rate
+    interval = adaptive_schedule._states[JOB].interval
+    adaptive_schedule.record_run(JOB, 300, now=NOON)
+    assert adaptive_schedule._states[JOB].rate == pytest.approx(rate + 0.3 * (300 / interval - rate))
+
+
+def test_snapshot_reports_per_hour_rates():
+    adaptive_schedule.record_run(JOB, 6, now=NOON)
+    snap = adaptive_schedule.snapshot()[JOB]
+    assert snap["runs"] == 1 and snap["last_new_items"] == 6
+    assert snap["items_per_hour"] == pytest.approx(6 / SOURCE_POLICIES[JOB].base * 60)
+    assert list(snap["items_per_hour_by_kst_hour"]) == [12]
@@ -0,0 +1,41 @@
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+
+HEADERS = {"X-Admin-Key": settings.ADMIN_SECRET}
+
+
+def _rpc(calls):
+    def admin_visitor_stats(**params):
+        calls.append(params)
+        rows = [
+            {"ip": "1.2.3.4", "visits": 3, "deal_opens": 2, "clicks": 1, "sessions": 1, "deals_clicked": 1,
+             "device": "PC", "first_seen": "2026-10-01T00:00:00Z", "last_seen": "2026-10-01T01:00:00Z",
+             "user_agent": "UA"},
+        ]
+        return {
+            "total_ips": 120, "matched": 75, "deal_opens": 40, "clicks": 9,
+            "rows": rows[params["page_offset"]:params["page_offset"] + params["page_size"]],
+        }
+    return admin_visitor_stats
+
+
+def test_totals_do_not_depend_on_page(fake_sb):
+    calls = []
+    fake_sb.rpcs["admin_visitor_stats"] = _rpc(calls)
+    client = TestClient(app)
+
+    res = client.get("/admin/visitors?days=7&page=99&size=50&ip=1.2_", headers=HEADERS)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["summary"] == []
+    assert (body["total_ips"], body["matched_ips"], body["pages"]) == (120, 75, 2)
+    assert (body["total_deal_opens"], body["total_clicks"]) == (40, 9)
+    assert calls[0]["page_offset"] == 98 * 50
+    assert calls[0]["ip_prefix"] == "1.2_"  # 리터럴 접두사로 그대로 전달 (SQL 에서 left() 비교)
+
+
+def test_invalid_sort_rejected(fake_sb):
+    client = TestClient(app)
+    assert client.get("/admin/visitors?sort=bogus", headers=HEADERS).status_code == 400
@@ -0,0 +1,45 @@
+from app.services import autocomplete
+from app.services.deal_catalog import CatalogSnapshot
+
+DEALS = [
+    {"id": 1, "title": "삼성 갤럭시 S24 자급제 256GB", "category": "전자", "submitter_name": "Samsung", "upvotes": 10},
+    {"id": 2, "title": "삼성 갤럭시 버즈3", "category": "전자", "submitter_name": "Samsung", "upvotes": 0},
+    {"id": 3, "title": "[Nike] 에어맥스 운동화", "category": "패션", "submitter_name": "", "upvotes": 2},
+    {"id": 4, "title": "햇반 210g 36개", "category": "식품", "submitter_name": "쿠팡", "upvotes": 0},
+]
+
+
+def _index():
+    return autocomplete.build_index(CatalogSnapshot(version=0, built_at=0, deals=DEALS))
+
+
+def _values(q, limit=8):
+    return [s["value"] for s in _index().suggest(q, limit)]
+
+
+def test_prefix_matches_any_word_start_and_ranks_by_popularity():
+    values = _values("갤럭")
+    assert values[:2] == ["삼성 갤럭시 S24", "삼성 갤럭시 버즈3"]
+    assert "삼성 갤럭시 S24" in _values("s24")  # 가운데 단어로 시작해도 매칭
+
+
+def test_spacing_insensitive():
+    assert "삼성 갤럭시 S24" in _values("삼성갤럭")
+
+
+def test_choseong_prefix():
+    assert "삼성 갤럭시 S24" in _values("ㅅㅅ")
+    assert "햇반 210g 36개" in _values("ㅎㅂ")
+
+
+def test_types_and_retailer_exclusion():
+    suggestions = _index().suggest("samsung")
+    assert suggestions[0] == {"type": "brand", "value": "Samsung"}
+    assert _index().suggest("nike")[0] == {"type": "brand", "value": "Nike"}
+    assert not any(s["type"] == "brand" and s["value"] == "쿠팡" for s in _index().suggest("쿠팡"))
+
+
+def test_limit_and_empty_query():
+    assert len(_values("삼", limit=1)) == 1
+    assert _values("   ") == []
+    assert _values("없는검색어") == []
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import app.db_supabase as db
+from app.services import brand_index
+
+
+def _deal(id, status, days_ago, brand="Nike", price=10000, discount=10):
+    created = (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+    return {
+        "id": id, "title": f"딜 {id}", "status": status, "submitter_name": brand,
+        "sale_price": price, "original_price": price * 2, "discount_rate": discount, "created_at": created,
+        "upvotes": 0, "views": 0, "is_hot": False,
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(brand_index, "_entries", {})
+    monkeypatch.setattr(brand_index, "_deals", {})
+    monkeypatch.setattr(brand_index, "_built_version", None)
+    monkeypatch.setattr(brand_index, "_built_at", None)
+
+
+def test_first_build_skips_old_expired_history(fake_sb):
+    fake_sb.tables["deals"] = [
+        _deal(1, "active", 1, price=30000),
+        _deal(2, "expired", 10, price=20000),
+        _deal(3, "expired", brand_index.HISTORY_DAYS + 30, price=1000),  # 기간 밖 → 최저가 후보 아님
+        _deal(4, "active", brand_index.HISTORY_DAYS + 30, price=25000),  # 오래됐어도 노출 딜은 포함
+        _deal(5, "rejected", 1),
+    ]
+    assert brand_index.rebuild(force=True) == 1
+    entry = brand_index.get_brand("nike")
+    assert entry.count == 2
+    assert [d["id"] for d in entry.lowest()] == [2, 4, 1]
+
+
+def test_rebuild_reads_listed_and_rechecks_dropped(fake_sb):
+    fake_sb.tables["deals"] = [_deal(1, "active", 1), _deal(2, "active", 1)]
+    brand_index.rebuild(force=True)
+    fake_sb.tables["deals"][0]["status"] = "expired"
+    fake_sb.tables["deals"][1]["status"] = "rejected"
+    fake_sb.tables["deals"].append(_deal(3, "active", 0))
+    db.bump_data_version()
+    brand_index.rebuild()
+    assert set(brand_index._deals) == {1, 3}
+    assert brand_index._deals[1]["status"] == "expired"
+    assert brand_index.list_brands()[0]["count"] == 1
+
+
+def test_observe_is_noop_before_first_build():
+    brand_index.observe(_deal(9, "active", 0))
+    assert brand_index._deals == {}
+
+
+def test_extract_brand_excludes_retailers():
+    assert brand_index.extract_brand({"submitter_name": "쿠팡"}) is None
+    assert brand_index.extract_brand({"title": "[Apple] 에어팟"}) == "Apple"
+    assert brand_index.to_slug("New Balance!") == "new-balance"
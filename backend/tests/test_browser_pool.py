@@ -0,0 +1,110 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.price_scrapers import browser_pool
+from app.services.price_scrapers.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def new_context(self, **_):
+        browser = self
+
+        class Context:
+            def __init__(self):
+                self.browser = browser
+
+            async def add_init_script(self, _):
+                pass
+
+            async def new_page(self):
+                return SimpleNamespace(close=_noop)
+
+            async def close(self):
+                pass
+        return Context()
+
+
+async def _noop():
+    pass
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    launches = []
+
+    class Chromium:
+        async def launch(self, **_):
+            await asyncio.sleep(0)
+            launches.append(FakeBrowser())
+            return launches[-1]
+
+    class PW:
+        chromium = Chromium()
+
+        async def stop(self):
+            pass
+
+    class Starter:
+        async def start(self):
+            return PW()
+
+    module = SimpleNamespace(async_playwright=lambda: Starter())
+    monkeypatch.setitem(sys.modules, "playwright", SimpleNamespace(async_api=module))
+    monkeypatch.setitem(sys.modules, "playwright.async_api", module)
+    return launches
+
+
+def test_pool_created_outside_loop_works_across_loops(fake_playwright):
+    pool = BrowserPool(browsers=2, contexts_per_browser=1, max_uses=10)  # 루프 밖에서 생성
+
+    async def use():
+        async with pool.lease() as page:
+            assert page is not None
+
+    asyncio.run(use())
+    asyncio.run(pool.close())
+    asyncio.run(use())  # 다른 루프에서 재시작해도 락/큐가 새 루프에 생성됨
+    assert len(fake_playwright) == 4
+
+
+def test_concurrent_first_lease_starts_once(fake_playwright):
+    pool = BrowserPool(browsers=2, contexts_per_browser=2, max_uses=10)
+
+    async def use():
+        async with pool.lease():
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(*(use() for _ in range(6)))
+        assert pool._idle.qsize() == pool.capacity
+
+    asyncio.run(main())
+    assert len(fake_playwright) == 2
+
+
+def test_failed_launch_leaves_pool_unstarted(fake_playwright, monkeypatch):
+    pool = BrowserPool(browsers=2, contexts_per_browser=1, max_uses=10)
+    calls = []
+
+    async def flaky(pw=None):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("launch failed")
+        return FakeBrowser()
+    monkeypatch.setattr(pool, "_launch", flaky)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(pool._start())
+    assert not pool.started and pool._idle is None
@@ -0,0 +1,73 @@
+import asyncio
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from app.services import community_enricher, host_guard
+from app.services.community_enricher import check_deal_expired_from_url
+
+URL = "https://bbs.example.com/post/1"  # 기본 정책 호스트 (요청 간격 없음)
+PAGE = "<html><head><script>var s='sold out'</script></head><body><p>{}</p></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(community_enricher, "_post_states", OrderedDict())
+    monkeypatch.setattr(host_guard, "_hosts", {})
+
+
+def _check(handler, url=URL):
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await check_deal_expired_from_url(url, client=client)
+    return asyncio.run(main())
+
+
+def test_keyword_in_body_but_not_in_script():
+    assert _check(lambda req: httpx.Response(200, text=PAGE.format("정상 판매중"))) == (False, "")
+    expired, reason = _check(lambda req: httpx.Response(200, text=PAGE.format("딜이 종료 되었습니다")))
+    assert expired and "딜이 종료" in reason
+
+
+def test_conditional_request_and_304():
+    seen = []
+
+    def handler(req):
+        seen.append(dict(req.headers))
+        if req.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=PAGE.format("판매중"), headers={"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    assert _check(handler) == (False, "")
+    assert _check(handler) == (False, "")
+    assert "if-none-match" not in seen[0]
+    assert seen[1]["if-none-match"] == '"v1"'
+    assert seen[1]["if-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_unchanged_body_skips_scan(monkeypatch):
+    calls = []
+    real = community_enricher._scan_expiry
+    monkeypatch.setattr(community_enricher, "_scan_expiry", lambda url, raw: calls.append(1) or real(url, raw))
+    handler = lambda req: httpx.Response(200, text=PAGE.format("판매중"))
+    _check(handler)
+    _check(handler)
+    assert len(calls) == 1
+
+
+def test_404_is_expired():
+    assert _check(lambda req: httpx.Response(404)) == (True, "페이지 없음(404)")
+
+
+def test_reads_only_the_head_of_large_pages(monkeypatch):
+    monkeypatch.setattr(community_enricher, "EXPIRY_MAX_BYTES", 1024)
+    # 상한 뒤의 만료 키워드는 받지 않음
+    body = PAGE.format("판매중" + " " * 4096 + "판매종료")
+    assert _check(lambda req: httpx.Response(200, content=body.encode())) == (False, "")
+
+
+def test_circuit_open_is_not_expired():
+    state = host_guard._state(host_guard.host_key(URL))
+    state.open_until = float("inf")
+    assert _check(lambda req: httpx.Response(404)) == (False, "")
@@ -0,0 +1,56 @@
+import pytest
+
+import app.db_supabase as db
+from app.services import data_version_sync
+
+
+@pytest.fixture
+def fresh_sync(monkeypatch):
+    """data_version_sync / db 데이터 태그 모듈 상태 초기화 (새 프로세스 흉내)"""
+    monkeypatch.setattr(data_version_sync, "_published_for", db.get_data_version())
+    monkeypatch.setattr(data_version_sync, "_seen_token", None)
+    monkeypatch.setattr(db, "_shared_tag", None)
+    monkeypatch.setattr(db, "_shared_for", -1)
+
+
+def test_update_deal_fields_bumps_version(fake_sb):
+    fake_sb.tables["deals"] = [{"id": 1, "status": "pending", "image_url": ""}]
+    before = db.get_data_version()
+    db.update_deal_fields(1, {"image_url": "http://img"})
+    assert db.get_data_version() == before + 1
+    assert fake_sb.tables["deals"][0]["image_url"] == "http://img"
+
+
+def test_expire_deal_with_note_is_one_write(fake_sb):
+    fake_sb.tables["deals"] = [{"id": 7, "status": "active", "admin_note": None}]
+    before = db.get_data_version()
+    db.expire_deal(7, "[자동만료] 원글 종료 감지: 품절")
+    assert fake_sb.tables["deals"][0] == {"id": 7, "status": "expired", "admin_note": "[자동만료] 원글 종료 감지: 품절"}
+    assert db.get_data_version() == before + 1
+
+
+def test_boot_tag_is_process_local(fresh_sync):
+    tag = db.get_data_tag()
+    assert tag.startswith(db._BOOT_NONCE)
+    db.bump_data_version()
+    assert db.get_data_tag() != tag
+
+
+def test_replicas_converge_on_shared_tag(fake_sb, fresh_sync, monkeypatch):
+    # 레플리카 A: 쓰기 → publish → 공유 토큰 채택
+    db.bump_data_version()
+    data_version_sync.sync()
+    shared = fake_sb.tables["site_settings"][0]["value"]
+    assert db.get_data_tag() == shared
+
+    # 레플리카 B (새 프로세스): 첫 pull 에서 같은 토큰 채택
+    monkeypatch.setattr(data_version_sync, "_published_for", db.get_data_version())
+    monkeypatch.setattr(data_version_sync, "_seen_token", None)
+    monkeypatch.setattr(db, "_shared_tag", None)
+    assert db.get_data_tag() != shared
+    data_version_sync.pull()
+    assert db.get_data_tag() == shared
+
+    # 미공유 로컬 쓰기 → 즉시 프로세스 로컬 태그로 전환 (거짓 304 방지)
+    db.bump_data_version()
+    assert db.get_data_tag() != shared
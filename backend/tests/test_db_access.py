@@ -0,0 +1,42 @@
+import asyncio
+import threading
+
+import app.db_supabase as db
+
+
+def _rows(n, status="active"):
+    return [
+        {"id": i, "title": f"딜 {i}", "status": status, "original_price": 100, "sale_price": 50,
+         "discount_rate": 50, "upvotes": 0, "views": 0, "created_at": f"2026-10-01T00:{i // 60:02d}:{i % 60:02d}+00:00"}
+        for i in range(1, n + 1)
+    ]
+
+
+def test_run_db_offloads_to_pool_thread():
+    async def main():
+        return await db.run_db(lambda: threading.current_thread().name)
+    assert asyncio.run(main()).startswith("supabase")
+
+
+def test_aexecute_runs_query(fake_sb):
+    fake_sb.tables["deals"] = _rows(3)
+
+    async def main():
+        return await db.aexecute(fake_sb.table("deals").select("id").eq("status", "active"))
+    assert [r["id"] for r in asyncio.run(main()).data] == [1, 2, 3]
+
+
+def test_fetch_deals_pages_past_batch_size(fake_sb):
+    fake_sb.tables["deals"] = _rows(25) + _rows(3, status="rejected")
+    deals = db.fetch_deals(["active"], "card", batch_size=10)
+    assert len(deals) == 25
+    assert deals[0]["id"] == 25  # 최신순
+    assert len(db.fetch_deals(["active"], "card", limit=12, batch_size=10)) == 12
+
+
+def test_card_profile_projects_columns(fake_sb):
+    fake_sb.tables["deals"] = [{**_rows(1)[0], "description": "긴 본문", "total_views": 9}]
+    card = db.fetch_deals(["active"], "card")[0]
+    assert "description" not in card and card["today_views"] == 0
+    detail = db.get_deal_by_id(1, "detail")
+    assert detail["description"] == "긴 본문" and detail["total_views"] == 9
@@ -0,0 +1,57 @@
+import pytest
+
+import app.db_supabase as db
+from app.services import deal_catalog
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalog(monkeypatch):
+    monkeypatch.setattr(deal_catalog, "_snapshot", None)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+
+    def fetch(profile="card"):
+        calls.append(profile)
+        return [{"id": len(calls)}]
+    monkeypatch.setattr(db, "fetch_active_deals", fetch)
+    return calls
+
+
+def test_reused_until_version_changes_and_min_interval_passes(loads, monkeypatch):
+    first = deal_catalog.get_catalog()
+    assert deal_catalog.get_catalog() is first
+    db.bump_data_version()
+    assert deal_catalog.get_catalog() is first  # CATALOG_MIN_REFRESH_SECONDS 안에서는 재사용
+    monkeypatch.setattr(first, "built_at", first.built_at - deal_catalog.CATALOG_MIN_REFRESH_SECONDS - 1)
+    second = deal_catalog.get_catalog()
+    assert second is not first and second.version == db.get_data_version()
+    assert len(loads) == 2
+
+
+def test_failed_reload_keeps_previous_snapshot(loads, monkeypatch):
+    first = deal_catalog.get_catalog(force=True)
+
+    def boom(profile="card"):
+        raise RuntimeError("db down")
+    monkeypatch.setattr(db, "fetch_active_deals", boom)
+    assert deal_catalog.get_catalog(force=True) is first
+
+    monkeypatch.setattr(deal_catalog, "_snapshot", None)
+    with pytest.raises(RuntimeError):
+        deal_catalog.get_catalog()
+
+
+def test_derived_built_once_per_snapshot(loads):
+    snap = deal_catalog.get_catalog()
+    builds = []
+
+    def builder(s):
+        builds.append(s)
+        return {"n": len(s.deals)}
+    assert snap.peek("x") is None
+    assert snap.derived("x", builder) is snap.derived("x", builder)
+    assert len(builds) == 1
+    assert snap.by_id == {1: {"id": 1}}
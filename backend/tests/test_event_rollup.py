@@ -0,0 +1,71 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import event_rollup
+
+KST = event_rollup.KST
+
+
+@pytest.fixture(autouse=True)
+def empty_rollup(monkeypatch):
+    monkeypatch.setattr(event_rollup, "_hourly", Counter())
+    monkeypatch.setattr(event_rollup, "_deal_daily", Counter())
+
+
+def _increment(store):
+    def handler(hourly, deal_daily):
+        for h in hourly:
+            key = (h["bucket"], h["event_type"])
+            store["hourly"][key] = store["hourly"].get(key, 0) + h["count"]
+        for d in deal_daily:
+            key = (d["day"], d["deal_id"], d["event_type"])
+            store["deal"][key] = store["deal"].get(key, 0) + d["count"]
+    return handler
+
+
+def test_flush_moves_counts_to_db(fake_sb):
+    store = {"hourly": {}, "deal": {}}
+    fake_sb.rpcs["increment_event_rollups"] = _increment(store)
+    ts = datetime(2026, 10, 1, 3, 25, tzinfo=timezone.utc)
+    for _ in range(3):
+        event_rollup.record("outbound_click", deal_id=5, ts=ts)
+    event_rollup.record("impression", ts=ts)
+
+    assert event_rollup.flush() == 4
+    assert store["hourly"][("2026-10-01T03:00:00+00:00", "outbound_click")] == 3
+    assert store["deal"][("2026-10-01", 5, "outbound_click")] == 3
+    assert event_rollup.flush() == 0  # 비워짐
+
+
+def test_flush_failure_keeps_counts(fake_sb):
+    def boom(**_):
+        raise RuntimeError("db down")
+    fake_sb.rpcs["increment_event_rollups"] = boom
+    event_rollup.record("impression")
+    assert event_rollup.flush() == 0
+    assert sum(event_rollup._hourly.values()) == 1
+
+
+def test_daily_counts_merge_db_and_pending(fake_sb):
+    day = datetime(2026, 10, 1, tzinfo=KST).date()
+    # KST 10/1 00:30 = UTC 9/30 15:30 → KST 날짜 기준으로 합산되어야 함
+    fake_sb.tables["event_rollup_hourly"] = [
+        {"bucket": "2026-09-30T15:00:00+00:00", "event_type": "impression", "count": 10},
+        {"bucket": "2026-09-30T14:00:00+00:00", "event_type": "impression", "count": 99},  # 전날 KST
+    ]
+    event_rollup.record("impression", ts=datetime(2026, 10, 1, 12, 0, tzinfo=KST))
+    counts = event_rollup.get_daily_counts([day, day - timedelta(days=1)], ["impression", "deal_open"])
+    assert counts["2026-10-01"] == {"impression": 11, "deal_open": 0}
+    assert counts["2026-09-30"]["impression"] == 99
+
+
+def test_deal_day_counts_include_pending(fake_sb):
+    day = datetime(2026, 10, 1, tzinfo=KST).date()
+    fake_sb.tables["event_rollup_deal_daily"] = [
+        {"day": "2026-10-01", "deal_id": 5, "event_type": "deal_open", "count": 2},
+    ]
+    event_rollup.record("deal_open", deal_id=5, ts=datetime(2026, 10, 1, 9, 0, tzinfo=KST))
+    event_rollup.record("deal_open", deal_id=6, ts=datetime(2026, 10, 1, 9, 0, tzinfo=KST))
+    assert event_rollup.get_deal_day_counts(5, day) == {"deal_open": 3}
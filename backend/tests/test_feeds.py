@@ -0,0 +1,62 @@
+import asyncio
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import app.db_supabase as db
+from app.services import feeds
+
+DEALS = [
+    {"id": 1, "title": "A&B <특가>", "product_url": "https://shop/a?x=1&y=2", "sale_price": 9900,
+     "original_price": 19900, "discount_rate": 50, "created_at": "2026-10-01T00:00:00+00:00",
+     "image_url": "https://img/a.jpg", "category": "전자"},
+    {"id": 2, "title": "가격 없음", "product_url": "https://shop/b", "sale_price": 0,
+     "original_price": 0, "discount_rate": 0, "created_at": "bad-date", "category": "기타"},
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_feeds(monkeypatch):
+    monkeypatch.setattr(feeds, "_snapshots", {})
+    monkeypatch.setattr(feeds, "_locks", {})
+
+
+def test_rss_is_well_formed_and_escaped():
+    root = ET.fromstring(feeds.build_rss(DEALS))
+    items = root.findall("channel/item")
+    assert len(items) == 2
+    assert items[0].findtext("title") == "A&B <특가>"
+    assert items[0].findtext("link") == "https://shop/a?x=1&y=2"
+    assert items[0].findtext("pubDate").startswith("Thu, 01 Oct 2026")
+    assert items[0].find("enclosure").get("url") == "https://img/a.jpg"
+
+
+def test_google_feed_skips_deals_without_price():
+    root = ET.fromstring(feeds.build_google_shopping(DEALS))
+    g = "{http://base.google.com/ns/1.0}"
+    items = root.findall("channel/item")
+    assert [i.findtext(f"{g}id") for i in items] == ["1"]
+    assert items[0].findtext(f"{g}price") == "9900 KRW"
+
+
+def test_feed_regenerates_once_per_version(monkeypatch):
+    calls = []
+
+    def generate():
+        calls.append(1)
+        return feeds.build_rss(DEALS), len(DEALS)
+    monkeypatch.setitem(feeds._GENERATORS, "rss", generate)
+
+    async def main():
+        snaps = await asyncio.gather(*(feeds.get_feed("rss") for _ in range(5)))
+        assert len({id(s) for s in snaps}) == 1
+        first = snaps[0]
+        db.bump_data_version()
+        second = await feeds.get_feed("rss")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert len(calls) == 2
+    assert second is not first
+    # 내용이 같으면 ETag / Last-Modified 유지
+    assert second.etag == first.etag and second.last_modified == first.last_modified
@@ -0,0 +1,59 @@
+import random
+
+from app.services import sketch_store
+from app.services.heavy_hitters import SpaceSaving
+from app.services.sketch_store import DailySketchStore
+
+
+def test_exact_below_capacity():
+    sk = SpaceSaving(capacity=10)
+    for item, n in [("a", 5), ("b", 3), ("c", 1)]:
+        sk.offer(item, n)
+    assert sk.top(2) == [("a", 5, 0), ("b", 3, 0)]
+
+
+def test_heavy_items_survive_and_bound_holds():
+    rng = random.Random(7)
+    stream = ["hot1"] * 400 + ["hot2"] * 250 + [f"tail{rng.randrange(5000)}" for _ in range(2000)]
+    rng.shuffle(stream)
+    truth = {}
+    for item in stream:
+        truth[item] = truth.get(item, 0) + 1
+    sk = SpaceSaving(capacity=50)
+    for item in stream:
+        sk.offer(item)
+
+    top = sk.top(2)
+    assert [item for item, _, _ in top] == ["hot1", "hot2"]
+    for item, count, error in sk.top(50):
+        # Space-Saving 보장: count - error <= 실제 <= count
+        assert count - error <= truth[item] <= count
+
+
+def test_merge_and_payload_roundtrip():
+    a, b = SpaceSaving(capacity=8), SpaceSaving(capacity=8)
+    for _ in range(10):
+        a.offer("x")
+    for _ in range(7):
+        b.offer("x")
+        b.offer("y")
+    a.merge(SpaceSaving.from_payload(b.to_payload()))
+    assert a.top(2) == [("x", 17, 0), ("y", 7, 0)]
+
+
+def test_restart_keeps_counts_from_before(sketch_db, restartable):
+    day = sketch_store.kst_today()
+    first = restartable()
+    before = DailySketchStore("top_clicks", SpaceSaving, SpaceSaving.from_payload)
+    for _ in range(5):
+        before.update(lambda sk: sk.offer(42))
+    assert before.persist() == 1
+
+    # 재시작: 빈 메모리 스케치로 시작해 새로 집계 후 저장
+    assert restartable() != first  # 같은 hostname/PID 여도 부팅마다 다른 ID
+    after = DailySketchStore("top_clicks", SpaceSaving, SpaceSaving.from_payload)
+    after.update(lambda sk: sk.offer(42))
+    after.persist()
+
+    assert len(sketch_db.tables["event_sketches"]) == 2  # 이전 행을 덮어쓰지 않음
+    assert after.merged([day]).top(1) == [(42, 6, 0)]
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import host_guard
+from app.services.host_guard import CircuitOpenError, HostPolicy
+
+HOST = "shop.example"
+
+
+@pytest.fixture(autouse=True)
+def fresh_hosts(monkeypatch):
+    monkeypatch.setattr(host_guard, "_hosts", {})
+
+
+def _policy(monkeypatch, **kw):
+    kw = {"retries": 2, "backoff": 0.0, "fail_threshold": 2, "cooldown": 60.0, **kw}
+    monkeypatch.setitem(host_guard.HOST_POLICIES, HOST, HostPolicy(**kw))
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _get(handler, url=f"https://m.{HOST}/x"):
+    async def main():
+        async with _client(handler) as client:
+            return await host_guard.request(client, "GET", url)
+    return asyncio.run(main())
+
+
+def test_subdomains_share_policy_key():
+    assert host_guard.host_key("https://m.ppomppu.co.kr/a") == "ppomppu.co.kr"
+    assert host_guard.host_key("https://www.other.com/") == "www.other.com"
+
+
+def test_retries_5xx_then_succeeds(monkeypatch):
+    _policy(monkeypatch)
+    statuses = iter([503, 502, 200])
+    resp = _get(lambda req: httpx.Response(next(statuses)))
+    assert resp.status_code == 200
+    stats = host_guard.get_stats()[HOST]
+    assert stats["requests"] == 3 and stats["retries"] == 2 and stats["consecutive_failures"] == 0
+
+
+def test_circuit_opens_after_threshold_and_short_circuits(monkeypatch):
+    _policy(monkeypatch, retries=0)
+    calls = []
+
+    def handler(req):
+        calls.append(1)
+        return httpx.Response(500)
+
+    assert _get(handler).status_code == 500   # 재시도 소진 → 마지막 응답 반환
+    def down(req):
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(httpx.ConnectError):
+        _get(down)
+    assert host_guard.is_open(f"https://{HOST}/")
+    with pytest.raises(CircuitOpenError):
+        _get(handler)
+    assert len(calls) == 1  # open 상태에서는 요청 없음
+    assert host_guard.get_stats()[HOST]["short_circuited"] == 1
+
+
+def test_half_open_failure_reopens_immediately(monkeypatch):
+    _policy(monkeypatch, retries=0)
+    for _ in range(2):
+        _get(lambda req: httpx.Response(500))
+    state = host_guard._hosts[HOST]
+    state.open_until = 0.0  # cooldown 경과
+    _get(lambda req: httpx.Response(500))
+    assert host_guard.is_open(f"https://{HOST}/")
+    state.open_until = 0.0
+    assert _get(lambda req: httpx.Response(200)).status_code == 200
+    assert state.failures == 0
+
+
+def test_retry_after_is_respected_and_capped():
+    policy = HostPolicy(backoff=0.5)
+    assert host_guard._retry_delay(policy, 0, httpx.Response(429, headers={"retry-after": "7"})) == 7
+    assert host_guard._retry_delay(policy, 0, httpx.Response(429, headers={"retry-after": "999"})) == host_guard.MAX_RETRY_AFTER
+    assert host_guard._retry_delay(policy, 2, httpx.Response(503)) == 2.0
+
+
+def test_concurrency_and_min_interval(monkeypatch):
+    _policy(monkeypatch, concurrency=1, min_interval=0.05)
+    starts, running, peak = [], [0], [0]
+
+    async def handler(req):
+        starts.append(time.monotonic())
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return httpx.Response(200)
+
+    async def main():
+        async with _client(handler) as client:
+            await asyncio.gather(*(host_guard.request(client, "GET", f"https://{HOST}/{i}") for i in range(4)))
+    asyncio.run(main())
+    assert peak[0] == 1
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.045
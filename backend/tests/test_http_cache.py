@@ -0,0 +1,31 @@
+from fastapi.testclient import TestClient
+
+from app.http_cache import CACHE_POLICIES, compute_etag, etag_matches
+from app.main import app
+
+ORIGIN = "http://localhost:3000"
+
+
+def test_etag_changes_with_data_tag():
+    policy = CACHE_POLICIES["/api/categories"]
+    a = compute_etag("/api/categories", b"", policy, version="tag-a")
+    b = compute_etag("/api/categories", b"", policy, version="tag-b")
+    assert a != b
+    assert a == compute_etag("/api/categories", b"", policy, version="tag-a")
+
+
+def test_etag_matches_weak_and_list():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+    assert not etag_matches('W/"abd"', 'W/"abc"')
+
+
+def test_cross_origin_304_has_cors_headers():
+    etag = compute_etag("/api/categories", b"", CACHE_POLICIES["/api/categories"])
+    client = TestClient(app)  # with 블록 없이 — lifespan(스케줄러) 미실행
+    res = client.get("/api/categories", headers={"If-None-Match": etag, "Origin": ORIGIN})
+    assert res.status_code == 304
+    assert res.headers["access-control-allow-origin"] == ORIGIN
+    assert res.headers["etag"] == etag
@@ -0,0 +1,44 @@
+import json
+
+from app.services.price_scrapers import playwright_scraper
+from app.services.price_scrapers.http_extractor import parse_price_html
+
+URL = "https://www.11st.co.kr/products/1"
+ELEVENST = playwright_scraper.RETAILER_PROFILES["11번가"]
+
+
+def _ld(offers):
+    data = {"@context": "https://schema.org", "@type": "Product", "name": "x", "offers": offers}
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def test_json_ld_price_and_availability():
+    html = _ld({"@type": "Offer", "price": "12,900", "availability": "https://schema.org/OutOfStock"})
+    result = parse_price_html(html, URL)
+    assert (result.price, result.in_stock, result.method) == (12900, False, "json_ld")
+
+
+def test_json_ld_offer_list_and_low_price():
+    html = _ld([{"@type": "AggregateOffer", "lowPrice": 9900.0}])
+    result = parse_price_html(html, URL)
+    assert result.price == 9900 and result.in_stock is None
+
+
+def test_meta_then_state_fallback():
+    meta = '<meta property="product:price:amount" content="15000">'
+    assert parse_price_html(meta, URL).method == "meta"
+
+    state = '<script>window.__STATE__={"finalDscPrice":"21,500","selPrc":"30,000"}</script>'
+    result = parse_price_html(state, URL, ELEVENST.state_patterns, ELEVENST.original_patterns)
+    assert (result.price, result.original_price, result.method) == (21500, 30000, "state")
+
+
+def test_out_of_range_and_missing_prices_are_ignored():
+    assert parse_price_html('<meta property="og:price:amount" content="0">', URL) is None
+    assert parse_price_html("<html>가격 정보 없음</html>", URL) is None
+
+
+def test_original_below_sale_price_is_dropped():
+    html = '{"finalDscPrice":"21500","selPrc":"9000"}'
+    result = parse_price_html(html, URL, ELEVENST.state_patterns, ELEVENST.original_patterns)
+    assert result.original_price is None
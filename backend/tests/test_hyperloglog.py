@@ -0,0 +1,48 @@
+import pytest
+
+from app.services import sketch_store
+from app.services.hyperloglog import HyperLogLog
+from app.services.sketch_store import DailySketchStore
+
+
+@pytest.mark.parametrize("n", [10, 1000, 50000])
+def test_estimate_within_error(n):
+    hll = HyperLogLog()
+    for i in range(n):
+        hll.add(f"ip-{i}")
+        hll.add(f"ip-{i}")  # 중복은 세지 않음
+    assert abs(hll.count() - n) <= max(2, n * 0.05)
+
+
+def test_merge_is_union():
+    a, b = HyperLogLog(), HyperLogLog()
+    for i in range(3000):
+        a.add(f"v{i}")
+    for i in range(2000, 5000):
+        b.add(f"v{i}")
+    a.merge(HyperLogLog.from_payload(b.to_payload()))
+    assert abs(a.count() - 5000) <= 250
+
+
+def test_precision_mismatch_rejected():
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
+
+
+def test_visitors_survive_restart(sketch_db, restartable):
+    """오늘 방문자 수가 재시작 후에도 재시작 전 방문자를 포함해야 함"""
+    day = sketch_store.kst_today()
+
+    restartable()
+    before = DailySketchStore("uv_ip", HyperLogLog, HyperLogLog.from_payload)
+    for i in range(1000):
+        before.update(lambda h, i=i: h.add(f"10.0.{i // 256}.{i % 256}"))
+    before.persist()
+
+    restartable()
+    after = DailySketchStore("uv_ip", HyperLogLog, HyperLogLog.from_payload)
+    for i in range(900, 1500):  # 100명은 재방문
+        after.update(lambda h, i=i: h.add(f"10.0.{i // 256}.{i % 256}"))
+    after.persist()
+
+    assert abs(after.merged([day]).count() - 1500) <= 75
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from app.services import job_lock, job_metrics
+from app.services.job_lock import FileLockBackend, LockBackend
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    b = FileLockBackend(str(tmp_path))
+    monkeypatch.setattr(job_lock, "_backend", b)
+    return b
+
+
+def _steal(backend, name, owner="other", ttl=60):
+    """다른 인스턴스가 만료된 임대를 인계한 상태로 파일 덮어쓰기"""
+    now = time.time()
+    with open(os.path.join(backend.directory, f"{name}.lock"), "w") as f:
+        json.dump({"owner": owner, "acquired_at": now, "expires_at": now + ttl}, f)
+
+
+def test_lock_backend_is_abstract():
+    with pytest.raises(TypeError):
+        LockBackend()
+
+    class Partial(LockBackend):
+        def acquire(self, name, owner, ttl):
+            return True
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_contention_and_reentry(backend):
+    assert backend.acquire("job", "a", 60)
+    assert not backend.acquire("job", "b", 60)
+    assert backend.acquire("job", "a", 60)  # 이미 내 것
+    assert not backend.renew("job", "b", 60)
+    assert backend.renew("job", "a", 60)
+
+
+def test_expired_lease_can_be_taken_over(backend):
+    assert backend.acquire("job", "a", 0.05)
+    time.sleep(0.1)
+    assert backend.acquire("job", "b", 60)
+    assert not backend.renew("job", "a", 60)
+
+
+def test_release_keeps_for_remaining_interval(backend):
+    assert backend.acquire("job", "a", 60)
+    backend.release("job", "b", keep_seconds=0)  # 남의 반납은 무시
+    assert not backend.acquire("job", "b", 60)
+    backend.release("job", "a", keep_seconds=60)  # 주기 내에는 계속 차단
+    assert not backend.acquire("job", "b", 60)
+    backend.release("job", "a", keep_seconds=0)
+    assert backend.acquire("job", "b", 60)
+
+
+def test_guard_skips_when_busy(backend):
+    backend.acquire("sync_x", "other", 60)
+    calls = []
+
+    async def job():
+        calls.append(1)
+    assert asyncio.run(job_lock.guard("sync_x", job)()) is None
+    assert calls == []
+    assert job_metrics._skips["sync_x"]["lock_busy"] >= 1
+
+
+def test_lease_runs_and_releases(backend):
+    async def main():
+        async with job_lock.lease("sync_y", ttl=60) as acquired:
+            assert acquired
+            assert not backend.acquire("sync_y", "other", 60)
+    asyncio.run(main())
+    assert backend.acquire("sync_y", "other", 60)
+
+
+def _stealing_job(backend, name, progress):
+    async def job():
+        for i in range(50):
+            progress.append(i)
+            if i == 2:
+                _steal(backend, name)  # 만료 후 다른 인스턴스가 인계
+            await asyncio.sleep(0.02)
+        return "finished"
+    return job
+
+
+def test_lease_loss_cancels_running_job(backend):
+    progress = []
+    job = _stealing_job(backend, "sync_z", progress)
+
+    async def main():
+        async with job_lock.lease("sync_z", ttl=0.15) as acquired:
+            assert acquired
+            return await job()
+
+    with pytest.raises(job_lock.LeaseLost):
+        asyncio.run(main())
+    assert len(progress) < 50
+    assert not backend.acquire("sync_z", job_lock.INSTANCE_ID, 60)  # 남의 임대는 반납하지 않음
+
+
+def test_guard_counts_lease_loss(backend, monkeypatch):
+    monkeypatch.setattr(job_lock.settings, "JOB_LOCK_TTL", 0.15)
+    progress = []
+    before = job_metrics._skips["sync_w"]["lease_lost"]
+    assert asyncio.run(job_lock.guard("sync_w", _stealing_job(backend, "sync_w", progress))()) is None
+    assert len(progress) < 50
+    assert job_metrics._skips["sync_w"]["lease_lost"] == before + 1
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+import pytest
+
+import app.db_supabase as db
+from app.services import job_metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics(monkeypatch):
+    monkeypatch.setattr(job_metrics, "_runs", job_metrics.defaultdict(lambda: job_metrics.deque(maxlen=job_metrics.RING_SIZE)))
+    monkeypatch.setattr(job_metrics, "_scheduler", None)
+
+
+def _last(job_id):
+    return job_metrics._runs[job_id][-1]
+
+
+def test_counters_from_worker_threads_reach_the_run():
+    def sync_work(n):
+        job_metrics.add(http_calls=n)
+        return n
+
+    async def job():
+        await asyncio.gather(*(db.run_db(sync_work, 1) for _ in range(20)))
+        job_metrics.add(created=2)
+
+    asyncio.run(job_metrics.instrument("sync_x", job, persist=False)())
+    run = _last("sync_x")
+    assert run.status == "ok"
+    assert run.counters == {"http_calls": 20, "created": 2}
+
+
+def test_error_log_inside_worker_marks_run_failed(monkeypatch):
+    handler = job_metrics._ErrorCapture(level=logging.ERROR)
+    logging.getLogger("app").addHandler(handler)
+    try:
+        async def job():
+            await db.run_db(lambda: logging.getLogger("app.x").error("db write failed"))
+
+        asyncio.run(job_metrics.instrument("sync_y", job, persist=False)())
+    finally:
+        logging.getLogger("app").removeHandler(handler)
+    assert _last("sync_y").status == "error"
+    assert _last("sync_y").error == "db write failed"
+
+
+def test_add_outside_job_is_ignored():
+    job_metrics.add(created=1)  # 예외 없이 무시
+
+
+def test_exception_is_recorded_and_reraised():
+    async def job():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        asyncio.run(job_metrics.instrument("sync_z", job, persist=False)())
+    assert _last("sync_z").error == "ValueError: boom"
+
+
+def test_summarize_runs_percentiles():
+    runs = [
+        {"duration_ms": d, "status": "ok", "counters": {"created": 1}, "started_at": "t", "overran": d > 300}
+        for d in (100, 200, 300, 400)
+    ]
+    runs[0]["status"], runs[0]["error"] = "error", "x"
+    s = job_metrics.summarize_runs(runs)
+    assert s["p50_ms"] == 250.0 and s["max_ms"] == 400
+    assert s["errors"] == 1 and s["overruns"] == 1 and s["counters"] == {"created": 4}
+    assert s["last_error"] == "x"
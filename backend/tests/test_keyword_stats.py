@@ -0,0 +1,52 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app.db_supabase as db
+from app.main import app
+from app.services import deal_catalog, heavy_hitters, keyword_stats, sketch_store
+from app.services.deal_catalog import CatalogSnapshot
+
+DEALS = [
+    {"id": 1, "title": "나이키 에어맥스 운동화", "category": "패션", "submitter_name": "", "discount_rate": 40, "sale_price": 89000},
+    {"id": 2, "title": "나이키 조거팬츠", "category": "패션", "submitter_name": "", "discount_rate": 25, "sale_price": 39000},
+    {"id": 3, "title": "에어팟 프로 2세대", "category": "전자", "submitter_name": "", "discount_rate": 15, "sale_price": 259000},
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch, sketch_db):
+    snap = CatalogSnapshot(version=db.get_data_version(), built_at=0, deals=DEALS)
+    monkeypatch.setattr(deal_catalog, "get_catalog", lambda force=False: snap)
+    monkeypatch.setattr(keyword_stats, "get_catalog", lambda force=False: snap)
+    monkeypatch.setattr(keyword_stats, "_table", [])
+    monkeypatch.setattr(keyword_stats, "_built_at", None)
+    store = sketch_store.DailySketchStore("top_searches", heavy_hitters.SpaceSaving, heavy_hitters.SpaceSaving.from_payload)
+    monkeypatch.setattr(heavy_hitters, "top_searches", store)
+    return store
+
+
+def test_popular_from_sketch(isolated):
+    for kw, n in [("나이키", 5), ("에어팟", 2)]:
+        for _ in range(n):
+            isolated.update(lambda sk, kw=kw: sk.offer(kw))
+    table = keyword_stats.get_popular(10)
+    assert table[0] == {"keyword": "나이키", "count": 5, "discount_rate": 40, "min_price": 39000}
+    assert table[1]["keyword"] == "에어팟"
+
+
+def test_empty_sketch_seeds_from_event_logs(fake_sb):
+    fake_sb.tables["event_logs"] = [
+        {"event_type": "search", "referrer": r, "created_at": "2999-01-01T00:00:00+00:00"}
+        for r in ["나이키", " 나이키 ", "에어팟", None]
+    ] + [{"event_type": "impression", "referrer": "나이키", "created_at": "2999-01-01T00:00:00+00:00"}]
+    table = keyword_stats.get_popular(10)
+    assert [(e["keyword"], e["count"]) for e in table] == [("나이키", 2), ("에어팟", 1)]
+
+
+def test_limit_above_table_size_is_accepted(isolated):
+    for i in range(keyword_stats.TOP_KEYWORDS + 10):
+        isolated.update(lambda sk, i=i: sk.offer(f"kw{i}"))
+    assert len(keyword_stats.get_popular(keyword_stats.TOP_KEYWORDS + 10)) == keyword_stats.TOP_KEYWORDS + 10
+
+    res = TestClient(app).get("/api/search/popular?limit=100")
+    assert res.status_code == 200  # 기존 호출(limit 상한 없음)이 422 가 되지 않음
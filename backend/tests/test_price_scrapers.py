@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from app.services import price_checker
+from app.services.price_scrapers import playwright_scraper
+from app.services.price_scrapers.playwright_scraper import PriceResult, get_actual_prices
+
+GMARKET = "https://item.gmarket.co.kr/Item?goodscode={}"
+COUPANG = "https://www.coupang.com/vp/products/{}"
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    state = {"running": 0, "peak": {}, "cancelled": 0, "finished": 0, "delay": {}}
+
+    async def fetch(url, playwright_page=None):
+        retailer = playwright_scraper.detect_retailer(url)
+        state["running"] += 1
+        state["peak"][retailer] = max(state["peak"].get(retailer, 0), state["running"])
+        try:
+            await asyncio.sleep(state["delay"].get(url, 0.01))
+            state["finished"] += 1
+            return PriceResult(price=1000, original_price=1000, in_stock=True, retailer=retailer, url=url)
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        finally:
+            state["running"] -= 1
+    monkeypatch.setattr(playwright_scraper, "get_actual_price", fetch)
+    return state
+
+
+async def _collect(gen):
+    return [item async for item in gen]
+
+
+def test_yields_every_supported_url_once(fake_fetch):
+    urls = [GMARKET.format(i) for i in range(5)] + [GMARKET.format(0), "https://example.com/x", ""]
+    out = asyncio.run(_collect(get_actual_prices(urls)))
+    assert sorted(u for u, _ in out) == sorted(set(urls) - {""})
+    assert dict(out)["https://example.com/x"] is None
+
+
+def test_retailer_concurrency_cap(fake_fetch):
+    urls = [COUPANG.format(i) for i in range(8)]
+    asyncio.run(_collect(get_actual_prices(urls, concurrency=16)))
+    assert fake_fetch["peak"]["쿠팡"] <= playwright_scraper.RETAILER_PROFILES["쿠팡"].max_concurrency
+
+
+def test_deadline_cancels_and_awaits_remaining(fake_fetch):
+    slow = GMARKET.format("slow")
+    fake_fetch["delay"][slow] = 10
+    out = asyncio.run(_collect(get_actual_prices([GMARKET.format(1), slow], deadline=0.2)))
+    assert [u for u, _ in out] == [GMARKET.format(1)]
+    assert fake_fetch["cancelled"] == 1 and fake_fetch["running"] == 0
+
+
+def test_early_stop_cancels_and_awaits_remaining(fake_fetch):
+    urls = [GMARKET.format(i) for i in range(6)]
+    for u in urls[1:]:
+        fake_fetch["delay"][u] = 10
+    fake_fetch["delay"][urls[0]] = 0
+
+    async def first_only():
+        gen = get_actual_prices(urls)
+        async for item in gen:
+            await gen.aclose()
+            return item, fake_fetch["running"]
+
+    (url, _), running_after_close = asyncio.run(first_only())
+    assert url == urls[0]
+    assert running_after_close == 0  # aclose() 반환 시점에 남은 작업이 모두 종료됨
+    assert fake_fetch["finished"] == 1 and fake_fetch["cancelled"] >= 1
+
+
+def test_verify_deal_uses_actual_price(monkeypatch):
+    async def never(*_a, **_k):
+        raise AssertionError("actual_price 가 있으면 URL 확인 / 네이버 검색 생략")
+    monkeypatch.setattr(price_checker, "check_url_alive", never)
+    monkeypatch.setattr(price_checker, "check_naver_price", never)
+    deal = {"id": 1, "title": "t", "source": "admin", "product_url": GMARKET.format(1), "sale_price": 10000, "verified_price": None}
+    check = asyncio.run(price_checker.verify_deal(deal, actual_price=13000))
+    assert check["verified_price"] == 13000 and check["action"] == "expired"
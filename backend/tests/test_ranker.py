@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import settings
+from app.services import ranker
+from app.services.deal_catalog import CatalogSnapshot
+
+
+def _deal(id, hours_ago, views=0, clicks=0, upvotes=0, discount=0):
+    created = (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat()
+    return {
+        "id": id, "created_at": created, "views": views, "total_clicks": clicks,
+        "upvotes": upvotes, "discount_rate": discount, "is_hot": False,
+    }
+
+
+def _snapshot(deals):
+    return CatalogSnapshot(version=0, built_at=0, deals=deals)
+
+
+def test_score_halves_every_half_life():
+    d = _deal(1, 0, views=100, discount=50)
+    fresh = ranker.score(d, 0)
+    assert ranker.score(d, settings.RANK_HALF_LIFE_HOURS) == pytest.approx(fresh / 2)
+    assert ranker.score(d, 24, half_life=24 * 7) == pytest.approx(fresh * 0.5 ** (1 / 7))
+
+
+def test_weekly_uses_its_own_half_life():
+    # 5일 전 딜이 참여도 2배 이상 → 24h 반감기(1/32)면 밀리지만 주간 반감기에서는 1위
+    old = _deal(1, 24 * 5, views=10000, clicks=2000, upvotes=300)
+    new = _deal(2, 1, views=100, clicks=20, upvotes=3)
+    ranking = ranker.compute_ranking(_snapshot([old, new]))
+    assert ranking.scores[2] > ranking.scores[1]
+    assert ranking.weekly == [1, 2]
+
+
+def test_windows():
+    ranking = ranker.compute_ranking(_snapshot([_deal(1, 1, views=5), _deal(2, 60, views=5), _deal(3, 24 * 8)]))
+    assert ranking.trending == [1]
+    assert set(ranking.weekly) == {1, 2}
+
+
+def test_counters_override_stale_snapshot():
+    a, b = _deal(1, 1, views=100), _deal(2, 1, views=1)
+    assert ranker.compute_ranking(_snapshot([a, b])).trending == [1, 2]
+    counters = {2: {"views": 5000, "total_clicks": 100, "upvotes": 0, "is_hot": False}}
+    assert ranker.compute_ranking(_snapshot([a, b]), counters).trending == [2, 1]
+
+
+def test_refresh_reads_counters_and_tolerates_failure(fake_sb, monkeypatch):
+    a, b = _deal(1, 1, views=100), _deal(2, 1, views=1)
+    monkeypatch.setattr(ranker, "get_catalog", lambda force=False: _snapshot([a, b]))
+    fake_sb.tables["deals"] = [
+        {"id": 1, "status": "active", "views": 100, "total_clicks": 0, "upvotes": 0, "is_hot": False},
+        {"id": 2, "status": "active", "views": 9000, "total_clicks": 0, "upvotes": 0, "is_hot": False},
+    ]
+    assert ranker.refresh().trending == [2, 1]
+
+    def boom(*_a, **_k):
+        raise RuntimeError("db down")
+    monkeypatch.setattr(ranker.db, "fetch_engagement_counters", boom)
+    assert ranker.refresh().trending == [1, 2]
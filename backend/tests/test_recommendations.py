@@ -0,0 +1,45 @@
+import pytest
+
+from app.services import recommendations
+from app.services.deal_catalog import CatalogSnapshot
+
+pytest.importorskip("numpy")
+
+DEALS = [
+    {"id": 1, "title": "삼성 갤럭시 S24 자급제 256GB", "category": "전자", "submitter_name": "Samsung", "sale_price": 1000000},
+    {"id": 2, "title": "삼성 갤럭시 S24 울트라 자급제", "category": "전자", "submitter_name": "Samsung", "sale_price": 1300000},
+    {"id": 3, "title": "나이키 에어맥스 운동화", "category": "패션", "submitter_name": "Nike", "sale_price": 89000},
+    {"id": 4, "title": "나이키 에어포스 운동화", "category": "패션", "submitter_name": "Nike", "sale_price": 99000},
+    {"id": 5, "title": "햇반 210g 36개", "category": "식품", "submitter_name": "", "sale_price": 25000},
+]
+
+
+def test_similar_titles_rank_first_and_self_is_excluded():
+    related = recommendations.compute_related(DEALS, top_n=3)
+    assert related[1][0] == 2
+    assert related[3][0] == 4
+    for deal_id, ids in related.items():
+        assert deal_id not in ids
+        assert len(ids) <= 3
+
+
+def test_unrelated_deals_are_dropped():
+    related = recommendations.compute_related(DEALS, top_n=4)
+    assert 5 not in related[1][:2]
+
+
+def test_too_few_deals():
+    assert recommendations.compute_related(DEALS[:1]) == {}
+
+
+def test_get_related_filters_inactive(monkeypatch):
+    snap = CatalogSnapshot(version=7, built_at=0, deals=DEALS)
+    monkeypatch.setattr(recommendations, "get_catalog", lambda force=False: snap)
+    monkeypatch.setattr(recommendations, "_related", {})
+    monkeypatch.setattr(recommendations, "_built_version", None)
+    assert recommendations.refresh() == len(DEALS)
+
+    shrunk = CatalogSnapshot(version=8, built_at=0, deals=[d for d in DEALS if d["id"] != 2])
+    related = recommendations.get_related(1, shrunk, limit=3)
+    assert 2 not in [d["id"] for d in related]
+    assert recommendations.get_related(999, shrunk) is None
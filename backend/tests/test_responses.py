@@ -0,0 +1,37 @@
+import orjson
+from fastapi.testclient import TestClient
+
+import app.db_supabase as db
+from app.config import settings
+from app.main import app
+from app.responses import fast_json
+
+
+def _card(i):
+    return db.serialize_deals([{
+        "id": i, "title": f"딜 {i} " + "가" * 40, "original_price": 20000, "sale_price": 10000,
+        "discount_rate": 50, "upvotes": 1, "views": 2, "created_at": "2026-10-01T00:00:00+00:00",
+    }])[0]
+
+
+def test_fast_json_serializes_with_orjson():
+    res = fast_json([_card(1)])
+    assert res.media_type == "application/json"
+    assert orjson.loads(res.body)[0]["title"].startswith("딜 1")
+
+
+def test_large_responses_are_compressed(fake_sb):
+    fake_sb.tables["deals"] = [{**_card(i), "status": "active"} for i in range(1, 40)]
+    client = TestClient(app)
+    ids = ",".join(str(i) for i in range(1, 40))
+    res = client.get(f"/api/deals/by-ids?ids={ids}", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert len(res.json()) == 39
+    assert len(res.content) > settings.COMPRESSION_MIN_SIZE
+
+
+def test_small_responses_are_not_compressed(fake_sb):
+    fake_sb.tables["deals"] = [{**_card(1), "status": "active"}]
+    res = TestClient(app).get("/api/deals/by-ids?ids=1", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
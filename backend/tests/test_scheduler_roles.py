@@ -0,0 +1,44 @@
+import pytest
+
+import app.db_supabase as db
+from app import scheduler
+from app.config import settings
+from app.services import data_version_sync
+
+
+@pytest.mark.parametrize("mode, role", [("all", "all"), ("worker", "api"), ("off", "api")])
+def test_api_role_by_mode(monkeypatch, mode, role):
+    monkeypatch.setattr(settings, "SCHEDULER_MODE", mode)
+    assert scheduler.api_role() == role
+
+
+def test_unknown_mode_is_rejected(monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULER_MODE", "both")
+    with pytest.raises(ValueError):
+        scheduler.api_role()
+
+
+def test_jobs_split_between_api_and_worker():
+    assert scheduler._job_enabled("flush_event_rollups", "api")
+    assert not scheduler._job_enabled("verify_prices", "api")
+    assert scheduler._job_enabled("verify_prices", "worker")
+    assert not scheduler._job_enabled("flush_event_rollups", "worker")
+    assert scheduler._job_enabled("verify_prices", "all") and scheduler._job_enabled("flush_event_rollups", "all")
+    assert all(scheduler._job_enabled("sync_data_version", role) for role in scheduler.ROLES)
+
+
+def test_worker_write_invalidates_api_caches(fake_sb, monkeypatch):
+    monkeypatch.setattr(db, "_shared_tag", None)
+    monkeypatch.setattr(data_version_sync, "_published_for", db.get_data_version())
+    monkeypatch.setattr(data_version_sync, "_seen_token", None)
+    data_version_sync.pull()  # 기동 직후 — 공유 토큰 없음
+
+    # 워커가 딜을 쓰고 공유
+    fake_sb.table("site_settings").upsert({"key": data_version_sync.SETTING_KEY, "value": "worker:1:1"}).execute()
+    data_version_sync.pull()  # 첫 관측은 기준만 채택
+    before = db.get_data_version()
+    fake_sb.table("site_settings").upsert({"key": data_version_sync.SETTING_KEY, "value": "worker:2:2"}).execute()
+    assert data_version_sync.pull()
+    assert db.get_data_version() == before + 1
+    assert db.get_data_tag() == "worker:2:2"
+    assert not data_version_sync.publish()  # pull 로 올린 버전은 다시 공유하지 않음
@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services.price_scrapers import playwright_scraper
+from app.services.price_scrapers.playwright_scraper import RETAILER_PROFILES, _block_resources, _host_allowed
+
+
+class FakePage:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+
+def _route(resource_type, url):
+    calls = []
+
+    async def abort():
+        calls.append("abort")
+
+    async def continue_():
+        calls.append("continue")
+    return SimpleNamespace(request=SimpleNamespace(resource_type=resource_type, url=url), abort=abort, continue_=continue_), calls
+
+
+def _decide(profile, resource_type, url):
+    page = FakePage()
+
+    async def main():
+        await _block_resources(page, profile)
+        route, calls = _route(resource_type, url)
+        await page.handler(route)
+        return calls[0]
+    return asyncio.run(main())
+
+
+def test_host_allowed_matches_subdomains_only():
+    assert _host_allowed("https://script.gmarket.co.kr/a.js", ("gmarket.co.kr",))
+    assert _host_allowed("https://gmarket.co.kr/a.js", ("gmarket.co.kr",))
+    assert not _host_allowed("https://evilgmarket.co.kr/a.js", ("gmarket.co.kr",))
+
+
+def test_blocks_media_and_third_party_scripts():
+    profile = RETAILER_PROFILES["gmarket"]
+    assert _decide(profile, "image", "https://image.gmarket.co.kr/a.jpg") == "abort"
+    assert _decide(profile, "font", "https://fonts.example.com/a.woff") == "abort"
+    assert _decide(profile, "script", "https://www.googletagmanager.com/gtm.js") == "abort"
+    assert _decide(profile, "script", "https://script.gmarket.co.kr/app.js") == "continue"
+    assert _decide(profile, "document", "https://item.gmarket.co.kr/Item") == "continue"
+
+
+def test_detect_retailer():
+    assert playwright_scraper.detect_retailer("https://smartstore.naver.com/x/products/1") == "스마트스토어"
+    assert playwright_scraper.detect_retailer("https://example.com") == "unknown"
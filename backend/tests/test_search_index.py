@@ -0,0 +1,42 @@
+from app.services import search_index
+from app.services.deal_catalog import CatalogSnapshot
+
+DEALS = [
+    {"id": 1, "title": "나이키 에어맥스 운동화", "category": "패션", "submitter_name": ""},
+    {"id": 2, "title": "나이키 조거팬츠", "category": "패션", "submitter_name": ""},
+    {"id": 3, "title": "에어팟 프로 2세대", "category": "전자", "submitter_name": ""},
+    {"id": 4, "title": "삼성 갤럭시S24 자급제", "category": "전자", "submitter_name": ""},
+]
+
+
+def _index():
+    return search_index.build_index(CatalogSnapshot(version=0, built_at=0, deals=DEALS))
+
+
+def _ids(query):
+    return [deal_id for deal_id, _ in _index().search(query)]
+
+
+def test_partial_hangul_and_spacing():
+    assert _ids("에어팟프로") == [3]
+    assert _ids("갤럭시") == [4]
+    assert set(_ids("나이키")) == {1, 2}
+
+
+def test_unknown_word_does_not_fall_back_to_known_one():
+    # "구두" 는 어느 딜에도 없음 → 나이키 딜 전체가 걸리면 안 됨
+    assert _ids("나이키 구두") == []
+    # 둘 다 있는 딜만
+    assert _ids("나이키 운동화") == [1]
+
+
+def test_choseong_query():
+    assert set(_ids("ㄴㅇㅋ")) == {1, 2}
+    assert _ids("ㄱㄹㅅ") == [4]
+    assert _ids("ㄴㅇㅋ ㅇㄷㅎ")[0] == 1
+
+
+def test_title_substring_bonus_ranks_first():
+    hits = _index().search("나이키 조거")
+    assert hits[0][0] == 2
+
@@ -4,6 +4,7 @@ import { useEffect, useState } from "react";
 
 const API = process.env.NEXT_PUBLIC_API_URL || "https://jungga-pagoe-production.up.railway.app";
 const ADMIN_KEY = "jungga2026admin";
+const PAGE_SIZE = 50;
 
 function timeKST(iso: string) {
   if (!iso) return "-";
@@ -30,13 +31,14 @@ function DeviceBadge({ device }: { device: string }) {
 export default function VisitorsPage() {
   const [data, setData] = useState<any>(null);
   const [days, setDays] = useState(7);
+  const [page, setPage] = useState(1);
   const [loading, setLoading] = useState(true);
   const [tab, setTab] = useState<"summary" | "logs">("summary");
 
-  const load = async (d: number) => {
+  const load = async (d: number, p: number) => {
     setLoading(true);
     try {
-      const res = await fetch(`${API}/admin/visitors?days=${d}`, {
+      const res = await fetch(`${API}/admin/visitors?days=${d}&page=${p}&size=${PAGE_SIZE}`, {
         headers: { "X-Admin-Key": ADMIN_KEY },
       });
       setData(await res.json());
@@ -45,7 +47,7 @@ export default function VisitorsPage() {
     }
   };
 
-  useEffect(() => { load(days); }, [days]);
+  useEffect(() => { load(days, page); }, [days, page]);
 
   return (
     <div className="p-6 max-w-5xl">
@@ -59,7 +61,7 @@ export default function VisitorsPage() {
           {[1, 3, 7, 14, 30].map((d) => (
             <button
               key={d}
-              onClick={() => setDays(d)}
+              onClick={() => { setDays(d); setPage(1); }}
               className={`px-3 py-1.5 text-xs font-medium border transition-colors ${
                 days === d
                   ? "bg-gray-900 text-white border-gray-900"
@@ -82,8 +84,8 @@ export default function VisitorsPage() {
           <div className="grid grid-cols-3 gap-3 mb-6">
             {[
               { label: "고유 IP", value: data.total_ips },
-              { label: "총 딜 오픈", value: data.summary.reduce((s: number, r: any) => s + r.deal_opens, 0) },
-              { label: "총 구매 클릭", value: data.summary.reduce((s: number, r: any) => s + r.clicks, 0) },
+              { label: "총 딜 오픈", value: data.total_deal_opens },
+              { label: "총 구매 클릭", value: data.total_clicks },
             ].map(({ label, value }) => (
               <div key={label} className="border border-gray-200 p-4 bg-white">
                 <p className="text-xs text-gray-400 mb-1">{label}</p>
@@ -145,6 +147,27 @@ export default function VisitorsPage() {
                   데이터 없음 — IP 컬럼이 추가됐는지 확인하세요
                 </p>
               )}
+              {data.pages > 1 && (
+                <div className="flex items-center justify-between px-4 py-2.5 border-t border-gray-200 text-xs text-gray-500">
+                  <span>{data.matched_ips.toLocaleString()}개 IP · {page} / {data.pages} 페이지</span>
+                  <div className="flex gap-1">
+                    <button
+                      onClick={() => setPage(page - 1)}
+                      disabled={page <= 1}
+                      className="px-3 py-1 border border-gray-200 disabled:opacity-40 hover:border-gray-400"
+                    >
+                      이전
+                    </button>
+                    <button
+                      onClick={() => setPage(page + 1)}
+                      disabled={page >= data.pages}
+                      className="px-3 py-1 border border-gray-200 disabled:opacity-40 hover:border-gray-400"
+                    >
+                      다음
+                    </button>
+                  </div>
+                </div>
+              )}
             </div>
           )}
 